@@ -0,0 +1,115 @@
+"""게임별 룰 청크 인덱스(.faiss + .json)를 하나의 통합 인덱스로 합치는 빌드 스크립트
+
+통합 인덱스와 함께 mmap 로딩용 청크 텍스트 바이너리(.bin)도 생성합니다.
+(통합 청크는 --output에, 게임별 청크와 추천용 texts.json의 .bin은 서버가 원본 JSON 옆에서 찾으므로 원본 폴더에 저장)
+
+사용법:
+    python build_rule_store.py
+    python build_rule_store.py --source data/game_data/game_data --output data/rule_store
+    python build_rule_store.py --output /tmp/rule_store --no-sidecars   # 원본 폴더에는 쓰지 않음
+"""
+import argparse
+import json
+import os
+
+import faiss
+import numpy as np
+
+from services.index_registry import GAME_VECTOR_BASE_PATH
+from services.mmap_store import chunk_store_path, write_chunk_store
+from services.rule_store import (
+    RULE_STORE_CHUNKS_FILE,
+    RULE_STORE_DIR,
+    RULE_STORE_INDEX_FILE,
+    RULE_STORE_META_FILE,
+    RULE_STORE_VERSION,
+)
+
+RECOMMENDATION_TEXTS_PATH = "data/texts.json"
+
+
+def build_rule_store(source_dir, output_dir, sidecars=True):
+    game_names = sorted(
+        os.path.splitext(name)[0]
+        for name in os.listdir(source_dir)
+        if name.endswith(".faiss") and os.path.exists(os.path.join(source_dir, os.path.splitext(name)[0] + ".json"))
+    )
+    if not game_names:
+        raise SystemExit(f"❌ 인덱스 파일이 없습니다: {source_dir}")
+
+    vectors = []
+    chunks = []
+    games = {}
+    dim = None
+
+    for game_name in game_names:
+        index = faiss.read_index(os.path.join(source_dir, f"{game_name}.faiss"))
+        with open(os.path.join(source_dir, f"{game_name}.json"), "r", encoding="utf-8") as f:
+            game_chunks = json.load(f)
+
+        if dim is None:
+            dim = index.d
+        elif index.d != dim:
+            raise SystemExit(f"❌ 벡터 차원이 다릅니다: {game_name} ({index.d} != {dim})")
+
+        if index.ntotal != len(game_chunks):
+            print(f"⚠️ 벡터 수와 청크 수가 다릅니다 ({game_name}): {index.ntotal} / {len(game_chunks)}")
+        count = min(index.ntotal, len(game_chunks))
+
+        # 게임별 레지스트리용 청크 바이너리 (원본 JSON 옆에 저장)
+        if sidecars:
+            game_chunks_path = os.path.join(source_dir, f"{game_name}.json")
+            write_chunk_store(chunk_store_path(game_chunks_path), game_chunks)
+
+        start = len(chunks)
+        vectors.append(index.reconstruct_n(0, count))
+        chunks.extend(game_chunks[:count])
+        games[game_name] = [start, start + count]
+
+    matrix = np.ascontiguousarray(np.vstack(vectors).astype("float32"))
+
+    # 기존 게임별 인덱스와 동일하게 내적(정규화된 임베딩 기준 코사인) 사용
+    merged = faiss.IndexFlatIP(dim)
+    merged.add(matrix)
+
+    os.makedirs(output_dir, exist_ok=True)
+    faiss.write_index(merged, os.path.join(output_dir, RULE_STORE_INDEX_FILE))
+    write_chunk_store(os.path.join(output_dir, RULE_STORE_CHUNKS_FILE), chunks)
+    with open(os.path.join(output_dir, RULE_STORE_META_FILE), "w", encoding="utf-8") as f:
+        json.dump({
+            "version": RULE_STORE_VERSION,
+            "dim": dim,
+            "games": games,
+        }, f, ensure_ascii=False)
+
+    print(f"✅ 통합 룰 인덱스 생성 완료: {len(games)}개 게임, {len(chunks)}개 청크 -> {output_dir}")
+    if sidecars:
+        print(f"✅ 게임별 청크 바이너리 생성 완료: {len(game_names)}개 -> {source_dir}")
+
+
+def build_text_store(json_path):
+    """추천용 텍스트 JSON을 mmap 로딩용 바이너리로 변환"""
+    if not os.path.exists(json_path):
+        print(f"⚠️ 텍스트 파일이 없어 건너뜁니다: {json_path}")
+        return
+    with open(json_path, "r", encoding="utf-8") as f:
+        texts = json.load(f)
+    write_chunk_store(chunk_store_path(json_path), texts)
+    print(f"✅ 텍스트 바이너리 생성 완료: {len(texts)}개 -> {chunk_store_path(json_path)}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="게임별 룰 인덱스를 하나의 통합 인덱스로 병합")
+    parser.add_argument("--source", default=GAME_VECTOR_BASE_PATH, help="게임별 .faiss/.json 폴더")
+    parser.add_argument("--output", default=RULE_STORE_DIR, help="통합 인덱스 출력 폴더")
+    parser.add_argument("--texts", default=RECOMMENDATION_TEXTS_PATH, help="추천용 텍스트 JSON 경로")
+    parser.add_argument(
+        "--sidecars", action=argparse.BooleanOptionalAction, default=True,
+        help="mmap 로딩용 .bin 파일을 --output이 아니라 원본 위치에 생성 (--source 폴더의 <게임>.bin, --texts 옆의 .bin). "
+             "--no-sidecars면 --output에만 씀 (기본값: 생성)"
+    )
+    args = parser.parse_args()
+
+    build_rule_store(args.source, args.output, sidecars=args.sidecars)
+    if args.sidecars:
+        build_text_store(args.texts)
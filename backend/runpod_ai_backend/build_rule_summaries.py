@@ -0,0 +1,125 @@
+"""game.json의 모든 게임에 대해 룰 요약을 미리 생성하는 오프라인 스크립트
+
+룰 원문 해시가 바뀐 게임만 다시 생성합니다. (--force 사용 시 전체 재생성)
+
+사용법:
+    python build_rule_summaries.py                     # GPT-4o 요약 생성
+    python build_rule_summaries.py --source finetuning # 파인튜닝 모델 요약 생성
+    python build_rule_summaries.py --games 뱅 카탄 --force
+"""
+import argparse
+import json
+import os
+import time
+
+from services.rule_corpus import RuleCorpus
+from services.summary_store import RULE_SUMMARY_PATH, RULE_SUMMARY_VERSION, text_hash
+
+# 룰 요약 프롬프트 (전체 룰 텍스트를 {game_rule_text}로 받음)
+RULE_SUMMARY_SYSTEM_PROMPT = (
+    "너는 보드게임 룰 전문 AI야. 반드시 아래 규칙을 따라야 해:\n"
+    "- 사용자의 질문에 대해 아래 전체 룰 설명에 있는 내용만 기반해서 답변해.\n"
+    "- 룰 설명에 없는 정보는 절대로 지어내거나 상상하지 마.\n"
+    "- 사람 이름, 장소, 시간, 인원수 등을 추측하거나 새로 만들어내지 마.\n"
+    "- 룰 북을 물어보는게 아닌 전략을 물어보면 너는 룰북을 토대로 전략을 짜줘.\n"
+)
+RULE_SUMMARY_HUMAN_PROMPT = "게임 이름: {game_name}\n\n룰 전체:\n{game_rule_text}\n\n이 게임의 룰을 설명해주세요."
+
+
+def make_gpt_summarizer():
+    from dotenv import load_dotenv
+    from langchain_core.prompts import ChatPromptTemplate
+    from langchain_openai import ChatOpenAI
+
+    load_dotenv()
+    llm = ChatOpenAI(model_name="gpt-4o", temperature=0.7, openai_api_key=os.getenv("OPENAI_API_KEY"))
+    chain = ChatPromptTemplate.from_messages([
+        ("system", RULE_SUMMARY_SYSTEM_PROMPT),
+        ("human", RULE_SUMMARY_HUMAN_PROMPT),
+    ]) | llm
+
+    def summarize(game_name, game_rule_text):
+        response = chain.invoke({"game_name": game_name, "game_rule_text": game_rule_text})
+        return response.content.strip()
+
+    return "gpt-4o", summarize
+
+
+def make_finetuning_summarizer():
+    from services.finetuning_service import FINETUNING_MODEL_ID, FinetuningService
+
+    service = FinetuningService()
+    if not service.pipe:
+        raise SystemExit("❌ 파인튜닝 모델을 로드하지 못했습니다.")
+    return FINETUNING_MODEL_ID, service._generate_rule_summary
+
+
+def save(path, summaries):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"version": RULE_SUMMARY_VERSION, "summaries": summaries}, f, ensure_ascii=False, indent=1)
+    os.replace(tmp_path, path)
+
+
+def build_rule_summaries(source, output, games=None, force=False):
+    summaries = {}
+    if os.path.exists(output):
+        with open(output, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") == RULE_SUMMARY_VERSION:
+            summaries = data.get("summaries", {})
+
+    # 서비스와 같은 룰 원문 사용 (game2.json 덮어쓰기 포함)
+    corpus = RuleCorpus()
+    targets = games or corpus.names()
+    entries = summaries.setdefault(source, {})
+
+    todo = []
+    for name in targets:
+        text = corpus.get_text(name)
+        if not text:
+            print(f"⚠️ 룰 텍스트가 없어 건너뜁니다: {name}")
+            continue
+        if not force and entries.get(name, {}).get("source_hash") == text_hash(text):
+            continue
+        todo.append(name)
+
+    print(f"📚 {source} 요약 생성 대상: {len(todo)}개 (전체 {len(targets)}개)")
+    if not todo:
+        return
+
+    model_id, summarize = make_gpt_summarizer() if source == "gpt" else make_finetuning_summarizer()
+
+    for i, name in enumerate(todo, 1):
+        text = corpus.get_text(name)
+        try:
+            summary = summarize(name, text)
+        except Exception as e:
+            print(f"❌ 요약 생성 실패 ({name}): {str(e)}")
+            continue
+
+        entries[name] = {
+            "source_hash": text_hash(text),
+            "summary": summary,
+            "model": model_id,
+            "generated_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        }
+        print(f"✅ [{i}/{len(todo)}] {name}")
+
+        # 중간에 실패해도 생성한 요약은 남도록 주기적으로 저장
+        if i % 10 == 0:
+            save(output, summaries)
+
+    save(output, summaries)
+    print(f"🎉 요약 저장 완료: {output}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="게임별 룰 요약 사전 생성")
+    parser.add_argument("--source", choices=["gpt", "finetuning"], default="gpt", help="요약 생성 모델")
+    parser.add_argument("--output", default=RULE_SUMMARY_PATH, help="요약 파일 경로")
+    parser.add_argument("--games", nargs="*", help="생성할 게임 이름 (기본: 전체)")
+    parser.add_argument("--force", action="store_true", help="원문이 같아도 다시 생성")
+    args = parser.parse_args()
+
+    build_rule_summaries(args.source, args.output, args.games, args.force)
@@ -1,5 +1,6 @@
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 import uvicorn
 import os
@@ -7,9 +8,17 @@ import logging
 from typing import List, Optional
 
 # 서비스 import
-from services.embedding_service import EmbeddingService
+from services.embedding_service import get_embedding_service
 from services.finetuning_service import FinetuningService
-from services.rag_service import RAGService
+from services.rag_service import RAGService, recommendation_store, gpt_rule_store
+from services.history_policy import history_policy
+from services.rule_store import get_rule_index
+from services.summary_store import get_summary_store
+from services.rule_corpus import get_rule_corpus
+from services.executors import embedding_executor, generation_executor, shutdown_executors
+from services.streaming import SSE_HEADERS, sse_stream, stream_metrics
+from services.semantic_cache import SEMANTIC_CACHE_WARM_PATH, warm_semantic_caches
+from services.single_flight import get_single_flight_stats
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
@@ -47,6 +56,9 @@ class GameRuleSummaryRequest(BaseModel):
     session_id: str = ""
     chat_type: str = "gpt"
 
+class SessionCreateRequest(BaseModel):
+    session_type: str = "all"  # recommendation, gpt, finetuning, all
+
 class SessionCloseRequest(BaseModel):
     session_id: str
 
@@ -71,12 +83,15 @@ async def startup_event():
         # 서비스 초기화 (실제 모델 로드)
         global embedding_service, finetuning_service, rag_service
         
+        # 임베딩 서비스는 한 번만 로드해 RAG/파인튜닝 서비스가 공유
+        embedding_service = get_embedding_service()
+        
         # RAG 서비스는 필수 (게임 추천 및 룰 설명)
-        rag_service = RAGService()
+        rag_service = RAGService(embedding_service=embedding_service)
         
         # 파인튜닝 서비스는 선택사항 (모델 파일이 있을 때만)
         try:
-            finetuning_service = FinetuningService()
+            finetuning_service = FinetuningService(embedding_service=embedding_service)
             # 파인튜닝 서비스의 세션 정리 작업 시작
             try:
                 finetuning_service.start_session_cleanup()
@@ -86,15 +101,18 @@ async def startup_event():
             logger.warning(f"⚠️ 파인튜닝 서비스 로드 실패 (계속 진행): {str(e)}")
             finetuning_service = None
         
+        # 이전 QA 기록으로 의미 캐시 미리 채우기 (배포 직후 첫 요청부터 자주 묻는 질문 적중)
+        semantic_caches = {"gpt": rag_service.semantic_cache}
+        if finetuning_service:
+            semantic_caches["finetuning"] = finetuning_service.semantic_cache
+        warm_semantic_caches(semantic_caches, embedding_service, os.getenv("SEMANTIC_CACHE_WARM_PATH", SEMANTIC_CACHE_WARM_PATH))
+        
         # 세션 정리 작업 시작
         try:
             rag_service.start_session_cleanup()
         except AttributeError:
             logger.warning("⚠️ RAG 서비스에 세션 정리 기능이 없습니다. 계속 진행합니다.")
         
-        # 임베딩 서비스는 현재 RAG에 포함되어 있어 별도 로드하지 않음
-        # embedding_service = EmbeddingService()
-        
         services_initialized = True
         logger.info("✅ 모든 AI 서비스가 성공적으로 초기화되었습니다!")
         
@@ -102,15 +120,51 @@ async def startup_event():
         logger.error(f"❌ 서비스 초기화 실패: {str(e)}")
         services_initialized = False
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """서버 종료 시 캐시 저장 및 작업 풀 정리"""
+    if embedding_service:
+        embedding_service.query_cache.save()
+    shutdown_executors()
+
 @app.get("/health")
 async def health_check():
     """헬스체크 엔드포인트"""
     return {
         "status": "healthy" if services_initialized else "initializing",
         "services_loaded": services_initialized,
+        "answer_cache": finetuning_service.answer_cache.get_stats() if finetuning_service else None,
         "message": "보드게임 AI 백엔드가 정상 작동 중입니다!"
     }
 
+@app.get("/metrics")
+async def get_metrics():
+    """캐시 및 성능 지표 조회 API"""
+    return {
+        "rule_index": get_rule_index().get_stats(),
+        "rule_summaries": get_summary_store().get_stats(),
+        "rule_corpus": get_rule_corpus().get_stats(),
+        "sessions": {
+            "recommendation": recommendation_store.get_stats(),
+            "gpt_rule": gpt_rule_store.get_stats()
+        },
+        "history": history_policy.get_stats(),
+        "history_compaction": rag_service.history_compactor.get_stats() if rag_service else None,
+        "embedding": embedding_service.get_stats() if embedding_service else None,
+        "answer_cache": finetuning_service.answer_cache.get_stats() if finetuning_service else None,
+        "finetuning_generation": finetuning_service.generation_stats.get_stats() if finetuning_service else None,
+        "semantic_cache": {
+            "gpt": rag_service.semantic_cache.get_stats() if rag_service else None,
+            "finetuning": finetuning_service.semantic_cache.get_stats() if finetuning_service else None
+        },
+        "streaming": stream_metrics.get_stats(),
+        "single_flight": get_single_flight_stats(),
+        "executors": {
+            "embedding": embedding_executor.get_stats(),
+            "generation": generation_executor.get_stats()
+        }
+    }
+
 @app.post("/recommend", response_model=APIResponse)
 async def recommend_games(request: GameRecommendationRequest):
     """게임 추천 API"""
@@ -151,17 +205,20 @@ async def explain_rules(request: RuleQuestionRequest):
         
         logger.info(f"룰 질문: {request.game_name} - {request.question}, 세션: {session_id}")
         
-        # 서비스 호출
+        # 서비스 호출 (답변 전에 히스토리 여부 확인 - 파인튜닝은 히스토리 없음)
         if request.chat_type == "finetuning" and finetuning_service:
+            stateless = True
             result = await finetuning_service.answer_question(request.game_name, request.question, session_id)
         else:
+            stateless = rag_service.is_stateless(session_id)
             result = await rag_service.answer_rule_question(request.game_name, request.question, session_id)
         
         return APIResponse(
             status="success",
             data={
                 "answer": result,
-                "session_id": session_id
+                "session_id": session_id,
+                "stateless": stateless
             },
             message="룰 설명이 완료되었습니다."
         )
@@ -201,6 +258,58 @@ async def get_rule_summary(request: GameRuleSummaryRequest):
         logger.error(f"룰 요약 오류: {str(e)}")
         raise HTTPException(status_code=500, detail=f"룰 요약 중 오류가 발생했습니다: {str(e)}")
 
+@app.post("/recommend/stream")
+async def recommend_games_stream(request: GameRecommendationRequest):
+    """게임 추천 스트리밍 API (SSE)"""
+    if not services_initialized:
+        raise HTTPException(status_code=503, detail="서비스가 아직 초기화되지 않았습니다.")
+    
+    session_id = rag_service.get_or_create_session(request.session_id)
+    logger.info(f"게임 추천 스트리밍 요청: {request.query}, 세션: {session_id}")
+    
+    chunks = rag_service.astream_recommendation(request.query, session_id, request.top_k)
+    return StreamingResponse(sse_stream("recommend", session_id, chunks), media_type="text/event-stream", headers=SSE_HEADERS)
+
+@app.post("/explain-rules/stream")
+async def explain_rules_stream(request: RuleQuestionRequest):
+    """룰 설명 스트리밍 API (SSE)"""
+    if not services_initialized:
+        raise HTTPException(status_code=503, detail="서비스가 아직 초기화되지 않았습니다.")
+    
+    session_id = rag_service.get_or_create_session(request.session_id)
+    logger.info(f"룰 질문 스트리밍: {request.game_name} - {request.question}, 세션: {session_id}")
+    
+    # done 이벤트에 히스토리 없이 답변했는지 함께 전달 (프론트엔드 QA 기록 -> 의미 캐시 워밍 대상 구분)
+    if request.chat_type == "finetuning" and finetuning_service:
+        name = "explain_rules_finetuning"
+        stateless = True
+        chunks = finetuning_service.astream_answer(request.game_name, request.question, session_id)
+    else:
+        name = "explain_rules_gpt"
+        stateless = rag_service.is_stateless(session_id)
+        chunks = rag_service.astream_rule_answer(request.game_name, request.question, session_id)
+    return StreamingResponse(
+        sse_stream(name, session_id, chunks, done_data={"stateless": stateless}),
+        media_type="text/event-stream", headers=SSE_HEADERS
+    )
+
+@app.post("/rule-summary/stream")
+async def get_rule_summary_stream(request: GameRuleSummaryRequest):
+    """게임 룰 요약 스트리밍 API (SSE)"""
+    if not services_initialized:
+        raise HTTPException(status_code=503, detail="서비스가 아직 초기화되지 않았습니다.")
+    
+    session_id = rag_service.get_or_create_session(request.session_id)
+    logger.info(f"룰 요약 스트리밍 요청: {request.game_name}, 세션: {session_id}")
+    
+    if request.chat_type == "finetuning" and finetuning_service:
+        name = "rule_summary_finetuning"
+        chunks = finetuning_service.astream_rule_summary(request.game_name, session_id)
+    else:
+        name = "rule_summary_gpt"
+        chunks = rag_service.astream_rule_summary(request.game_name, session_id)
+    return StreamingResponse(sse_stream(name, session_id, chunks), media_type="text/event-stream", headers=SSE_HEADERS)
+
 @app.get("/games")
 async def get_available_games():
     """사용 가능한 게임 목록 API"""
@@ -218,14 +327,32 @@ async def get_available_games():
         logger.error(f"게임 목록 조회 오류: {str(e)}")
         raise HTTPException(status_code=500, detail=f"게임 목록 조회 중 오류가 발생했습니다: {str(e)}")
 
+@app.post("/session/create", response_model=APIResponse)
+async def create_session(request: SessionCreateRequest):
+    """세션 발급 API (페이지 로드 시 세션 ID만 생성, LLM 호출 없음)"""
+    if not services_initialized:
+        raise HTTPException(status_code=503, detail="서비스가 아직 초기화되지 않았습니다.")
+    
+    session_id = rag_service.create_session(request.session_type)
+    
+    return APIResponse(
+        status="success",
+        data={
+            "session_id": session_id,
+            "session_type": request.session_type
+        },
+        message="세션이 생성되었습니다."
+    )
+
 @app.post("/session/close", response_model=APIResponse)
 async def close_session(request: SessionCloseRequest):
     """세션 종료 API"""
     try:
         logger.info(f"세션 종료 요청: {request.session_id}")
         
-        # 모든 서비스의 세션 종료 (추천, GPT, 파인튜닝)
-        rag_success = rag_service.close_session(request.session_id, "all")  # 추천 + GPT 세션 모두 종료
+        # 모든 서비스의 세션 종료 (추천, GPT, 파인튜닝) - 저장소별 결과를 함께 반환
+        recommendation_success = rag_service.close_session(request.session_id, "recommendation")
+        gpt_success = rag_service.close_session(request.session_id, "gpt")
         
         # 파인튜닝 서비스 세션 종료 (있는 경우)
         finetuning_success = True
@@ -236,10 +363,15 @@ async def close_session(request: SessionCloseRequest):
                 logger.warning("⚠️ 파인튜닝 서비스에 세션 종료 기능이 없습니다.")
                 finetuning_success = True
         
-        success = rag_success or finetuning_success
+        success = recommendation_success or gpt_success or finetuning_success
         
         return APIResponse(
             status="success" if success else "warning",
+            data={
+                "recommendation": recommendation_success,
+                "gpt_rule": gpt_success,
+                "finetuning": finetuning_success
+            },
             message=f"세션 {request.session_id} 종료 완료" if success else f"세션 {request.session_id}를 찾을 수 없습니다."
         )
         
@@ -256,10 +388,15 @@ async def root():
         "status": "running",
         "endpoints": {
             "health": "/health",
+            "metrics": "/metrics",
             "recommend": "/recommend",
+            "recommend_stream": "/recommend/stream",
             "explain_rules": "/explain-rules",
+            "explain_rules_stream": "/explain-rules/stream",
             "rule_summary": "/rule-summary",
+            "rule_summary_stream": "/rule-summary/stream",
             "games": "/games",
+            "session_create": "/session/create",
             "session_close": "/session/close"
         }
     }
@@ -0,0 +1,143 @@
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# 파인튜닝 답변 캐시 (do_sample=False 생성 결과 재사용)
+ANSWER_CACHE_PATH = "data/answer_cache.sqlite3"
+ANSWER_CACHE_MAX_ENTRIES = 5000
+
+
+def answer_cache_key(model_id, prompt, params):
+    """모델 ID + 프롬프트(검색된 컨텍스트 포함) + 생성 파라미터 해시"""
+    payload = json.dumps({"model": model_id, "prompt": prompt, "params": params}, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class AnswerCache:
+    """결정적 생성 결과를 SQLite 파일에 저장하는 LRU 캐시 (여러 워커가 같은 파일 공유)
+
+    - 조회 시 last_used 갱신, 항목 수가 max_entries를 넘으면 오래 사용하지 않은 항목부터 삭제
+    - version(모델 ID + 룰 데이터 버전)이 저장된 값과 다르면 시작 시 전체 삭제
+    - path가 비어 있으면 비활성화 (항상 miss)
+    """
+
+    def __init__(self, path=ANSWER_CACHE_PATH, max_entries=ANSWER_CACHE_MAX_ENTRIES, version=""):
+        self.path = path
+        self.max_entries = max_entries
+        self.version = version
+        self._lock = threading.Lock()
+        self._conn = None
+
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+        self.invalidated = 0
+        self.errors = 0
+
+        if path:
+            self._open()
+
+    def _open(self):
+        try:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=5.0, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS answers ("
+                "key TEXT PRIMARY KEY, answer TEXT NOT NULL, created_at REAL NOT NULL, last_used REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS answers_last_used ON answers (last_used)")
+
+            row = conn.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+            if row is None or row[0] != self.version:
+                # 모델이나 룰 데이터가 바뀌면 이전 답변 전체 무효화
+                self.invalidated = conn.execute("DELETE FROM answers").rowcount
+                conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('version', ?)", (self.version,))
+                if row is not None:
+                    logger.info(f"🔄 답변 캐시 버전 변경, {self.invalidated}개 무효화")
+
+            self._conn = conn
+            count = conn.execute("SELECT COUNT(*) FROM answers").fetchone()[0]
+            logger.info(f"✅ 답변 캐시 로드: {count}개 ({self.path})")
+        except Exception as e:
+            logger.error(f"❌ 답변 캐시 열기 실패 (캐시 비활성화): {str(e)}")
+            self._conn = None
+
+    def get(self, key):
+        """캐시된 답변 반환 (없으면 None)"""
+        if self._conn is None:
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            try:
+                row = self._conn.execute("SELECT answer FROM answers WHERE key = ?", (key,)).fetchone()
+                if row is None:
+                    self.misses += 1
+                    return None
+                self._conn.execute("UPDATE answers SET last_used = ? WHERE key = ?", (time.time(), key))
+                self.hits += 1
+                return row[0]
+            except sqlite3.Error as e:
+                self.errors += 1
+                self.misses += 1
+                logger.warning(f"⚠️ 답변 캐시 조회 실패: {str(e)}")
+                return None
+
+    def put(self, key, answer):
+        """답변 저장 후 한도를 넘으면 LRU 삭제"""
+        if self._conn is None or not answer:
+            return
+        now = time.time()
+        with self._lock:
+            try:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO answers (key, answer, created_at, last_used) VALUES (?, ?, ?, ?)",
+                    (key, answer, now, now)
+                )
+                self.writes += 1
+                overflow = self._conn.execute("SELECT COUNT(*) FROM answers").fetchone()[0] - self.max_entries
+                if overflow > 0:
+                    self._conn.execute(
+                        "DELETE FROM answers WHERE key IN (SELECT key FROM answers ORDER BY last_used LIMIT ?)",
+                        (overflow,)
+                    )
+                    self.evictions += overflow
+            except sqlite3.Error as e:
+                self.errors += 1
+                logger.warning(f"⚠️ 답변 캐시 저장 실패: {str(e)}")
+
+    def get_stats(self):
+        with self._lock:
+            entries = 0
+            if self._conn is not None:
+                try:
+                    entries = self._conn.execute("SELECT COUNT(*) FROM answers").fetchone()[0]
+                except sqlite3.Error:
+                    pass
+            total = self.hits + self.misses
+            return {
+                "enabled": self._conn is not None,
+                "entries": entries,
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / total, 4) if total else 0.0,
+                "writes": self.writes,
+                "evictions": self.evictions,
+                "invalidated": self.invalidated,
+                "errors": self.errors,
+                "version": self.version[:12],
+                "path": self.path,
+            }
@@ -0,0 +1,82 @@
+import asyncio
+import logging
+import time
+
+from services.metrics import Histogram
+
+logger = logging.getLogger(__name__)
+
+
+class EmbeddingBatcher:
+    """동시에 들어온 쿼리 임베딩 요청을 짧은 시간 동안 모아 한 번에 인코딩하는 마이크로 배처
+
+    이벤트 루프 스레드에서만 사용하므로 별도 락 없이 대기 목록을 관리합니다.
+    """
+
+    def __init__(self, encode_fn, executor, max_batch_size=32, max_wait_ms=5.0):
+        self.encode_fn = encode_fn
+        self.executor = executor
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+
+        self._pending = []  # (텍스트, future, 대기 시작 시각)
+        self._flush_handle = None
+        self._tasks = set()  # 실행 중인 배치 태스크 (이벤트 루프는 태스크를 약한 참조로만 보관)
+
+        self.batch_size_histogram = Histogram([1, 2, 4, 8, 16, 32, 64])
+        self.wait_ms_histogram = Histogram([1, 2, 5, 10, 20, 50, 100])
+
+    async def encode(self, text):
+        """텍스트 하나를 임베딩 (다른 요청과 같은 배치로 묶일 수 있음), shape (1, dim) 반환"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((text, future, time.perf_counter()))
+
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.max_wait, self._flush)
+
+        return await future
+
+    def _flush(self):
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if not self._pending:
+            return
+
+        batch, self._pending = self._pending, []
+        task = asyncio.ensure_future(self._run_batch(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run_batch(self, batch):
+        now = time.perf_counter()
+        self.batch_size_histogram.observe(len(batch))
+        for _, _, enqueued_at in batch:
+            self.wait_ms_histogram.observe((now - enqueued_at) * 1000)
+
+        texts = [text for text, _, _ in batch]
+        try:
+            vectors = await self.executor.run(self.encode_fn, texts)
+        except Exception as e:
+            logger.error(f"❌ 배치 임베딩 실패 ({len(texts)}개): {str(e)}")
+            for _, future, _ in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for i, (_, future, _) in enumerate(batch):
+            # 요청이 취소된 경우 결과를 버림
+            if not future.done():
+                future.set_result(vectors[i:i + 1])
+
+    def get_stats(self):
+        return {
+            "max_batch_size": self.max_batch_size,
+            "max_wait_ms": self.max_wait * 1000,
+            "pending": len(self._pending),
+            "batch_size": self.batch_size_histogram.snapshot(),
+            "wait_ms": self.wait_ms_histogram.snapshot(),
+        }
@@ -0,0 +1,109 @@
+import logging
+import os
+import re
+import threading
+import unicodedata
+from collections import OrderedDict
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+_PUNCTUATION_RE = re.compile(r"[^\w\s]")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_query(text):
+    """캐시 키용 질문 정규화 (유니코드 정규화, 소문자, 문장부호 제거, 공백 정리)"""
+    text = unicodedata.normalize("NFKC", text).lower()
+    text = _PUNCTUATION_RE.sub(" ", text)
+    return _WHITESPACE_RE.sub(" ", text).strip()
+
+
+class QueryEmbeddingCache:
+    """정규화된 질문 텍스트 -> 임베딩 벡터 LRU 캐시 (선택적으로 디스크에 저장)"""
+
+    def __init__(self, max_entries=10000, persist_path=None):
+        self.max_entries = max_entries
+        self.persist_path = persist_path
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        if persist_path:
+            self.load()
+
+    def get(self, text):
+        key = normalize_query(text)
+        with self._lock:
+            vector = self._entries.get(key)
+            if vector is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return vector
+
+    def put(self, text, vector):
+        key = normalize_query(text)
+        vector = np.asarray(vector, dtype="float32").reshape(1, -1)
+        vector.setflags(write=False)
+        with self._lock:
+            self._entries[key] = vector
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def load(self):
+        """디스크에 저장된 캐시 로드"""
+        if not self.persist_path or not os.path.exists(self.persist_path):
+            return
+        try:
+            with np.load(self.persist_path, allow_pickle=False) as data:
+                keys = data["keys"]
+                vectors = data["vectors"]
+            with self._lock:
+                for key, vector in zip(keys[-self.max_entries:], vectors[-self.max_entries:]):
+                    row = vector.reshape(1, -1)
+                    row.setflags(write=False)
+                    self._entries[str(key)] = row
+            logger.info(f"✅ 쿼리 임베딩 캐시 로드: {len(self._entries)}개")
+        except Exception as e:
+            logger.warning(f"⚠️ 쿼리 임베딩 캐시 로드 실패: {str(e)}")
+
+    def save(self):
+        """캐시를 디스크에 저장 (오래된 항목부터 순서 유지)"""
+        if not self.persist_path:
+            return
+        with self._lock:
+            if not self._entries:
+                return
+            keys = np.array(list(self._entries.keys()))
+            vectors = np.vstack(list(self._entries.values()))
+        try:
+            directory = os.path.dirname(self.persist_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            tmp_path = f"{self.persist_path}.tmp.npz"
+            np.savez(tmp_path, keys=keys, vectors=vectors)
+            os.replace(tmp_path, self.persist_path)
+            logger.info(f"💾 쿼리 임베딩 캐시 저장: {len(keys)}개 -> {self.persist_path}")
+        except Exception as e:
+            logger.error(f"❌ 쿼리 임베딩 캐시 저장 실패: {str(e)}")
+
+    def get_stats(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / total, 4) if total else 0.0,
+                "evictions": self.evictions,
+                "persist_path": self.persist_path,
+            }
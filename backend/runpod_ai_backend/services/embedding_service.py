@@ -1,40 +1,129 @@
 import logging
+import os
+import threading
+import time
+
+import torch
 from sentence_transformers import SentenceTransformer
 
+from services.embedding_batcher import EmbeddingBatcher
+from services.embedding_cache import QueryEmbeddingCache, normalize_query
+from services.executors import embedding_executor
+from services.single_flight import SingleFlight
+
 logger = logging.getLogger(__name__)
 
+EMBEDDING_MODEL_NAME = "BAAI/bge-m3"
+
+
 class EmbeddingService:
-    """임베딩 모델 서비스 (현재는 RAGService에 포함되어 있어 별도 사용하지 않음)"""
-    
-    def __init__(self):
+    """임베딩 모델 서비스 (RAG/파인튜닝 서비스가 하나의 인스턴스를 공유)"""
+
+    def __init__(self, model_name=EMBEDDING_MODEL_NAME, device=None):
         logger.info("🔧 임베딩 서비스를 초기화합니다...")
-        
+
+        self.model_name = model_name
+        self.device = device or ("cuda" if torch.cuda.is_available() else "cpu")
+
+        # 통계
+        self._stats_lock = threading.Lock()
+        self.encode_calls = 0
+        self.encoded_texts = 0
+        self.encode_seconds = 0.0
+        self.encode_failures = 0
+
         try:
             # 임베딩 모델 로드
-            self.model = SentenceTransformer("BAAI/bge-m3", device="cuda")
-            logger.info("✅ 임베딩 모델 로드 완료")
-            
+            start = time.perf_counter()
+            self.model = SentenceTransformer(model_name, device=self.device)
+            self.load_seconds = time.perf_counter() - start
+            logger.info(f"✅ 임베딩 모델 로드 완료 ({self.device}, {self.load_seconds:.1f}초)")
+
         except Exception as e:
             logger.error(f"❌ 임베딩 모델 로드 실패: {str(e)}")
             self.model = None
-    
+            self.load_seconds = None
+
+        # 동시 쿼리 임베딩을 모아 한 번에 인코딩하는 마이크로 배처
+        self.batcher = EmbeddingBatcher(
+            self.encode,
+            embedding_executor,
+            max_batch_size=int(os.getenv("EMBEDDING_BATCH_MAX_SIZE", "32")),
+            max_wait_ms=float(os.getenv("EMBEDDING_BATCH_MAX_WAIT_MS", "5")),
+        )
+
+        # 반복 질문 재임베딩 방지용 쿼리 임베딩 캐시
+        self.query_cache = QueryEmbeddingCache(
+            max_entries=int(os.getenv("EMBEDDING_CACHE_SIZE", "10000")),
+            persist_path=os.getenv("EMBEDDING_CACHE_PATH") or None,
+        )
+
+        # 캐시에 없는 같은 질문이 동시에 들어오면 한 번만 인코딩
+        self.query_flight = SingleFlight("query_embedding")
+
     def encode(self, texts, normalize=True):
         """텍스트를 임베딩으로 변환"""
+        if not self.model:
+            raise Exception("임베딩 모델이 로드되지 않았습니다.")
+
+        start = time.perf_counter()
         try:
-            if not self.model:
-                raise Exception("임베딩 모델이 로드되지 않았습니다.")
-            
             embeddings = self.model.encode(texts, normalize_embeddings=normalize)
-            return embeddings
-            
         except Exception as e:
+            with self._stats_lock:
+                self.encode_failures += 1
             logger.error(f"❌ 임베딩 생성 실패: {str(e)}")
-            return None
-    
+            raise
+
+        elapsed = time.perf_counter() - start
+        with self._stats_lock:
+            self.encode_calls += 1
+            self.encoded_texts += len(texts)
+            self.encode_seconds += elapsed
+        return embeddings
+
+    async def aencode_query(self, text):
+        """쿼리 하나를 비동기로 임베딩 (캐시 조회 후 마이크로 배칭, 임베딩 풀에서 실행), shape (1, dim) 반환"""
+        cached = self.query_cache.get(text)
+        if cached is not None:
+            return cached
+        return await self.query_flight.run(normalize_query(text), self._aencode_and_cache, text)
+
+    async def _aencode_and_cache(self, text):
+        vector = await self.batcher.encode(text)
+        self.query_cache.put(text, vector)
+        return vector
+
+    def get_stats(self):
+        """임베딩 호출 통계 반환"""
+        with self._stats_lock:
+            return {
+                "encode_calls": self.encode_calls,
+                "encoded_texts": self.encoded_texts,
+                "encode_failures": self.encode_failures,
+                "avg_encode_ms": round(self.encode_seconds / self.encode_calls * 1000, 2) if self.encode_calls else 0.0,
+                "load_seconds": round(self.load_seconds, 2) if self.load_seconds is not None else None,
+                "batching": self.batcher.get_stats(),
+                "query_cache": self.query_cache.get_stats(),
+            }
+
     def get_model_info(self):
         """모델 정보 반환"""
         return {
             "model_loaded": self.model is not None,
-            "model_name": "BAAI/bge-m3",
-            "device": "cuda" if self.model and hasattr(self.model, 'device') else "unknown"
+            "model_name": self.model_name,
+            "device": self.device
         }
+
+
+_embedding_service = None
+_embedding_service_lock = threading.Lock()
+
+
+def get_embedding_service():
+    """프로세스 전역 임베딩 서비스 반환 (모델은 최초 호출 시 한 번만 로드)"""
+    global _embedding_service
+    with _embedding_service_lock:
+        if _embedding_service is None:
+            _embedding_service = EmbeddingService()
+        return _embedding_service
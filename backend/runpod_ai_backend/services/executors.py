@@ -0,0 +1,106 @@
+import asyncio
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+
+class ExecutorBusyError(Exception):
+    """실행 풀 대기열이 가득 찬 경우"""
+
+
+class BoundedExecutor:
+    """이벤트 루프 밖에서 CPU/GPU 작업을 실행하는 크기 제한 스레드 풀"""
+
+    def __init__(self, name, max_workers, max_queue):
+        self.name = name
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=f"{name}-pool")
+        self._lock = threading.Lock()
+
+        # 통계
+        self._queued = 0
+        self._running = 0
+        self.peak_queue_depth = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self.wait_seconds = 0.0
+        self.run_seconds = 0.0
+
+    async def run(self, fn, *args, **kwargs):
+        """함수를 풀에서 실행하고 결과를 기다림 (대기열이 가득 차면 ExecutorBusyError)"""
+        with self._lock:
+            if self._queued + self._running >= self.max_workers + self.max_queue:
+                self.rejected += 1
+                raise ExecutorBusyError(f"{self.name} 작업 대기열이 가득 찼습니다. 잠시 후 다시 시도해주세요.")
+            self._queued += 1
+            self.peak_queue_depth = max(self.peak_queue_depth, self._queued)
+        submitted = time.perf_counter()
+
+        def task():
+            started = time.perf_counter()
+            with self._lock:
+                self._queued -= 1
+                self._running += 1
+                self.wait_seconds += started - submitted
+            try:
+                result = fn(*args, **kwargs)
+            except Exception:
+                with self._lock:
+                    self.failed += 1
+                raise
+            finally:
+                with self._lock:
+                    self._running -= 1
+                    self.run_seconds += time.perf_counter() - started
+            with self._lock:
+                self.completed += 1
+            return result
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, task)
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False)
+
+    def get_stats(self):
+        """풀 상태 및 대기열 지표 반환"""
+        with self._lock:
+            finished = self.completed + self.failed
+            return {
+                "max_workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "queue_depth": self._queued,
+                "running": self._running,
+                "peak_queue_depth": self.peak_queue_depth,
+                "completed": self.completed,
+                "failed": self.failed,
+                "rejected": self.rejected,
+                "avg_wait_ms": round(self.wait_seconds / finished * 1000, 2) if finished else 0.0,
+                "avg_run_ms": round(self.run_seconds / finished * 1000, 2) if finished else 0.0,
+            }
+
+
+# 임베딩 + FAISS 검색용 풀
+embedding_executor = BoundedExecutor(
+    "embedding",
+    max_workers=int(os.getenv("EMBEDDING_POOL_SIZE", "2")),
+    max_queue=int(os.getenv("EMBEDDING_QUEUE_SIZE", "64")),
+)
+
+# HuggingFace 텍스트 생성용 풀 (GPU 모델 하나를 공유하므로 기본 1개)
+generation_executor = BoundedExecutor(
+    "generation",
+    max_workers=int(os.getenv("GENERATION_POOL_SIZE", "1")),
+    max_queue=int(os.getenv("GENERATION_QUEUE_SIZE", "16")),
+)
+
+
+def shutdown_executors():
+    embedding_executor.shutdown()
+    generation_executor.shutdown()
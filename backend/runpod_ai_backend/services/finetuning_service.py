@@ -1,22 +1,35 @@
 import os
+import asyncio
+import contextlib
 import torch
 import logging
+import time
 import uuid
-import json
-import faiss
-import numpy as np
-from transformers import AutoTokenizer, AutoModelForCausalLM, pipeline
-from sentence_transformers import SentenceTransformer
+from transformers import AutoTokenizer, AutoModelForCausalLM, StoppingCriteriaList, TextIteratorStreamer, pipeline
 from dotenv import load_dotenv
 from typing import Dict, Any
 
+from services.answer_cache import ANSWER_CACHE_MAX_ENTRIES, ANSWER_CACHE_PATH, AnswerCache, answer_cache_key
+from services.embedding_service import get_embedding_service
+from services.executors import embedding_executor, generation_executor
+from services.generation_stop import TURN_MARKERS, GenerationStats, TurnMarkerStoppingCriteria, cut_at_turn_marker
+from services.rule_store import get_rule_index
+from services.summary_store import get_summary_store
+from services.rule_corpus import get_rule_corpus
+from services.semantic_cache import create_semantic_cache
+from services.single_flight import SingleFlight
+
 logger = logging.getLogger(__name__)
 load_dotenv(dotenv_path=os.path.join(os.path.dirname(__file__), '..', '.env'))
 
+# 파인튜닝 모델 및 생성 파라미터 (샘플링 비활성화 - 같은 프롬프트면 같은 답변)
+FINETUNING_MODEL_ID = "minjeongHuggingFace/exaone-bang-merged"
+GENERATION_PARAMS = {"max_new_tokens": 256, "do_sample": False}
+
 class FinetuningService:
     """파인튜닝된 모델을 사용한 RAG 기반 질문-답변 서비스 (모든 게임 지원)"""
     
-    def __init__(self):
+    def __init__(self, embedding_service=None):
         logger.info("🔧 파인튜닝 서비스를 초기화합니다...")
         
         self.device = "cuda" if torch.cuda.is_available() else "cpu"
@@ -25,23 +38,42 @@ class FinetuningService:
         # 시스템 메시지 (고정)
         self.system_msg = "당신은 보드게임 룰 전문가 AI입니다. 사용자의 질문에 상황에 맞게 정확하고 간결하게 답변해주세요."
         
-        # 임베딩 모델 로드 (RAG용)
-        self.embed_model = SentenceTransformer("BAAI/bge-m3", device=self.device)
-        logger.info("✅ 임베딩 모델 로드 완료")
+        # 임베딩 서비스 (RAG 서비스와 공유)
+        self.embedding_service = embedding_service or get_embedding_service()
         
         # RAG 데이터 로드
         self._load_rag_data()
         
+        # 미리 생성한 룰 요약 (build_rule_summaries.py)
+        self.summary_store = get_summary_store()
+        
+        # 생성 종료 사유/아낀 토큰 수 통계
+        self.generation_stats = GenerationStats(GENERATION_PARAMS["max_new_tokens"])
+        
         # 모델 로드
         self._load_model()
         
+        # 답변 캐시 (모델 ID 또는 룰 데이터가 바뀌면 무효화)
+        self.answer_cache = AnswerCache(
+            path=os.getenv("ANSWER_CACHE_PATH", ANSWER_CACHE_PATH),
+            max_entries=int(os.getenv("ANSWER_CACHE_MAX_ENTRIES", ANSWER_CACHE_MAX_ENTRIES)),
+            version=answer_cache_key(FINETUNING_MODEL_ID, self.rule_corpus.version, {**GENERATION_PARAMS, "stop_markers": TURN_MARKERS})
+        )
+        
+        # 비슷한 질문의 답변 재사용 (질문 임베딩 유사도 기준, 게임별)
+        self.semantic_cache = create_semantic_cache("finetuning")
+        
+        # 같은 프롬프트/게임의 동시 생성 요청 합침 (샘플링 없는 생성이라 결과가 같음)
+        self.answer_flight = SingleFlight("finetuning_answer")
+        self.summary_flight = SingleFlight("finetuning_rule_summary")
+        
         logger.info("✅ 파인튜닝 서비스 초기화 완료")
     
     def _load_model(self):
         """파인튜닝된 모델 로드"""
         try:
             # 모델 ID
-            model_id = "minjeongHuggingFace/exaone-bang-merged"
+            model_id = FINETUNING_MODEL_ID
             logger.info(f"📥 모델 로드 중: {model_id}")
             
             # 모델 및 토크나이저 로드
@@ -58,8 +90,7 @@ class FinetuningService:
                 task="text-generation",
                 model=self.model,
                 tokenizer=self.tokenizer,
-                max_new_tokens=256,
-                do_sample=False
+                **GENERATION_PARAMS
             )
             
             logger.info("✅ 모델 로드 완료")
@@ -73,43 +104,27 @@ class FinetuningService:
     def _load_rag_data(self):
         """RAG용 데이터 로드 (모든 게임 지원)"""
         try:
-            # 게임별 벡터 인덱스 경로 (개별 게임 룰 청크를 위한 폴더)
-            self.game_vector_base_path = "data/game_data/game_data"
+            # 게임 전체 룰 데이터 (게임 이름 인덱스, game2.json 덮어쓰기 포함, 프로세스 전역 공유)
+            self.rule_corpus = get_rule_corpus()
             
-            # 게임 전체 룰 데이터
-            game_data_path = "data/game.json" # 모든 게임의 상세 룰이 담긴 파일
-            if os.path.exists(game_data_path):
-                with open(game_data_path, "r", encoding="utf-8") as f:
-                    self.game_data = json.load(f)
-                logger.info("✅ 게임 룰 데이터 로드 완료")
-            else:
-                logger.warning("⚠️ 게임 룰 파일이 없습니다. 'game.json' 경로를 확인하세요.")
-                self.game_data = []
+            # 룰 청크 인덱스 (통합 인덱스 또는 게임별 레지스트리, 프로세스 전역 공유)
+            self.rule_index = get_rule_index()
                 
         except Exception as e:
             logger.error(f"❌ RAG 데이터 로드 실패: {str(e)}")
-            self.game_data = []
     
-    def _search_game_context(self, game_name: str, question: str, top_k: int = 3) -> str:
-        """게임별 질문에 대한 관련 룰 컨텍스트 검색 (RAG 서비스와 동일한 로직)"""
+    async def _search_game_context(self, game_name: str, question: str, top_k: int = 3, q_vec=None) -> str:
+        """게임별 질문에 대한 관련 룰 컨텍스트 검색 (RAG 서비스와 동일한 로직, 이미 구한 q_vec가 있으면 재사용)"""
         try:
-            # 게임별 벡터 인덱스 로드
-            game_index_path = os.path.join(self.game_vector_base_path, f"{game_name}.faiss")
-            game_chunks_path = os.path.join(self.game_vector_base_path, f"{game_name}.json")
-            
-            if not os.path.exists(game_index_path) or not os.path.exists(game_chunks_path):
+            # 게임 룰 인덱스 확인
+            if not self.rule_index.has_game(game_name):
                 logger.warning(f"'{game_name}' 게임의 RAG 데이터를 찾을 수 없습니다.")
                 return ""
             
-            # 벡터 인덱스 및 청크 텍스트 로딩
-            index = faiss.read_index(game_index_path)
-            with open(game_chunks_path, "r", encoding="utf-8") as f:
-                chunks = json.load(f)
-            
             # RAG 검색: 룰 질문에 대한 유사 청크 검색
-            q_vec = self.embed_model.encode([question], normalize_embeddings=True)
-            D, I = index.search(np.array(q_vec), k=top_k)
-            retrieved_chunks = [chunks[i] for i in I[0] if i < len(chunks)]
+            if q_vec is None:
+                q_vec = await self.embedding_service.aencode_query(question)
+            retrieved_chunks = await embedding_executor.run(self.rule_index.search, game_name, q_vec, top_k) or []
             
             context = "\n\n".join(retrieved_chunks)
             logger.info(f"🔍 RAG 검색 완료 ({game_name}): {len(retrieved_chunks)}개 청크, 총 길이 {len(context)} 글자")
@@ -122,22 +137,49 @@ class FinetuningService:
     
     def _get_game_rule_text(self, game_name: str) -> str:
         """게임 룰 텍스트 가져오기 (전체 룰용)"""
-        try:
-            game_data_path = "data/game.json"
-            if not os.path.exists(game_data_path):
-                return ''
-            
-            with open(game_data_path, "r", encoding="utf-8") as f:
-                game_data = json.load(f)
-            
-            for game in game_data:
-                if game.get("game_name") == game_name:
-                    return game.get('text', '')
-            
-            return ''
-        except Exception as e:
-            logger.error(f"게임 룰 파일 로드 실패: {str(e)}")
-            return ''
+        return self.rule_corpus.get_text(game_name)
+    
+    def _build_answer_prompt(self, query: str, context: str = "") -> str:
+        """질문 답변 프롬프트 구성 (RAG 컨텍스트 포함)"""
+        # RAG 컨텍스트가 있으면 시스템 메시지에 포함
+        if context:
+            enhanced_system_msg = (
+                "너는 보드게임 룰 전문 AI야. 반드시 아래 규칙을 따라야 해:\n"
+                "- 아래 룰 설명에 있는 내용만 기반해서 정확하게 답변해.\n"
+                "- 룰 설명에 없는 정보는 절대로 지어내거나 상상하지 마.\n"
+                "- 전략 질문이면 룰북을 토대로 구체적인 전략을 제시해.\n\n"
+                f"다음은 관련 룰 정보입니다:\n{context}\n\n"
+                "위 룰 정보를 바탕으로 정확하고 구체적으로 답변해줘."
+            )
+        else:
+            enhanced_system_msg = self.system_msg
+        
+        # 시스템 + 사용자 프롬프트 명시적으로 구성
+        return f"[|system|]{enhanced_system_msg}\n[|user|]{query}\n[|assistant|]"
+    
+    def _run_pipeline(self, prompt: str) -> str:
+        """Pipeline 생성 (턴 마커/EOS에서 중단, 프롬프트 없이 새로 생성된 텍스트만 받아 첫 마커 앞까지 반환)"""
+        criteria = TurnMarkerStoppingCriteria(self.tokenizer)
+        response = self.pipe(
+            prompt,
+            return_full_text=False,
+            stopping_criteria=StoppingCriteriaList([criteria]),
+            **GENERATION_PARAMS
+        )
+        self.generation_stats.record(criteria)
+        
+        generated_text = response[0]['generated_text'] if response else ""
+        return cut_at_turn_marker(generated_text)
+    
+    def _answer_cache_key(self, prompt: str) -> str:
+        return answer_cache_key(FINETUNING_MODEL_ID, prompt, GENERATION_PARAMS)
+    
+    def _generate_answer(self, prompt: str) -> str:
+        """프롬프트로 답변 생성 (실패 시 예외), 생성된 답변은 답변 캐시에 저장"""
+        content = self._run_pipeline(prompt)
+        if content:
+            self.answer_cache.put(self._answer_cache_key(prompt), content)
+        return content
     
     def _generate_response(self, query: str, context: str = "") -> str:
         """모델을 사용하여 응답 생성 (RAG 컨텍스트 포함)"""
@@ -145,44 +187,62 @@ class FinetuningService:
             if not self.pipe:
                 return "모델이 로드되지 않았습니다."
             
-            # RAG 컨텍스트가 있으면 시스템 메시지에 포함
-            if context:
-                enhanced_system_msg = (
-                    "너는 보드게임 룰 전문 AI야. 반드시 아래 규칙을 따라야 해:\n"
-                    "- 아래 룰 설명에 있는 내용만 기반해서 정확하게 답변해.\n"
-                    "- 룰 설명에 없는 정보는 절대로 지어내거나 상상하지 마.\n"
-                    "- 전략 질문이면 룰북을 토대로 구체적인 전략을 제시해.\n\n"
-                    f"다음은 관련 룰 정보입니다:\n{context}\n\n"
-                    "위 룰 정보를 바탕으로 정확하고 구체적으로 답변해줘."
-                )
-            else:
-                enhanced_system_msg = self.system_msg
-            
-            # 시스템 + 사용자 프롬프트 명시적으로 구성
-            prompt = f"[|system|]{enhanced_system_msg}\n[|user|]{query}\n[|assistant|]"
-            
-            # HuggingFace Pipeline 사용
-            response = self.pipe(prompt, max_new_tokens=256, do_sample=False)
-            
-            # Pipeline 결과에서 텍스트 추출
-            generated_text = response[0]['generated_text'] if response else ""
-            
-            # 원본 프롬프트 제거하고 생성된 부분만 추출
-            if prompt in generated_text:
-                content = generated_text.replace(prompt, "").strip()
-            else:
-                content = generated_text
-            
-            # 불필요한 토큰 제거
-            for marker in ["[|assistant|]", "[|user|]", "[|system|]"]:
-                content = content.split(marker)[-1].strip()
-            
+            content = self._generate_answer(self._build_answer_prompt(query, context))
             return content if content else "죄송합니다. 답변을 생성할 수 없습니다."
             
         except Exception as e:
             logger.error(f"❌ 응답 생성 실패: {str(e)}")
             return f"응답 생성 중 오류가 발생했습니다: {str(e)}"
     
+    async def _astream_generate(self, prompt: str):
+        """TextIteratorStreamer로 생성 중인 텍스트를 조각 단위로 반환 (생성은 생성 풀에서 실행)"""
+        if not self.model or not self.tokenizer:
+            yield "모델이 로드되지 않았습니다."
+            return
+        
+        streamer = TextIteratorStreamer(self.tokenizer, skip_prompt=True, skip_special_tokens=True)
+        # 턴 마커가 나오면 GPU 생성 자체를 멈춤 (특수 토큰 마커는 스트리머 텍스트에서 빠지므로 토큰 단위로 확인)
+        criteria = TurnMarkerStoppingCriteria(self.tokenizer)
+        inputs = self.tokenizer(prompt, return_tensors="pt").to(self.model.device)
+        generation = asyncio.ensure_future(generation_executor.run(
+            self.model.generate, **inputs, streamer=streamer,
+            stopping_criteria=StoppingCriteriaList([criteria]), **GENERATION_PARAMS
+        ))
+        # 생성이 실패하거나 풀이 가득 차도 스트리머 대기가 끝나도록 종료 신호 전달
+        generation.add_done_callback(lambda future: streamer.end() if future.cancelled() or future.exception() else None)
+        generation.add_done_callback(lambda future: self.generation_stats.record(criteria) if not future.cancelled() and not future.exception() else None)
+        
+        generated = ""
+        iterator = iter(streamer)
+        finished = False
+        try:
+            while True:
+                text = await asyncio.to_thread(next, iterator, None)
+                if text is None:
+                    break
+                previous_length = len(generated)
+                generated += text
+                
+                # 다음 턴 마커가 나오면 마커 앞까지만 보내고 중단 (생성도 같은 마커에서 멈추므로 아래에서 종료 대기)
+                marker_positions = [generated.find(m) for m in TURN_MARKERS if m in generated]
+                if marker_positions:
+                    tail = generated[previous_length:min(marker_positions)]
+                    if tail:
+                        yield tail
+                    break
+                yield text
+            finished = True
+        finally:
+            if not finished:
+                # 클라이언트 연결 종료 등으로 중간에 닫히면 GPU 생성을 멈추고 생성 풀이 비워질 때까지 대기
+                # (generate가 끝나며 스트리머도 종료되어 next를 기다리던 스레드가 풀림)
+                criteria.cancel()
+                with contextlib.suppress(Exception):
+                    await generation
+        
+        # 정상 종료와 마커 종료 모두 생성 완료를 기다리고 생성 중 오류를 그대로 전달
+        await generation
+    
     def get_or_create_session(self, session_id: str) -> str:
         """세션 ID 처리 (단순히 새 ID 생성용)"""
         if not session_id or session_id.strip() == "":
@@ -191,6 +251,15 @@ class FinetuningService:
             return new_session_id
         return session_id
     
+    async def _lookup_semantic_cache(self, game_name: str, question: str):
+        """의미 캐시 조회 - (질문 벡터, 캐시 답변) 반환, 임베딩 실패 시 (None, None)"""
+        try:
+            q_vec = await self.embedding_service.aencode_query(question)
+        except Exception as e:
+            logger.warning(f"⚠️ 의미 캐시 조회 생략 (임베딩 실패): {str(e)}")
+            return None, None
+        return q_vec, self.semantic_cache.lookup(game_name, question, q_vec)
+    
     async def answer_question(self, game_name: str, question: str, session_id: str = ""):
         """질문 답변 (RAG 검색 후 파인튜닝 모델로 답변 - RAG 서비스와 동일한 로직)"""
         try:
@@ -199,19 +268,42 @@ class FinetuningService:
             
             logger.info(f"🤖 질문 답변 (RAG): {game_name} - {question[:50]}...")
             
-            # 1. RAG 검색: 게임별 룰 질문에 대한 유사 청크 검색
-            context = self._search_game_context(game_name, question, top_k=4)
+            # 1. 비슷한 질문의 답변이 있으면 검색/생성 없이 반환
+            q_vec, cached = await self._lookup_semantic_cache(game_name, question)
+            if cached is not None:
+                logger.info("✅ 질문 답변 완료 (의미 캐시)")
+                return cached
+            start = time.perf_counter()
+            
+            # 2. RAG 검색: 게임별 룰 질문에 대한 유사 청크 검색
+            context = await self._search_game_context(game_name, question, top_k=4, q_vec=q_vec)
             
             # RAG 검색 실패 시 전체 룰을 기반으로 재시도
             if not context or context.strip() == "":
                 logger.info(f"RAG 검색 실패. 전체 룰을 기반으로 재시도: {game_name}")
                 return await self.get_rule_summary_answer(game_name, question, session_id)
             
-            # 2. 파인튜닝 모델로 응답 생성 (RAG 컨텍스트 포함)
-            response = self._generate_response(question, context)
+            # 3. 같은 프롬프트로 생성한 답변이 있으면 모델 호출 없이 반환
+            prompt = self._build_answer_prompt(question, context)
+            # SQLite 조회(last_used 갱신 포함)는 이벤트 루프를 막지 않도록 스레드에서 실행
+            response = await asyncio.to_thread(self.answer_cache.get, self._answer_cache_key(prompt))
+            if response is not None:
+                logger.info("✅ 질문 답변 완료 (답변 캐시)")
+                return response
             
+            # 4. 파인튜닝 모델로 응답 생성 (RAG 컨텍스트 포함)
+            if not self.pipe:
+                return "모델이 로드되지 않았습니다."
+            response = (await self.answer_flight.run(
+                self._answer_cache_key(prompt), generation_executor.run, self._generate_answer, prompt
+            )).strip()
+            if not response:
+                return "죄송합니다. 답변을 생성할 수 없습니다."
+            
+            if q_vec is not None:
+                self.semantic_cache.store(game_name, question, q_vec, response, time.perf_counter() - start)
             logger.info("✅ 질문 답변 완료 (RAG)")
-            return response.strip()
+            return response
             
         except Exception as e:
             logger.error(f"❌ 질문 답변 실패: {str(e)}")
@@ -220,78 +312,48 @@ class FinetuningService:
     async def get_rule_summary_answer(self, game_name: str, question: str, session_id: str):
         """전체 룰을 기반으로 질문에 답변 (RAG 서비스와 동일한 로직)"""
         try:
-            game_info = next((g for g in self.game_data if g.get("game_name") == game_name), None)
+            game_info = self.rule_corpus.get(game_name)
             if not game_info:
                 return f"'{game_name}' 게임의 룰 데이터를 찾을 수 없습니다."
 
             game_rule_text = game_info.get("text", "")
             if not game_rule_text:
                 return f"'{game_name}' 게임의 룰 텍스트가 없습니다."
-            
-            game_info = None
-            for game in self.game_data:
-                if game.get("game_name") == game_name:
-                    game_info = game
-                    break
-            
-            if not game_info:
-                return f"'{game_name}' 게임의 전체 룰 정보를 찾을 수 없습니다. 'game.json' 파일을 확인해주세요."
-            
-            game_rule_text = game_info.get('text', '')
-            
-            if game_name == "뱅":
-                game_data_path = "data/game2.json" # 모든 게임의 상세 룰이 담긴 파일
-                os.path.exists(game_data_path)
-                with open(game_data_path, "r", encoding="utf-8") as f:
-                    self.game_data = json.load(f)
-                logger.info("✅ 게임 룰 데이터 로드 완료")
-                
-                game_info = None
-                for game in self.game_data:
-                    if game.get("game_name") == game_name:
-                        game_info = game
-                        break
-            
-                game_rule_text = game_info.get('text', '')
 
-            # 전체 룰 기반 질문 답변을 위한 시스템 메시지
-            enhanced_system_msg = (
-                "너는 보드게임 룰 전문 AI야. 반드시 아래 규칙을 따라야 해:\n"
-                "- 사용자의 질문에 대해 아래 전체 룰 설명에 있는 내용만 기반해서 답변해.\n"
-                "- 룰 설명에 없는 정보는 절대로 지어내거나 상상하지 마.\n"
-                "- 사람 이름, 장소, 시간, 인원수 등을 추측하거나 새로 만들어내지 마.\n"
-                "- 룰 북을 물어보는게 아닌 전략을 물어보면 너는 룰북을 토대로 전략을 짜줘.\n\n"
-                f"아래는 '{game_name}' 보드게임의 전체 룰 설명입니다:\n\n{game_rule_text}\n\n"
-                "이 룰을 바탕으로 다음 질문에 정확하고 구체적으로 답변해줘."
-            )
-            
-            # 전체 룰을 시스템 메시지에 포함하여 질문 처리
-            prompt = f"[|system|]{enhanced_system_msg}\n[|user|]{question}\n[|assistant|]"
-            
-            # HuggingFace Pipeline 사용
-            response = self.pipe(prompt, max_new_tokens=256, do_sample=False)
-            
-            # Pipeline 결과에서 텍스트 추출
-            generated_text = response[0]['generated_text'] if response else ""
-            
-            # 원본 프롬프트 제거하고 생성된 부분만 추출
-            if prompt in generated_text:
-                content = generated_text.replace(prompt, "").strip()
-            else:
-                content = generated_text
-            
-            # 불필요한 토큰 제거
-            for marker in ["[|assistant|]", "[|user|]", "[|system|]"]:
-                content = content.split(marker)[-1].strip()
-                
-            content = game_rule_text
-            
-            return content if content else "죄송합니다. 답변을 생성할 수 없습니다."
+            # 전체 룰 텍스트를 그대로 반환 (생성 결과를 쓰지 않으므로 모델 호출 없음)
+            return game_rule_text if game_rule_text else "죄송합니다. 답변을 생성할 수 없습니다."
             
         except Exception as e:
             logger.error(f"❌ 전체 룰 기반 질문 처리 실패: {str(e)}")
             return f"전체 룰 기반 질문 처리 중 오류가 발생했습니다: {str(e)}"
     
+    def _build_rule_summary_prompt(self, game_name: str, game_rule_text: str) -> str:
+        """룰 요약 프롬프트 구성 (전체 룰 텍스트 기반)"""
+        # 게임 룰 요약 요청
+        query = f"{game_name} 게임의 기본 규칙과 플레이 방법을 설명해주세요."
+        
+        # 전체 룰을 컨텍스트로 사용하여 요약 생성
+        enhanced_system_msg = (
+            "너는 보드게임 룰 전문 AI야. 반드시 아래 규칙을 따라야 해:\n"
+            "- 사용자의 질문에 대해 아래 전체 룰 설명에 있는 내용만 기반해서 답변해.\n"
+            "- 룰 설명에 없는 정보는 절대로 지어내거나 상상하지 마.\n"
+            "- 사람 이름, 장소, 시간, 인원수 등을 추측하거나 새로 만들어내지 마.\n"
+            "- 룰 북을 물어보는게 아닌 전략을 물어보면 너는 룰북을 토대로 전략을 짜줘.\n\n"
+            f"게임 이름: {game_name}\n\n룰 전체:\n{game_rule_text}\n\n"
+            "이 게임의 룰을 설명해주세요."
+        )
+        
+        return f"[|system|]{enhanced_system_msg}\n[|user|]{query}\n[|assistant|]"
+    
+    def _generate_rule_summary(self, game_name: str, game_rule_text: str) -> str:
+        """전체 룰 텍스트로 룰 요약 생성 (오프라인 요약 생성에도 사용)"""
+        if not self.pipe:
+            return "모델이 로드되지 않았습니다."
+        
+        prompt = self._build_rule_summary_prompt(game_name, game_rule_text)
+        
+        return self._run_pipeline(prompt)
+    
     async def get_rule_summary(self, game_name: str, session_id: str = ""):
         """룰 요약 (전체 룰 텍스트 기반)"""
         try:
@@ -299,12 +361,7 @@ class FinetuningService:
             logger.info(f"🤖 룰 요약: {game_name}")
             
             # 게임 정보 찾기
-            game_info = None
-            for game in self.game_data:
-                if game.get("game_name") == game_name:
-                    game_info = game
-                    break
-            
+            game_info = self.rule_corpus.get(game_name)
             if not game_info:
                 return f"'{game_name}' 게임의 전체 룰 정보를 찾을 수 없습니다. 'game.json' 파일을 확인해주세요."
             
@@ -313,37 +370,12 @@ class FinetuningService:
             if not game_rule_text:
                 return f"'{game_name}' 게임의 룰 내용이 비어 있습니다."
             
-            # 게임 룰 요약 요청
-            query = f"{game_name} 게임의 기본 규칙과 플레이 방법을 설명해주세요."
-            
-            # 전체 룰을 컨텍스트로 사용하여 요약 생성
-            enhanced_system_msg = (
-                "너는 보드게임 룰 전문 AI야. 반드시 아래 규칙을 따라야 해:\n"
-                "- 사용자의 질문에 대해 아래 전체 룰 설명에 있는 내용만 기반해서 답변해.\n"
-                "- 룰 설명에 없는 정보는 절대로 지어내거나 상상하지 마.\n"
-                "- 사람 이름, 장소, 시간, 인원수 등을 추측하거나 새로 만들어내지 마.\n"
-                "- 룰 북을 물어보는게 아닌 전략을 물어보면 너는 룰북을 토대로 전략을 짜줘.\n\n"
-                f"게임 이름: {game_name}\n\n룰 전체:\n{game_rule_text}\n\n"
-                "이 게임의 룰을 설명해주세요."
-            )
-            
-            prompt = f"[|system|]{enhanced_system_msg}\n[|user|]{query}\n[|assistant|]"
-            
-            # HuggingFace Pipeline 사용
-            response = self.pipe(prompt, max_new_tokens=256, do_sample=False)
-            
-            # Pipeline 결과에서 텍스트 추출
-            generated_text = response[0]['generated_text'] if response else ""
-            
-            # 원본 프롬프트 제거하고 생성된 부분만 추출
-            if prompt in generated_text:
-                content = generated_text.replace(prompt, "").strip()
-            else:
-                content = generated_text
-            
-            # 불필요한 토큰 제거
-            for marker in ["[|assistant|]", "[|user|]", "[|system|]"]:
-                content = content.split(marker)[-1].strip()
+            # 미리 생성한 요약이 있으면 모델 호출 없이 반환
+            content = self.summary_store.get("finetuning", game_name, game_rule_text)
+            if content is None:
+                content = await self.summary_flight.run(
+                    game_name, generation_executor.run, self._generate_rule_summary, game_name, game_rule_text
+                )
             
             logger.info("✅ 룰 요약 완료")
             return content if content else "죄송합니다. 룰 요약을 생성할 수 없습니다."
@@ -352,6 +384,56 @@ class FinetuningService:
             logger.error(f"❌ 룰 요약 실패: {str(e)}")
             return f"룰 요약 중 오류가 발생했습니다: {str(e)}"
     
+    async def astream_answer(self, game_name: str, question: str, session_id: str = ""):
+        """질문 답변 스트리밍 (RAG 검색 후 생성되는 텍스트를 조각 단위로 반환)"""
+        logger.info(f"🤖 질문 답변 스트리밍 (RAG): {game_name} - {question[:50]}...")
+        
+        q_vec, cached = await self._lookup_semantic_cache(game_name, question)
+        if cached is not None:
+            yield cached
+            return
+        start = time.perf_counter()
+        
+        context = await self._search_game_context(game_name, question, top_k=4, q_vec=q_vec)
+        
+        # RAG 검색 실패 시 전체 룰 기반 답변
+        if not context or context.strip() == "":
+            logger.info(f"RAG 검색 실패. 전체 룰을 기반으로 재시도: {game_name}")
+            yield await self.get_rule_summary_answer(game_name, question, session_id)
+            return
+        
+        prompt = self._build_answer_prompt(question, context)
+        cache_key = self._answer_cache_key(prompt)
+        cached = await asyncio.to_thread(self.answer_cache.get, cache_key)
+        if cached is not None:
+            yield cached
+            return
+        
+        # 끝까지 생성된 답변만 캐시에 저장 (중간에 끊기면 저장하지 않음)
+        generated = ""
+        async for text in self._astream_generate(prompt):
+            generated += text
+            yield text
+        if self.model is not None:
+            await asyncio.to_thread(self.answer_cache.put, cache_key, generated.strip())
+            if q_vec is not None:
+                self.semantic_cache.store(game_name, question, q_vec, generated.strip(), time.perf_counter() - start)
+    
+    async def astream_rule_summary(self, game_name: str, session_id: str = ""):
+        """룰 요약 스트리밍 (미리 생성한 요약이 있으면 한 번에 반환)"""
+        game_rule_text = self.rule_corpus.get_text(game_name)
+        if not game_rule_text:
+            yield f"'{game_name}' 게임의 전체 룰 정보를 찾을 수 없습니다. 'game.json' 파일을 확인해주세요."
+            return
+        
+        content = self.summary_store.get("finetuning", game_name, game_rule_text)
+        if content is not None:
+            yield content
+            return
+        
+        async for text in self._astream_generate(self._build_rule_summary_prompt(game_name, game_rule_text)):
+            yield text
+    
     def get_session_info(self, session_id: str) -> Dict[str, Any]:
         """세션 정보 조회 (히스토리 없으므로 기본 정보만)"""
         return {
@@ -380,12 +462,12 @@ class FinetuningService:
             "model_loaded": self.model is not None,
             "tokenizer_loaded": self.tokenizer is not None,
             "pipeline_loaded": self.pipe is not None,
-            "embedding_model_loaded": self.embed_model is not None,
-            "game_data_loaded": len(self.game_data) > 0 if self.game_data else False,
-            "game_count": len(self.game_data) if self.game_data else 0,
+            "embedding_model_loaded": self.embedding_service.model is not None,
+            "game_data_loaded": len(self.rule_corpus) > 0,
+            "game_count": len(self.rule_corpus),
             "device": self.device,
-            "model_name": "minjeongHuggingFace/exaone-bang-merged",
-            "embedding_model": "BAAI/bge-m3",
+            "model_name": FINETUNING_MODEL_ID,
+            "embedding_model": self.embedding_service.model_name,
             "implementation": "huggingface_pipeline_with_rag",
             "features": {
                 "stateless": True,
@@ -0,0 +1,97 @@
+import threading
+
+import torch
+from transformers import StoppingCriteria
+
+from services.metrics import Histogram
+
+# 채팅 템플릿 턴 마커 (답변 뒤에 모델이 만들어내는 가짜 턴의 시작)
+TURN_MARKERS = ("[|assistant|]", "[|user|]", "[|system|]")
+
+
+class TurnMarkerStoppingCriteria(StoppingCriteria):
+    """새로 생성된 토큰에 턴 마커가 나오면 생성 중단 (EOS는 generate가 직접 처리)
+
+    프롬프트 안의 마커는 보지 않도록 첫 호출 시점의 길이를 프롬프트 끝으로 기록합니다.
+    생성 요청마다 새로 만들어 쓰며, 끝난 뒤 generated/stopped로 생성량을 확인합니다.
+    cancel()을 호출하면 다음 토큰에서 중단합니다 (스트리밍 클라이언트 연결 종료 시).
+    """
+
+    def __init__(self, tokenizer, markers=TURN_MARKERS, window=16):
+        self.tokenizer = tokenizer
+        self.markers = markers
+        self.window = window  # 마커가 여러 토큰으로 나뉘어도 찾을 수 있도록 최근 토큰 몇 개를 함께 디코딩
+        self.prompt_length = None
+        self.generated = 0
+        self.stopped = False
+        self.cancelled = False
+
+    def cancel(self):
+        """다른 스레드에서 호출 - 생성 중인 generate를 다음 토큰에서 중단"""
+        self.cancelled = True
+
+    def __call__(self, input_ids, scores, **kwargs):
+        length = input_ids.shape[1]
+        if self.prompt_length is None:
+            self.prompt_length = length - 1
+        self.generated = length - self.prompt_length
+        if self.cancelled:
+            return torch.full((input_ids.shape[0],), True, dtype=torch.bool, device=input_ids.device)
+
+        tail = input_ids[0, max(self.prompt_length, length - self.window):]
+        text = self.tokenizer.decode(tail, skip_special_tokens=False)
+        self.stopped = any(marker in text for marker in self.markers)
+        return torch.full((input_ids.shape[0],), self.stopped, dtype=torch.bool, device=input_ids.device)
+
+
+def cut_at_turn_marker(text):
+    """첫 턴 마커 앞까지만 답변으로 사용"""
+    for marker in TURN_MARKERS:
+        text = text.split(marker)[0]
+    return text.strip()
+
+
+class GenerationStats:
+    """파인튜닝 생성 종료 사유와 새 토큰 수, 마커 조기 종료로 아낀 토큰 수"""
+
+    def __init__(self, max_new_tokens):
+        self.max_new_tokens = max_new_tokens
+        self._lock = threading.Lock()
+        self.new_tokens = Histogram([16, 32, 64, 128, 192, 256])
+
+        self.generations = 0
+        self.stopped_marker = 0
+        self.stopped_eos = 0
+        self.stopped_max_tokens = 0
+        self.cancelled = 0
+        self.tokens_saved = 0
+
+    def record(self, criteria):
+        """생성 한 번의 결과 기록 - 마커에서 멈춘 경우 남은 토큰 한도를 아낀 것으로 집계 (최대치)"""
+        generated = criteria.generated
+        with self._lock:
+            self.generations += 1
+            if criteria.cancelled:
+                self.cancelled += 1
+            elif criteria.stopped:
+                self.stopped_marker += 1
+                self.tokens_saved += max(self.max_new_tokens - generated, 0)
+            elif generated < self.max_new_tokens:
+                self.stopped_eos += 1
+            else:
+                self.stopped_max_tokens += 1
+        self.new_tokens.observe(generated)
+
+    def get_stats(self):
+        with self._lock:
+            stats = {
+                "generations": self.generations,
+                "stopped_marker": self.stopped_marker,
+                "stopped_eos": self.stopped_eos,
+                "stopped_max_tokens": self.stopped_max_tokens,
+                "cancelled": self.cancelled,
+                "tokens_saved": self.tokens_saved,
+                "avg_tokens_saved": round(self.tokens_saved / self.generations, 1) if self.generations else 0.0,
+            }
+        stats["new_tokens"] = self.new_tokens.snapshot()
+        return stats
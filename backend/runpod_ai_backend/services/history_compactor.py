@@ -0,0 +1,131 @@
+import asyncio
+import logging
+import threading
+import time
+
+from langchain_core.messages import HumanMessage, SystemMessage
+
+from services.history_policy import (
+    GAME_TAG_KEY,
+    SUMMARY_TAG_KEY,
+    count_message_tokens,
+    split_summary,
+    split_turns,
+)
+
+logger = logging.getLogger(__name__)
+
+COMPACTION_SYSTEM_PROMPT = (
+    "너는 보드게임 룰 상담 대화를 요약하는 도우미야.\n"
+    "- 이후 대화에 필요한 정보(사용자의 역할, 게임 상황, 이미 설명한 규칙, 사용자의 선호)를 중심으로 요약해.\n"
+    "- 대화에 없는 내용은 추가하지 마.\n"
+    "- 한국어로 간결하게, 게임별로 나눠서 정리해."
+)
+
+
+class HistoryCompactor:
+    """긴 세션의 오래된 턴을 요약 메시지 하나로 압축 (응답 후 백그라운드에서 실행)
+
+    히스토리 토큰이 threshold_tokens를 넘으면 최근 keep_turns 턴을 제외한 앞부분을
+    기존 요약과 합쳐 다시 요약합니다.
+    """
+
+    def __init__(self, llm, threshold_tokens=2000, keep_turns=2):
+        self.llm = llm
+        self.threshold_tokens = threshold_tokens
+        self.keep_turns = keep_turns
+
+        self._lock = threading.Lock()
+        self._pending = set()  # (저장소 이름, 세션 ID)
+        self._tasks = set()
+
+        # 통계
+        self.scheduled = 0
+        self.failed = 0
+        self.skipped = 0  # 압축 중 히스토리가 바뀌어 적용하지 않음
+
+    def schedule(self, store, session_id):
+        """토큰 임계값을 넘은 세션이면 압축 작업 예약 (요청 처리 경로에서는 토큰 수만 계산)"""
+        history = store.get(session_id)
+        if history is None:
+            return False
+
+        key = (store.name, session_id)
+        if key in self._pending:
+            return False
+        if sum(count_message_tokens(message) for message in list(history.messages)) < self.threshold_tokens:
+            return False
+
+        with self._lock:
+            if key in self._pending:
+                return False
+            self._pending.add(key)
+            self.scheduled += 1
+
+        task = asyncio.create_task(self._compact(store, session_id, history, key))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return True
+
+    @staticmethod
+    def _format_transcript(messages):
+        lines = []
+        for message in messages:
+            speaker = "사용자" if message.type == "human" else "AI"
+            game_name = message.additional_kwargs.get(GAME_TAG_KEY)
+            prefix = f"[{game_name}] " if game_name else ""
+            lines.append(f"{prefix}{speaker}: {message.content}")
+        return "\n".join(lines)
+
+    async def _compact(self, store, session_id, history, key):
+        try:
+            summary, rest = split_summary(list(history.messages))
+            turns = split_turns(rest)
+            if len(turns) <= self.keep_turns:
+                return
+
+            old_messages = [message for turn in turns[:-self.keep_turns] for message in turn]
+            prefix = ([summary] if summary is not None else []) + old_messages
+
+            start = time.perf_counter()
+            previous = summary.content if summary is not None else "(없음)"
+            response = await self.llm.ainvoke([
+                SystemMessage(content=COMPACTION_SYSTEM_PROMPT),
+                HumanMessage(content=f"이전 요약:\n{previous}\n\n새 대화:\n{self._format_transcript(old_messages)}"),
+            ])
+            elapsed = time.perf_counter() - start
+
+            summary_message = SystemMessage(
+                content=f"이전 대화 요약:\n{response.content.strip()}",
+                additional_kwargs={SUMMARY_TAG_KEY: True},
+            )
+            tokens_before = sum(count_message_tokens(message) for message in prefix)
+            tokens_after = count_message_tokens(summary_message)
+
+            if not store.replace_prefix(history, prefix, summary_message):
+                with self._lock:
+                    self.skipped += 1
+                logger.info(f"↩️ 압축 중 세션이 변경되어 요약을 적용하지 않음: {session_id}")
+                return
+
+            store.record_compaction(tokens_before, tokens_after, elapsed)
+            logger.info(f"🗜️ 세션 히스토리 압축: {session_id} ({len(prefix)}개 메시지, {tokens_before} -> {tokens_after} 토큰, {elapsed:.1f}초)")
+
+        except Exception as e:
+            with self._lock:
+                self.failed += 1
+            logger.error(f"❌ 세션 히스토리 압축 실패 ({session_id}): {str(e)}")
+        finally:
+            with self._lock:
+                self._pending.discard(key)
+
+    def get_stats(self):
+        with self._lock:
+            return {
+                "threshold_tokens": self.threshold_tokens,
+                "keep_turns": self.keep_turns,
+                "running": len(self._pending),
+                "scheduled": self.scheduled,
+                "failed": self.failed,
+                "skipped": self.skipped,
+            }
@@ -0,0 +1,196 @@
+import logging
+import math
+import os
+import threading
+
+from langchain_core.chat_history import BaseChatMessageHistory
+
+from services.metrics import Histogram
+
+logger = logging.getLogger(__name__)
+
+# 메시지에 붙이는 게임 태그 키 (additional_kwargs, OpenAI 요청에는 포함되지 않음)
+GAME_TAG_KEY = "game_name"
+# 이전 턴을 압축한 요약 메시지 표시 키 (history_compactor.py)
+SUMMARY_TAG_KEY = "history_summary"
+# 메시지당 역할/구분자 토큰 (OpenAI 채팅 포맷 기준 근사값)
+MESSAGE_OVERHEAD_TOKENS = 4
+
+_encoding = None
+_encoding_lock = threading.Lock()
+_encoding_failed = False
+
+
+def _get_encoding():
+    """tiktoken 인코더 (설치되어 있지 않거나 로드 실패 시 None)"""
+    global _encoding, _encoding_failed
+    if _encoding is not None or _encoding_failed:
+        return _encoding
+    with _encoding_lock:
+        if _encoding is None and not _encoding_failed:
+            try:
+                import tiktoken
+                _encoding = tiktoken.encoding_for_model("gpt-4o")
+            except Exception as e:
+                _encoding_failed = True
+                logger.warning(f"⚠️ tiktoken 사용 불가, 글자 수 기반으로 토큰을 추정합니다: {str(e)}")
+    return _encoding
+
+
+def count_tokens(text):
+    """텍스트 토큰 수 (tiktoken, 없으면 글자 수 기반 추정)"""
+    if not text:
+        return 0
+    encoding = _get_encoding()
+    if encoding is not None:
+        return len(encoding.encode(text))
+    # 한국어 기준 대략 2글자당 1토큰
+    return math.ceil(len(text) / 2)
+
+
+def count_message_tokens(message):
+    content = message.content if isinstance(message.content, str) else str(message.content)
+    return count_tokens(content) + MESSAGE_OVERHEAD_TOKENS
+
+
+def is_summary(message):
+    return bool(message.additional_kwargs.get(SUMMARY_TAG_KEY))
+
+
+def split_summary(messages):
+    """맨 앞의 요약 메시지와 나머지 메시지 분리"""
+    if messages and is_summary(messages[0]):
+        return messages[0], messages[1:]
+    return None, messages
+
+
+def split_turns(messages):
+    """사용자 메시지 기준으로 턴 단위 묶음"""
+    turns = []
+    for message in messages:
+        if message.type == "human" or not turns:
+            turns.append([message])
+        else:
+            turns[-1].append(message)
+    return turns
+
+
+class HistoryPolicy:
+    """LLM에 넘길 대화 히스토리 선택 정책
+
+    - 최근 max_turns 턴까지만, 전체 max_tokens 토큰 이내로 유지
+    - 현재 요청과 다른 게임의 턴은 답변을 잘라내거나(truncate) 제외(drop)
+    - 압축된 요약 메시지가 있으면 항상 맨 앞에 포함 (토큰 예산에 포함)
+    """
+
+    def __init__(self, max_turns=6, max_tokens=2000, other_game_mode="truncate", other_game_chars=200):
+        self.max_turns = max_turns
+        self.max_tokens = max_tokens
+        self.other_game_mode = other_game_mode
+        self.other_game_chars = other_game_chars
+
+        # 통계
+        self._lock = threading.Lock()
+        self.history_tokens = Histogram([0, 250, 500, 1000, 2000, 4000])
+        self.prompt_tokens = Histogram([500, 1000, 2000, 4000, 8000, 16000])
+        self.turns_dropped_budget = 0
+        self.turns_dropped_other_game = 0
+        self.turns_truncated_other_game = 0
+
+    def _shorten(self, message):
+        content = message.content
+        if not isinstance(content, str) or len(content) <= self.other_game_chars:
+            return message
+        return message.model_copy(update={"content": content[:self.other_game_chars] + "…"})
+
+    def select(self, messages, game_name=None):
+        """정책에 맞는 히스토리 메시지 목록 반환 (원본은 변경하지 않음)"""
+        summary, messages = split_summary(messages)
+        turns = split_turns(messages)
+        selected = []
+        total_tokens = count_message_tokens(summary) if summary is not None else 0
+        dropped_budget = dropped_other = truncated_other = 0
+
+        for index in range(len(turns) - 1, -1, -1):
+            if len(selected) >= self.max_turns:
+                dropped_budget = index + 1
+                break
+
+            turn = turns[index]
+            turn_game = turn[0].additional_kwargs.get(GAME_TAG_KEY)
+            if game_name and turn_game and turn_game != game_name:
+                if self.other_game_mode == "drop":
+                    dropped_other += 1
+                    continue
+                turn = [turn[0]] + [self._shorten(message) for message in turn[1:]]
+                truncated_other += 1
+
+            turn_tokens = sum(count_message_tokens(message) for message in turn)
+            if total_tokens + turn_tokens > self.max_tokens:
+                dropped_budget = index + 1
+                break
+
+            selected.append(turn)
+            total_tokens += turn_tokens
+
+        self.history_tokens.observe(total_tokens)
+        with self._lock:
+            self.turns_dropped_budget += dropped_budget
+            self.turns_dropped_other_game += dropped_other
+            self.turns_truncated_other_game += truncated_other
+
+        window = [message for turn in reversed(selected) for message in turn]
+        return [summary] + window if summary is not None else window
+
+    def record_usage(self, chain_name, session_id, response):
+        """LLM 응답의 실제 프롬프트 토큰 수 기록"""
+        usage = getattr(response, "usage_metadata", None) or {}
+        input_tokens = usage.get("input_tokens")
+        if input_tokens is None:
+            return
+        self.prompt_tokens.observe(input_tokens)
+        logger.info(f"🧮 {chain_name} 프롬프트 토큰: {input_tokens} (출력: {usage.get('output_tokens')}, 세션: {session_id})")
+
+    def get_stats(self):
+        with self._lock:
+            return {
+                "max_turns": self.max_turns,
+                "max_tokens": self.max_tokens,
+                "other_game_mode": self.other_game_mode,
+                "token_counter": "tiktoken" if _get_encoding() is not None else "chars",
+                "turns_dropped_budget": self.turns_dropped_budget,
+                "turns_dropped_other_game": self.turns_dropped_other_game,
+                "turns_truncated_other_game": self.turns_truncated_other_game,
+                "history_tokens": self.history_tokens.snapshot(),
+                "prompt_tokens": self.prompt_tokens.snapshot(),
+            }
+
+
+class WindowedHistory(BaseChatMessageHistory):
+    """세션 히스토리를 정책에 맞게 잘라 보여주는 뷰 (추가되는 메시지는 게임 태그를 붙여 원본에 저장)"""
+
+    def __init__(self, history, policy, game_name=None):
+        self.history = history
+        self.policy = policy
+        self.game_name = game_name
+
+    @property
+    def messages(self):
+        return self.policy.select(list(self.history.messages), self.game_name)
+
+    def add_messages(self, messages):
+        if self.game_name:
+            for message in messages:
+                message.additional_kwargs[GAME_TAG_KEY] = self.game_name
+        self.history.add_messages(messages)
+
+    def clear(self):
+        self.history.clear()
+
+
+history_policy = HistoryPolicy(
+    max_turns=int(os.getenv("HISTORY_MAX_TURNS", "6")),
+    max_tokens=int(os.getenv("HISTORY_MAX_TOKENS", "2000")),
+    other_game_mode=os.getenv("HISTORY_OTHER_GAME_MODE", "truncate"),
+    other_game_chars=int(os.getenv("HISTORY_OTHER_GAME_CHARS", "200")),
+)
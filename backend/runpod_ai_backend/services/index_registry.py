@@ -0,0 +1,171 @@
+import logging
+import os
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from services.mmap_store import load_text_list, read_faiss_index
+
+logger = logging.getLogger(__name__)
+
+# 게임별 벡터 인덱스 경로 (개별 게임 룰 청크를 위한 폴더)
+GAME_VECTOR_BASE_PATH = "data/game_data/game_data"
+
+
+class GameIndexEntry:
+    """한 게임의 FAISS 인덱스와 청크 텍스트 묶음"""
+
+    def __init__(self, game_name, index, chunks):
+        self.game_name = game_name
+        self.index = index
+        self.chunks = chunks
+        self.size_bytes = self._estimate_size()
+
+    def _estimate_size(self):
+        """캐시 용량 계산용 메모리 사용량 추정 (벡터 + 청크 문자열)"""
+        vector_bytes = int(self.index.ntotal) * int(self.index.d) * 4
+        if hasattr(self.chunks, "nbytes"):
+            chunk_bytes = self.chunks.nbytes
+        else:
+            chunk_bytes = sum(len(chunk.encode("utf-8")) for chunk in self.chunks)
+        return vector_bytes + chunk_bytes
+
+    def search(self, query_vec, top_k):
+        """쿼리 벡터와 유사한 청크 검색"""
+        D, I = self.index.search(np.array(query_vec), k=top_k)
+        return [self.chunks[i] for i in I[0] if 0 <= i < len(self.chunks)]
+
+
+class GameIndexRegistry:
+    """게임별 룰 인덱스를 한 번만 로드해 공유하는 프로세스 전역 레지스트리 (바이트 기준 LRU)"""
+
+    def __init__(self, base_path=GAME_VECTOR_BASE_PATH, max_bytes=256 * 1024 * 1024):
+        self.base_path = base_path
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._current_bytes = 0
+        self._lock = threading.Lock()
+        self._loading_locks = {}
+
+        # 통계
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.load_failures = 0
+
+    def _paths(self, game_name):
+        index_path = os.path.join(self.base_path, f"{game_name}.faiss")
+        chunks_path = os.path.join(self.base_path, f"{game_name}.json")
+        return index_path, chunks_path
+
+    def has_game(self, game_name):
+        """게임의 인덱스 파일이 존재하는지 확인"""
+        with self._lock:
+            if game_name in self._entries:
+                return True
+        index_path, chunks_path = self._paths(game_name)
+        return os.path.exists(index_path) and os.path.exists(chunks_path)
+
+    def get(self, game_name):
+        """게임 인덱스 반환 (없으면 디스크에서 로드 후 캐시), 데이터가 없으면 None"""
+        with self._lock:
+            entry = self._entries.get(game_name)
+            if entry is not None:
+                self._entries.move_to_end(game_name)
+                self.hits += 1
+                return entry
+            # 같은 게임을 동시에 여러 번 로드하지 않도록 게임별 로딩 락 사용
+            loading_lock = self._loading_locks.setdefault(game_name, threading.Lock())
+
+        with loading_lock:
+            with self._lock:
+                entry = self._entries.get(game_name)
+                if entry is not None:
+                    self._entries.move_to_end(game_name)
+                    self.hits += 1
+                    return entry
+                self.misses += 1
+
+            try:
+                entry = self._load(game_name)
+                if entry is None:
+                    return None
+
+                with self._lock:
+                    self._insert(entry)
+                return entry
+            finally:
+                # 게임 이름은 요청 본문에서 오므로 로드 실패(없는 게임 등) 시에도 로딩 락을 남기지 않음
+                with self._lock:
+                    if self._loading_locks.get(game_name) is loading_lock:
+                        del self._loading_locks[game_name]
+
+    def _load(self, game_name):
+        """디스크에서 인덱스와 청크 텍스트 로드"""
+        index_path, chunks_path = self._paths(game_name)
+        if not os.path.exists(index_path) or not os.path.exists(chunks_path):
+            return None
+
+        try:
+            index = read_faiss_index(index_path)
+            chunks = load_text_list(chunks_path)
+            entry = GameIndexEntry(game_name, index, chunks)
+            logger.info(f"📥 게임 인덱스 로드: {game_name} ({entry.size_bytes // 1024}KB)")
+            return entry
+        except Exception as e:
+            with self._lock:
+                self.load_failures += 1
+            logger.error(f"❌ 게임 인덱스 로드 실패 ({game_name}): {str(e)}")
+            return None
+
+    def _insert(self, entry):
+        """캐시에 추가하고 용량 초과 시 가장 오래 사용하지 않은 게임부터 제거 (락 보유 상태에서 호출)"""
+        previous = self._entries.pop(entry.game_name, None)
+        if previous is not None:
+            self._current_bytes -= previous.size_bytes
+
+        self._entries[entry.game_name] = entry
+        self._current_bytes += entry.size_bytes
+
+        # 방금 넣은 항목 하나만 남은 경우에는 용량을 넘더라도 유지
+        while self._current_bytes > self.max_bytes and len(self._entries) > 1:
+            evicted_name, evicted = self._entries.popitem(last=False)
+            self._current_bytes -= evicted.size_bytes
+            self.evictions += 1
+            logger.info(f"♻️ 게임 인덱스 캐시 제거: {evicted_name}")
+
+    def search(self, game_name, query_vec, top_k):
+        """게임 룰 청크 검색, 게임 데이터가 없으면 None"""
+        entry = self.get(game_name)
+        if entry is None:
+            return None
+        return entry.search(query_vec, top_k)
+
+    def clear(self):
+        """캐시 비우기"""
+        with self._lock:
+            self._entries.clear()
+            self._current_bytes = 0
+
+    def get_stats(self):
+        """캐시 통계 반환"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "mode": "per_game",
+                "entries": len(self._entries),
+                "bytes": self._current_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / total, 4) if total else 0.0,
+                "evictions": self.evictions,
+                "load_failures": self.load_failures,
+            }
+
+
+# 프로세스 전역 레지스트리 (RAG/파인튜닝 서비스 공용)
+game_index_registry = GameIndexRegistry(
+    max_bytes=int(os.getenv("GAME_INDEX_CACHE_MB", "256")) * 1024 * 1024
+)
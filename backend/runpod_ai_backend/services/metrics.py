@@ -0,0 +1,31 @@
+import threading
+
+
+class Histogram:
+    """누적 버킷 히스토그램 (튜닝용 분포 지표)"""
+
+    def __init__(self, buckets):
+        self.buckets = sorted(buckets)
+        self._counts = [0] * (len(self.buckets) + 1)  # 마지막 칸은 +Inf
+        self._lock = threading.Lock()
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, value):
+        with self._lock:
+            self.count += 1
+            self.total += value
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    self._counts[i] += 1
+                    return
+            self._counts[-1] += 1
+
+    def snapshot(self):
+        with self._lock:
+            labels = [f"le_{bound:g}" for bound in self.buckets] + ["le_inf"]
+            return {
+                "count": self.count,
+                "avg": round(self.total / self.count, 3) if self.count else 0.0,
+                "buckets": dict(zip(labels, self._counts)),
+            }
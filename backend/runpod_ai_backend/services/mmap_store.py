@@ -0,0 +1,102 @@
+import json
+import logging
+import mmap
+import os
+import struct
+from collections.abc import Sequence
+
+import faiss
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# 청크 텍스트 바이너리 포맷: 매직(8) + 개수(uint64) + 오프셋((개수+1) x uint64) + UTF-8 본문
+CHUNK_STORE_MAGIC = b"BGCHNK01"
+CHUNK_STORE_SUFFIX = ".bin"
+_HEADER = struct.Struct("<8sQ")
+
+
+def mmap_enabled():
+    """VECTOR_MMAP 환경변수로 mmap 로딩 사용 여부 결정 (기본값: 사용)"""
+    return os.getenv("VECTOR_MMAP", "1").lower() not in ("0", "false", "no")
+
+
+class ChunkTextStore(Sequence):
+    """오프셋 인덱스가 붙은 읽기 전용 청크 텍스트 파일 (mmap으로 열어 워커 간 페이지 캐시 공유)"""
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, count = _HEADER.unpack_from(self._mm, 0)
+        if magic != CHUNK_STORE_MAGIC:
+            self._mm.close()
+            raise ValueError(f"청크 텍스트 파일 형식이 올바르지 않습니다: {path}")
+
+        self._count = count
+        self._offsets = np.frombuffer(self._mm, dtype="<u8", count=count + 1, offset=_HEADER.size)
+        self._data_start = _HEADER.size + 8 * (count + 1)
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(self._count))]
+        if i < 0:
+            i += self._count
+        if not 0 <= i < self._count:
+            raise IndexError(i)
+        start = self._data_start + int(self._offsets[i])
+        end = self._data_start + int(self._offsets[i + 1])
+        return self._mm[start:end].decode("utf-8")
+
+    @property
+    def nbytes(self):
+        return len(self._mm)
+
+
+def write_chunk_store(path, texts):
+    """문자열 목록을 오프셋 인덱스 바이너리 파일로 저장"""
+    encoded = [text.encode("utf-8") for text in texts]
+    offsets = np.zeros(len(encoded) + 1, dtype="<u8")
+    np.cumsum([len(b) for b in encoded], out=offsets[1:])
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_HEADER.pack(CHUNK_STORE_MAGIC, len(encoded)))
+        f.write(offsets.tobytes())
+        for b in encoded:
+            f.write(b)
+    os.replace(tmp_path, path)
+
+
+def chunk_store_path(json_path):
+    """JSON 청크 파일에 대응하는 바이너리 파일 경로"""
+    return os.path.splitext(json_path)[0] + CHUNK_STORE_SUFFIX
+
+
+def load_text_list(json_path):
+    """문자열 목록 로드: mmap 모드이고 바이너리 파일이 있으면 mmap, 아니면 JSON 파싱"""
+    bin_path = chunk_store_path(json_path)
+    if mmap_enabled() and os.path.exists(bin_path):
+        try:
+            return ChunkTextStore(bin_path)
+        except Exception as e:
+            logger.warning(f"⚠️ 청크 바이너리 로드 실패, JSON으로 대체: {bin_path} ({str(e)})")
+
+    with open(json_path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def read_faiss_index(path):
+    """FAISS 인덱스 로드: mmap 모드이면 읽기 전용 mmap으로 열고, 실패하면 일반 로드"""
+    if mmap_enabled():
+        # IO_FLAG_MMAP_IFC가 있는 버전은 Flat 인덱스 벡터까지 mmap으로 공유
+        flags = getattr(faiss, "IO_FLAG_MMAP_IFC", faiss.IO_FLAG_MMAP) | faiss.IO_FLAG_READ_ONLY
+        try:
+            return faiss.read_index(path, flags)
+        except Exception as e:
+            logger.warning(f"⚠️ mmap 인덱스 로드 실패, 일반 로드로 대체: {path} ({str(e)})")
+    return faiss.read_index(path)
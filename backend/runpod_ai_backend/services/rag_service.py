@@ -1,5 +1,4 @@
 import json
-import faiss
 import numpy as np
 import os
 import re
@@ -7,79 +6,86 @@ import logging
 import time
 import uuid
 import threading
-from sentence_transformers import SentenceTransformer
 
 from langchain_core.messages import HumanMessage, AIMessage
-from langchain_core.chat_history import BaseChatMessageHistory
+from langchain_core.runnables import ConfigurableFieldSpec
 from langchain_core.runnables.history import RunnableWithMessageHistory
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 from langchain_openai import ChatOpenAI
 from dotenv import load_dotenv
 
+from services.embedding_service import get_embedding_service
+from services.executors import embedding_executor
+from services.rule_store import get_rule_index
+from services.summary_store import get_summary_store
+from services.rule_corpus import get_rule_corpus
+from services.mmap_store import load_text_list, read_faiss_index
+from services.session_store import SessionStore
+from services.history_policy import WindowedHistory, history_policy
+from services.history_compactor import HistoryCompactor
+from services.semantic_cache import create_semantic_cache
+from services.single_flight import SingleFlight
+
 logger = logging.getLogger(__name__)
 load_dotenv(dotenv_path=os.path.join(os.path.dirname(__file__), '..', '.env'))
 
-# 세션 기반 클래스 메모리 정의 (LangChain용)
-class InMemoryHistory(BaseChatMessageHistory):
-    def __init__(self):
-        self.messages = []
-        self.last_access = time.time()  # 마지막 접근 시간
-        logger.info(f"🧠 새 InMemoryHistory 인스턴스 생성")
-
-    def add_messages(self, messages):
-        logger.info(f"📝 메시지 추가: {len(messages)}개 (기존: {len(self.messages)}개)")
-        self.messages.extend(messages)
-        self.last_access = time.time()  # 접근 시간 업데이트
-        logger.info(f"📝 추가 후 총 메시지: {len(self.messages)}개")
-
-    def clear(self):
-        logger.info(f"🗑️ 메시지 히스토리 클리어 (기존: {len(self.messages)}개)")
-        self.messages = []
-        self.last_access = time.time()
-
-    def __repr__(self):
-        return f"InMemoryHistory({len(self.messages)} messages)"
+# 기능별 독립적인 세션 저장소 (세션 수/전체 메시지 수/세션당 메시지 수 한도, 마지막 접근 기준 만료)
+SESSION_TIMEOUT = int(os.getenv("SESSION_TIMEOUT_MINUTES", "40")) * 60
+SESSION_MAX_COUNT = int(os.getenv("SESSION_MAX_COUNT", "5000"))
+SESSION_MAX_MESSAGES = int(os.getenv("SESSION_MAX_MESSAGES", "100000"))
+SESSION_MAX_MESSAGES_PER_SESSION = int(os.getenv("SESSION_MAX_MESSAGES_PER_SESSION", "200"))
 
-# 기능별 독립적인 세션 저장소
-recommendation_store = {}  # 추천 전용 세션
-gpt_rule_store = {}       # GPT 룰 설명 전용 세션
+recommendation_store = SessionStore("추천", SESSION_MAX_COUNT, SESSION_MAX_MESSAGES, SESSION_TIMEOUT, SESSION_MAX_MESSAGES_PER_SESSION)  # 추천 전용 세션
+gpt_rule_store = SessionStore("GPT 룰", SESSION_MAX_COUNT, SESSION_MAX_MESSAGES, SESSION_TIMEOUT, SESSION_MAX_MESSAGES_PER_SESSION)    # GPT 룰 설명 전용 세션
 
-# 추천 기능용 세션 히스토리
-def get_session_history_for_recommendation(session_id: str) -> InMemoryHistory:
-    if session_id not in recommendation_store:
-        recommendation_store[session_id] = InMemoryHistory()
-    else:
-        recommendation_store[session_id].last_access = time.time()
-    return recommendation_store[session_id]
+# 추천 기능용 세션 히스토리 (토큰 예산 안의 최근 턴만 LLM에 전달)
+def get_session_history_for_recommendation(session_id: str) -> WindowedHistory:
+    return WindowedHistory(recommendation_store.get_or_create(session_id), history_policy)
 
-# GPT 룰 설명용 세션 히스토리
-def get_session_history_for_gpt_rules(session_id: str) -> InMemoryHistory:
+# GPT 룰 설명용 세션 히스토리 (다른 게임의 턴은 잘라내거나 제외)
+def get_session_history_for_gpt_rules(session_id: str, game_name: str = "") -> WindowedHistory:
     if session_id not in gpt_rule_store:
         logger.info(f"🆕 새 GPT 룰 세션 생성: {session_id}")
-        gpt_rule_store[session_id] = InMemoryHistory()
-    else:
-        logger.info(f"🔄 기존 GPT 룰 세션 접근: {session_id} (메시지: {len(gpt_rule_store[session_id].messages)}개)")
-        gpt_rule_store[session_id].last_access = time.time()
-    return gpt_rule_store[session_id]
+    history = gpt_rule_store.get_or_create(session_id)
+    logger.info(f"🔄 GPT 룰 세션 접근: {session_id} (메시지: {len(history.messages)}개)")
+    return WindowedHistory(history, history_policy, game_name or None)
+
+# GPT 룰 체인의 세션 히스토리 키 (세션 ID + 현재 게임)
+GPT_RULE_HISTORY_CONFIG = [
+    ConfigurableFieldSpec(id="session_id", annotation=str, name="Session ID", default="", is_shared=True),
+    ConfigurableFieldSpec(id="game_name", annotation=str, name="Game name", default="", is_shared=True),
+]
 
 
 class RAGService:
     """RAG 기반 게임 추천 및 룰 설명 서비스"""
     
-    def __init__(self):
+    def __init__(self, embedding_service=None):
         logger.info("🔧 RAG 서비스를 초기화합니다...")
         
-        # 임베딩 모델 로드
-        self.embed_model = SentenceTransformer("BAAI/bge-m3", device="cuda")
-        logger.info("✅ 임베딩 모델 로드 완료")
+        # 임베딩 서비스 (파인튜닝 서비스와 공유)
+        self.embedding_service = embedding_service or get_embedding_service()
         
         # OpenAI 설정 (LangChain ChatOpenAI 사용)
         self.openai_api_key = os.getenv("OPENAI_API_KEY")
         self.model_id = "gpt-4o" # 파인튜닝 모델 ID
-        self.llm = ChatOpenAI(model_name=self.model_id, temperature=0.7, openai_api_key=self.openai_api_key)
+        self.llm = ChatOpenAI(model_name=self.model_id, temperature=0.7, openai_api_key=self.openai_api_key, stream_usage=True)
+        
+        # 긴 GPT 룰 세션의 오래된 턴을 백그라운드에서 요약 (응답 경로 밖에서 실행)
+        self.history_compactor = HistoryCompactor(
+            ChatOpenAI(model_name=os.getenv("HISTORY_SUMMARY_MODEL", "gpt-4o-mini"), temperature=0, openai_api_key=self.openai_api_key),
+            threshold_tokens=int(os.getenv("HISTORY_COMPACT_THRESHOLD_TOKENS", "1500")),
+            keep_turns=int(os.getenv("HISTORY_COMPACT_KEEP_TURNS", "2"))
+        )
+        
+        # 히스토리 없는 룰 질문의 의미 기반 답변 캐시 (비슷한 질문이면 GPT 호출 생략)
+        self.semantic_cache = create_semantic_cache("gpt")
+        
+        # 같은 게임 룰 요약 동시 요청 합침 (QR 코드로 여러 명이 같은 게임을 동시에 여는 경우)
+        self.summary_flight = SingleFlight("gpt_rule_summary")
         
         # 세션 관리 설정
-        self.session_timeout = 40 * 60  # 40분 (초 단위)
+        self.session_timeout = SESSION_TIMEOUT  # 기본 40분 (초 단위)
         self.cleanup_interval = 5 * 60  # 5분마다 정리 (초 단위)
         self.cleanup_thread = None
         self.cleanup_running = False
@@ -90,6 +96,9 @@ class RAGService:
         # 게임 룰 데이터 로드
         self._load_game_rules_data()
         
+        # 미리 생성한 룰 요약 (build_rule_summaries.py)
+        self.summary_store = get_summary_store()
+        
         # LangChain 체인 설정
         self._setup_langchain_chains()
         
@@ -106,21 +115,32 @@ class RAGService:
             # 기존 세션 반환
             return session_id
     
+    def create_session(self, session_type: str = "all") -> str:
+        """새 세션 ID 발급 후 대화 저장소에 등록 (LLM 호출 없음)
+        
+        파인튜닝 세션은 히스토리를 저장하지 않으므로 ID만 발급합니다.
+        """
+        session_id = str(uuid.uuid4())
+        
+        if session_type in ["all", "recommendation"]:
+            recommendation_store.get_or_create(session_id)
+        if session_type in ["all", "gpt"]:
+            gpt_rule_store.get_or_create(session_id)
+        
+        logger.info(f"🆕 새 세션 발급: {session_id} ({session_type})")
+        return session_id
+    
     def close_session(self, session_id: str, session_type: str = "all") -> bool:
         """세션 종료 (메모리에서 삭제)"""
-        global recommendation_store, gpt_rule_store
-        
         closed = False
         
         if session_type in ["all", "recommendation"]:
-            if session_id in recommendation_store:
-                del recommendation_store[session_id]
+            if recommendation_store.close(session_id):
                 logger.info(f"🗑️ 추천 세션 종료: {session_id}")
                 closed = True
         
         if session_type in ["all", "gpt"]:
-            if session_id in gpt_rule_store:
-                del gpt_rule_store[session_id]
+            if gpt_rule_store.close(session_id):
                 logger.info(f"🗑️ GPT 룰 세션 종료: {session_id}")
                 closed = True
         
@@ -139,35 +159,16 @@ class RAGService:
     
     def _cleanup_sessions_worker(self):
         """백그라운드에서 실행되는 세션 정리 작업"""
-        global recommendation_store, gpt_rule_store
         while self.cleanup_running:
             try:
-                current_time = time.time()
-                
-                # 추천 세션 정리
-                expired_recommendation_sessions = []
-                for session_id, history in recommendation_store.items():
-                    if current_time - history.last_access > self.session_timeout:
-                        expired_recommendation_sessions.append(session_id)
-                
-                for session_id in expired_recommendation_sessions:
-                    del recommendation_store[session_id]
-                    logger.info(f"⏰ 추천 세션 타임아웃으로 삭제: {session_id}")
+                # 마지막 접근 순서로 정렬되어 있어 만료된 세션만 확인
+                expired_recommendation = recommendation_store.expire()
+                expired_gpt = gpt_rule_store.expire()
                 
-                # GPT 룰 세션 정리
-                expired_gpt_sessions = []
-                for session_id, history in gpt_rule_store.items():
-                    if current_time - history.last_access > self.session_timeout:
-                        expired_gpt_sessions.append(session_id)
-                
-                for session_id in expired_gpt_sessions:
-                    del gpt_rule_store[session_id]
-                    logger.info(f"⏰ GPT 룰 세션 타임아웃으로 삭제: {session_id}")
-                
-                total_expired = len(expired_recommendation_sessions) + len(expired_gpt_sessions)
-                total_active = len(recommendation_store) + len(gpt_rule_store)
+                total_expired = expired_recommendation + expired_gpt
                 
                 if total_expired > 0:
+                    total_active = len(recommendation_store) + len(gpt_rule_store)
                     logger.info(f"🧹 {total_expired}개 세션 정리 완료. 현재 활성 세션: {total_active}개 (추천: {len(recommendation_store)}, GPT룰: {len(gpt_rule_store)})")
                 
                 time.sleep(self.cleanup_interval)
@@ -182,17 +183,16 @@ class RAGService:
             # 게임 추천용 FAISS 인덱스
             index_path = "data/game_index.faiss"
             if os.path.exists(index_path):
-                self.index = faiss.read_index(index_path)
+                self.index = read_faiss_index(index_path)
                 logger.info("✅ 게임 추천 인덱스 로드 완료")
             else:
                 logger.warning("⚠️ 게임 추천 인덱스 파일이 없습니다. 'game_index.faiss' 경로를 확인하세요.")
                 self.index = None
             
-            # 게임 텍스트 데이터
+            # 게임 텍스트 데이터 (texts.bin이 있으면 mmap으로 로드)
             texts_path = "data/texts.json"
             if os.path.exists(texts_path):
-                with open(texts_path, "r", encoding="utf-8") as f:
-                    self.texts = json.load(f)
+                self.texts = load_text_list(texts_path)
                 logger.info("✅ 게임 텍스트 데이터 로드 완료")
             else:
                 logger.warning("⚠️ 게임 텍스트 파일이 없습니다. 'texts.json' 경로를 확인하세요.")
@@ -217,27 +217,19 @@ class RAGService:
     def _load_game_rules_data(self):
         """게임 룰 데이터 로드"""
         try:
-            # 게임 전체 룰 데이터
-            game_data_path = "data/game.json" # 모든 게임의 상세 룰이 담긴 파일
-            if os.path.exists(game_data_path):
-                with open(game_data_path, "r", encoding="utf-8") as f:
-                    self.game_data = json.load(f)
-                logger.info("✅ 게임 룰 데이터 로드 완료")
-            else:
-                logger.warning("⚠️ 게임 룰 파일이 없습니다. 'game.json' 경로를 확인하세요.")
-                self.game_data = []
+            # 게임 전체 룰 데이터 (게임 이름 인덱스, game2.json 덮어쓰기 포함, 프로세스 전역 공유)
+            self.rule_corpus = get_rule_corpus()
             
-            # 게임별 벡터 인덱스 경로 (개별 게임 룰 청크를 위한 폴더)
-            self.game_vector_base_path = "data/game_data/game_data"
+            # 룰 청크 인덱스 (통합 인덱스 또는 게임별 레지스트리, 프로세스 전역 공유)
+            self.rule_index = get_rule_index()
             
         except Exception as e:
             logger.error(f"❌ 게임 룰 데이터 로드 실패: {str(e)}")
-            self.game_data = []
 
     def _setup_langchain_chains(self):
         """LangChain 체인 및 프롬프트 설정"""
         # 게임 추천 프롬프트 (search_similar_context의 결과를 {context}로 받음)
-        recommendation_prompt = ChatPromptTemplate.from_messages([
+        self.recommendation_prompt = ChatPromptTemplate.from_messages([
             (
                 "system",
                 "너는 보드게임 추천 도우미야. 다음은 추천 가능한 게임 설명들이야:\n\n{context}\n\n"
@@ -251,14 +243,14 @@ class RAGService:
 
         # 게임 추천 체인 (RunnableWithMessageHistory로 히스토리 관리)
         self.recommendation_chain = RunnableWithMessageHistory(
-            recommendation_prompt | self.llm,
+            self.recommendation_prompt | self.llm,
             get_session_history=get_session_history_for_recommendation,  # 추천 전용 세션
             input_messages_key="query",  # 사용자의 실제 입력 쿼리
             history_messages_key="history" # 프롬프트의 히스토리 placeholder
         )
 
         # 룰 질문 답변 프롬프트 (룰 청크 검색 결과를 {context}로 받음)
-        rule_question_prompt = ChatPromptTemplate.from_messages([
+        self.rule_question_prompt = ChatPromptTemplate.from_messages([
             (
                  "system",
                     "너는 보드게임 '뱅' 룰 전문 AI야. 반드시 아래 규칙을 따라야 해:\n"
@@ -275,35 +267,37 @@ class RAGService:
 
         # 룰 질문 답변 체인
         self.rule_question_chain = RunnableWithMessageHistory(
-            rule_question_prompt | self.llm,
+            self.rule_question_prompt | self.llm,
             get_session_history=get_session_history_for_gpt_rules,  # GPT 룰 전용 세션
             input_messages_key="question",
-            history_messages_key="history"
+            history_messages_key="history",
+            history_factory_config=GPT_RULE_HISTORY_CONFIG
         )
 
-        # 룰 요약 프롬프트 (전체 룰 텍스트를 {game_rule_text}로 받음)
-        rule_summary_prompt = ChatPromptTemplate.from_messages([
+        # 전체 룰 기반 질문 답변 프롬프트 (세션 히스토리 포함)
+        self.full_rule_prompt = ChatPromptTemplate.from_messages([
             (
-                 "system",
-                    "너는 보드게임 룰 전문 AI야. 반드시 아래 규칙을 따라야 해:\n"
-                    "- 사용자의 질문에 대해 아래 전체 룰 설명에 있는 내용만 기반해서 답변해.\n"
-                    "- 룰 설명에 없는 정보는 절대로 지어내거나 상상하지 마.\n"
-                    "- 사람 이름, 장소, 시간, 인원수 등을 추측하거나 새로 만들어내지 마.\n"
-                    "- 룰 북을 물어보는게 아닌 전략을 물어보면 너는 룰북을 토대로 전략을 짜줘.\n"
+                "system",
+                "너는 보드게임 룰 전문 AI야. 반드시 아래 규칙을 따라야 해:\n"
+                "- 사용자의 질문에 대해 아래 전체 룰 설명에 있는 내용만 기반해서 답변해.\n"
+                "- 룰 설명에 없는 정보는 절대로 지어내거나 상상하지 마.\n"
+                "- 사람 이름, 장소, 시간, 인원수 등을 추측하거나 새로 만들어내지 마.\n"
+                "- 룰 북을 물어보는게 아닌 전략을 물어보면 너는 룰북을 토대로 전략을 짜줘.\n"
             ),
             MessagesPlaceholder(variable_name="history"),
-            ("human", "게임 이름: {game_name}\n\n룰 전체:\n{game_rule_text}\n\n이 게임의 룰을 설명해주세요.")
+            ("human", "아래는 '{game_name}' 보드게임의 전체 룰 설명입니다:\n\n{game_rule_text}\n\n이 룰을 바탕으로 다음 질문에 정확하고 구체적으로 답변해줘:\n\n질문: {question}")
         ])
 
-        # 룰 요약 체인
-        self.rule_summary_chain = RunnableWithMessageHistory(
-            rule_summary_prompt | self.llm,
+        # 전체 룰 기반 질문 답변 체인 (GPT 룰 전용 세션 사용)
+        self.full_rule_chain = RunnableWithMessageHistory(
+            self.full_rule_prompt | self.llm,
             get_session_history=get_session_history_for_gpt_rules,  # GPT 룰 전용 세션
-            input_messages_key="game_name", # 게임 이름이 주 입력값이 됨
-            history_messages_key="history"
+            input_messages_key="question",
+            history_messages_key="history",
+            history_factory_config=GPT_RULE_HISTORY_CONFIG
         )
 
-    def _search_similar_context(self, query, top_k=3):
+    async def _search_similar_context(self, query, top_k=3):
         """
         첫 번째 코드의 search_similar_context 함수와 동일한 RAG 검색 로직.
         쿼리를 임베딩하여 FAISS 인덱스에서 유사한 게임 설명을 찾습니다.
@@ -312,8 +306,8 @@ class RAGService:
             logger.warning("RAG 검색을 위한 인덱스나 텍스트 데이터가 로드되지 않았습니다.")
             return ""
 
-        query_vec = self.embed_model.encode([query], normalize_embeddings=True)
-        D, I = self.index.search(np.array(query_vec), top_k)
+        query_vec = await self.embedding_service.aencode_query(query)
+        D, I = await embedding_executor.run(self.index.search, np.array(query_vec), top_k)
 
         context_blocks = []
         for i in I[0]:
@@ -323,6 +317,12 @@ class RAGService:
                 logger.warning(f"인덱스 {i}에 해당하는 게임 이름 또는 텍스트를 찾을 수 없습니다.")
         return "\n\n".join(context_blocks)
     
+    async def _search_rule_chunks(self, game_name, question, top_k=4, q_vec=None):
+        """게임 룰 청크 검색 (질문 임베딩 + 게임 인덱스 검색, 의미 캐시 조회에서 구한 q_vec가 있으면 재사용)"""
+        if q_vec is None:
+            q_vec = await self.embedding_service.aencode_query(question)
+        return await embedding_executor.run(self.rule_index.search, game_name, q_vec, top_k) or []
+    
     async def recommend_games(self, query: str, session_id: str = "default_session", top_k: int = 3):
         """게임 추천 (RAG 검색 후 LangChain으로 LLM 호출)"""
         try:
@@ -332,7 +332,7 @@ class RAGService:
                 top_k = int(number_match.group(1))
 
             # 1. RAG 검색: query를 기반으로 유사한 게임 설명을 가져옴 (첫 번째 코드의 핵심 로직)
-            context = self._search_similar_context(query, top_k=top_k)
+            context = await self._search_similar_context(query, top_k=top_k)
             
             if not context:
                 return "추천할 게임 데이터를 찾을 수 없습니다. 인덱스나 데이터 로드를 확인해주세요."
@@ -342,6 +342,7 @@ class RAGService:
                 {"query": query, "context": context},
                 config={"configurable": {"session_id": session_id}}
             )
+            history_policy.record_usage("게임 추천", session_id, response)
             
             raw_output = response.content
             
@@ -352,34 +353,46 @@ class RAGService:
             logger.error(f"❌ 게임 추천 실패: {str(e)}")
             return f"게임 추천 중 오류가 발생했습니다: {str(e)}"
     
+    def is_stateless(self, session_id: str) -> bool:
+        """세션에 이전 대화가 없으면 True (의미 캐시 조회/저장 대상)"""
+        history = gpt_rule_store.get(session_id)
+        return history is None or not history.messages
+    
+    def _record_cached_answer(self, session_id: str, game_name: str, question: str, answer: str):
+        """캐시 답변도 세션 히스토리에 남겨 이어지는 질문의 맥락으로 사용 (게임 태그 포함)"""
+        history = get_session_history_for_gpt_rules(session_id, game_name)
+        history.add_messages([HumanMessage(content=question), AIMessage(content=answer)])
+    
     async def answer_rule_question(self, game_name: str, question: str, session_id: str):
         """룰 질문 답변 (룰 청크 검색 후 LangChain으로 LLM 호출)"""
         try:
             # 🔍 세션 히스토리 디버깅 로그 추가
-            if session_id in gpt_rule_store:
-                history = gpt_rule_store[session_id]
+            history = gpt_rule_store.get(session_id)
+            if history is not None:
                 logger.info(f"🧠 세션 {session_id} 기존 메시지 수: {len(history.messages)}")
                 for i, msg in enumerate(history.messages[-3:]):  # 최근 3개만 로그
                     logger.info(f"   - 메시지 {i}: {type(msg).__name__} - {str(msg)[:100]}...")
             else:
                 logger.info(f"🆕 세션 {session_id} 새로 생성됨 (GPT 룰 스토어)")
             
-            # 게임별 벡터 인덱스 로드
-            game_index_path = os.path.join(self.game_vector_base_path, f"{game_name}.faiss")
-            game_chunks_path = os.path.join(self.game_vector_base_path, f"{game_name}.json")
-            
-            if not os.path.exists(game_index_path) or not os.path.exists(game_chunks_path):
+            # 게임 룰 인덱스 확인
+            if not self.rule_index.has_game(game_name):
                 return f"'{game_name}' 게임의 룰 데이터를 찾을 수 없습니다. 해당 게임의 데이터가 올바른 경로에 있는지 확인해주세요."
             
-            # 벡터 인덱스 및 청크 텍스트 로딩
-            index = faiss.read_index(game_index_path)
-            with open(game_chunks_path, "r", encoding="utf-8") as f:
-                chunks = json.load(f)
+            # 이전 대화가 없으면 비슷한 질문의 답변 재사용
+            stateless = self.is_stateless(session_id)
+            q_vec = None
+            if stateless:
+                q_vec = await self.embedding_service.aencode_query(question)
+                cached = self.semantic_cache.lookup(game_name, question, q_vec)
+                if cached is not None:
+                    self._record_cached_answer(session_id, game_name, question, cached)
+                    logger.info(f"✅ 의미 캐시 답변 반환 ({game_name})")
+                    return cached
+            start = time.perf_counter()
             
-            # RAG 검색: 룰 질문에 대한 유사 청크 검색
-            q_vec = self.embed_model.encode([question], normalize_embeddings=True)
-            D, I = index.search(np.array(q_vec), k=4)
-            retrieved_chunks = [chunks[i] for i in I[0] if i < len(chunks)]
+            # RAG 검색: 룰 질문에 대한 유사 청크 검색 (배치 임베딩 + 임베딩 풀에서 검색)
+            retrieved_chunks = await self._search_rule_chunks(game_name, question, top_k=4, q_vec=q_vec)
             
             context = "\n\n".join(retrieved_chunks)
             logger.info(f"🔍 RAG 검색된 컨텍스트 길이: {len(context)} 글자")
@@ -393,60 +406,43 @@ class RAGService:
             logger.info(f"🔗 LangChain 체인 호출 시작 (세션: {session_id})")
             response = await self.rule_question_chain.ainvoke(
                 {"game_name": game_name, "question": question, "context": context},
-                config={"configurable": {"session_id": session_id}}
+                config={"configurable": {"session_id": session_id, "game_name": game_name}}
             )
+            history_policy.record_usage("룰 질문", session_id, response)
+            self.history_compactor.schedule(gpt_rule_store, session_id)
             
             # 🔍 체인 호출 후 세션 상태 재확인
-            if session_id in gpt_rule_store:
-                history_after = gpt_rule_store[session_id]
+            history_after = gpt_rule_store.get(session_id)
+            if history_after is not None:
                 logger.info(f"🧠 체인 호출 후 세션 {session_id} 메시지 수: {len(history_after.messages)}")
             
-            answer = response.content
+            answer = response.content.strip()
             logger.info(f"✅ LangChain 답변 생성 완료 (길이: {len(answer)} 글자)")
-            return answer.strip()
+            if stateless:
+                self.semantic_cache.store(game_name, question, q_vec, answer, time.perf_counter() - start)
+            return answer
             
         except Exception as e:
             logger.error(f"❌ 룰 질문 답변 실패: {str(e)}")
             return f"룰 질문 답변 중 오류가 발생했습니다: {str(e)}"
     
     async def get_rule_summary(self, game_name: str, session_id: str):
-        """게임 룰 요약 (전체 룰 텍스트를 LangChain으로 LLM 호출)"""
+        """게임 룰 요약 (미리 생성한 요약을 메모리에서 제공, 없으면 전체 룰 텍스트)"""
+        return await self.summary_flight.run(game_name, self._get_rule_summary, game_name)
+    
+    async def _get_rule_summary(self, game_name: str):
         try:
             # 게임 정보 찾기
-            game_info = None
-            for game in self.game_data:
-                if game.get("game_name") == game_name:
-                    game_info = game
-                    break
-            
+            game_info = self.rule_corpus.get(game_name)
             if not game_info:
                 return f"'{game_name}' 게임의 전체 룰 정보를 찾을 수 없습니다. 'game.json' 파일을 확인해주세요."
             
             game_rule_text = game_info.get('text', '')
-            
-            if game_name == "뱅":
-                game_data_path = "data/game2.json" # 모든 게임의 상세 룰이 담긴 파일
-                os.path.exists(game_data_path)
-                with open(game_data_path, "r", encoding="utf-8") as f:
-                    self.game_data = json.load(f)
-                logger.info("✅ 게임 룰 데이터 로드 완료")
-                
-                game_info = None
-                for game in self.game_data:
-                    if game.get("game_name") == game_name:
-                        game_info = game
-                        break
-            
-                game_rule_text = game_info.get('text', '')
-            
 
-            # LangChain 체인 호출
-            response = await self.rule_summary_chain.ainvoke(
-                {"game_name": game_name, "game_rule_text": game_rule_text},
-                config={"configurable": {"session_id": session_id}}
-            )
-            
-            summary = game_rule_text
+            # 미리 생성한 요약 사용 (룰 원문이 바뀌었으면 사용하지 않음)
+            summary = self.summary_store.get("gpt", game_name, game_rule_text)
+            if summary is None:
+                summary = game_rule_text
             return summary.strip()
             
         except Exception as e:
@@ -456,7 +452,7 @@ class RAGService:
     async def get_rule_summary_answer(self, game_name: str, question: str, session_id: str):
         """전체 룰을 기반으로 질문에 답변 (LangChain 세션 히스토리 적용)"""
         try:
-            game_info = next((g for g in self.game_data if g.get("game_name") == game_name), None)
+            game_info = self.rule_corpus.get(game_name)
             if not game_info:
                 return f"'{game_name}' 게임의 룰 데이터를 찾을 수 없습니다."
 
@@ -464,33 +460,13 @@ class RAGService:
             if not game_rule_text:
                 return f"'{game_name}' 게임의 룰 텍스트가 없습니다."
 
-            # 전체 룰 기반 질문 답변 프롬프트 (세션 히스토리 포함)
-            full_rule_prompt = ChatPromptTemplate.from_messages([
-                (
-                    "system",
-                    "너는 보드게임 룰 전문 AI야. 반드시 아래 규칙을 따라야 해:\n"
-                    "- 사용자의 질문에 대해 아래 전체 룰 설명에 있는 내용만 기반해서 답변해.\n"
-                    "- 룰 설명에 없는 정보는 절대로 지어내거나 상상하지 마.\n"
-                    "- 사람 이름, 장소, 시간, 인원수 등을 추측하거나 새로 만들어내지 마.\n"
-                    "- 룰 북을 물어보는게 아닌 전략을 물어보면 너는 룰북을 토대로 전략을 짜줘.\n"
-                ),
-                MessagesPlaceholder(variable_name="history"),
-                ("human", "아래는 '{game_name}' 보드게임의 전체 룰 설명입니다:\n\n{game_rule_text}\n\n이 룰을 바탕으로 다음 질문에 정확하고 구체적으로 답변해줘:\n\n질문: {question}")
-            ])
-
-            # 전체 룰 기반 질문 답변 체인 (GPT 룰 전용 세션 사용)
-            full_rule_chain = RunnableWithMessageHistory(
-                full_rule_prompt | self.llm,
-                get_session_history=get_session_history_for_gpt_rules,  # GPT 룰 전용 세션
-                input_messages_key="question",
-                history_messages_key="history"
-            )
-
-            response = await full_rule_chain.ainvoke({
+            response = await self.full_rule_chain.ainvoke({
                 "game_name": game_name,
                 "game_rule_text": game_rule_text,
                 "question": question
-            }, config={"configurable": {"session_id": session_id}})
+            }, config={"configurable": {"session_id": session_id, "game_name": game_name}})
+            history_policy.record_usage("전체 룰 답변", session_id, response)
+            self.history_compactor.schedule(gpt_rule_store, session_id)
             
             return response.content.strip()
             
@@ -499,12 +475,92 @@ class RAGService:
             return f"전체 룰 기반 질문 처리 중 오류가 발생했습니다: {str(e)}"
 
         
+    async def _astream_with_history(self, prompt, inputs, history, human_text, chain_name, session_id):
+        """프롬프트 | LLM 체인을 astream으로 실행 (스트림이 끝까지 완료된 경우에만 세션 히스토리에 저장)"""
+        full = None
+        async for chunk in (prompt | self.llm).astream({**inputs, "history": history.messages}):
+            full = chunk if full is None else full + chunk
+            if chunk.content:
+                yield chunk.content
+        
+        if full is None:
+            return
+        history.add_messages([HumanMessage(content=human_text), AIMessage(content=full.content)])
+        history_policy.record_usage(chain_name, session_id, full)
+    
+    async def astream_recommendation(self, query: str, session_id: str, top_k: int = 3):
+        """게임 추천 스트리밍"""
+        number_match = re.search(r'(\d+)\s*개', query)
+        if number_match:
+            top_k = int(number_match.group(1))
+        
+        context = await self._search_similar_context(query, top_k=top_k)
+        if not context:
+            yield "추천할 게임 데이터를 찾을 수 없습니다. 인덱스나 데이터 로드를 확인해주세요."
+            return
+        
+        history = get_session_history_for_recommendation(session_id)
+        async for text in self._astream_with_history(
+            self.recommendation_prompt, {"query": query, "context": context},
+            history, query, "게임 추천", session_id
+        ):
+            yield text
+    
+    async def astream_rule_answer(self, game_name: str, question: str, session_id: str):
+        """룰 질문 답변 스트리밍 (룰 청크가 없으면 전체 룰 기반 답변)"""
+        if not self.rule_index.has_game(game_name):
+            yield f"'{game_name}' 게임의 룰 데이터를 찾을 수 없습니다. 해당 게임의 데이터가 올바른 경로에 있는지 확인해주세요."
+            return
+        
+        stateless = self.is_stateless(session_id)
+        q_vec = None
+        if stateless:
+            q_vec = await self.embedding_service.aencode_query(question)
+            cached = self.semantic_cache.lookup(game_name, question, q_vec)
+            if cached is not None:
+                self._record_cached_answer(session_id, game_name, question, cached)
+                yield cached
+                return
+        start = time.perf_counter()
+        
+        retrieved_chunks = await self._search_rule_chunks(game_name, question, top_k=4, q_vec=q_vec)
+        context = "\n\n".join(retrieved_chunks)
+        history = get_session_history_for_gpt_rules(session_id, game_name)
+        
+        if context.strip():
+            stream = self._astream_with_history(
+                self.rule_question_prompt, {"game_name": game_name, "question": question, "context": context},
+                history, question, "룰 질문", session_id
+            )
+        else:
+            logger.info(f"RAG 검색 실패. 전체 룰을 기반으로 재시도: {game_name}")
+            game_rule_text = self.rule_corpus.get_text(game_name)
+            if not game_rule_text:
+                yield f"'{game_name}' 게임의 룰 텍스트가 없습니다."
+                return
+            stream = self._astream_with_history(
+                self.full_rule_prompt, {"game_name": game_name, "game_rule_text": game_rule_text, "question": question},
+                history, question, "전체 룰 답변", session_id
+            )
+        
+        answer = ""
+        async for text in stream:
+            answer += text
+            yield text
+        if stateless and context.strip():
+            self.semantic_cache.store(game_name, question, q_vec, answer.strip(), time.perf_counter() - start)
+        self.history_compactor.schedule(gpt_rule_store, session_id)
+    
+    async def astream_rule_summary(self, game_name: str, session_id: str):
+        """룰 요약 스트리밍 (미리 생성한 요약이므로 한 번에 반환)"""
+        yield await self.get_rule_summary(game_name, session_id)
+    
     def get_available_games(self):
         """사용 가능한 게임 목록 반환"""
         if self.game_names:
             return self.game_names
-        elif self.game_data:
-            return [game.get("game_name", "") for game in self.game_data if game.get("game_name")]
+        elif len(self.rule_corpus):
+            return self.rule_corpus.names()
         else:
             # 기본 게임 목록
             return [
@@ -0,0 +1,122 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+
+logger = logging.getLogger(__name__)
+
+# 게임 전체 룰 데이터
+GAME_DATA_PATH = "data/game.json"
+# 일부 게임의 수정된 룰 (OVERRIDE_GAMES에 있는 게임만 game.json보다 우선)
+GAME_DATA_OVERRIDE_PATH = "data/game2.json"
+OVERRIDE_GAMES = ("뱅",)
+
+
+def _read_games(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+class RuleCorpus:
+    """게임 이름 -> 전체 룰 항목 사전 (시작 시 한 번 로드, 두 서비스가 공유)
+
+    우선순위: game2.json의 OVERRIDE_GAMES 항목 > game.json 항목.
+    같은 파일 안에서 이름이 중복되면 처음 나온 항목을 사용합니다.
+    """
+
+    def __init__(self, base_path=GAME_DATA_PATH, override_path=GAME_DATA_OVERRIDE_PATH, override_games=OVERRIDE_GAMES):
+        self.base_path = base_path
+        self.override_path = override_path
+        self.override_games = tuple(override_games)
+        self.games = {}
+        self.overridden = []
+        self.duplicates = 0
+        self.version = ""
+
+        self.load()
+
+    @staticmethod
+    def _index_by_name(games):
+        indexed = {}
+        duplicates = 0
+        for game in games:
+            name = game.get("game_name")
+            if not name:
+                continue
+            if name in indexed:
+                duplicates += 1
+                continue
+            indexed[name] = game
+        return indexed, duplicates
+
+    def load(self):
+        try:
+            if os.path.exists(self.base_path):
+                self.games, self.duplicates = self._index_by_name(_read_games(self.base_path))
+                logger.info(f"✅ 게임 룰 데이터 로드 완료: {len(self.games)}개 게임")
+            else:
+                logger.warning(f"⚠️ 게임 룰 파일이 없습니다. '{self.base_path}' 경로를 확인하세요.")
+                self.games = {}
+
+            self.overridden = []
+            if self.override_games and os.path.exists(self.override_path):
+                overrides, _ = self._index_by_name(_read_games(self.override_path))
+                for name in self.override_games:
+                    if name in overrides:
+                        self.games[name] = overrides[name]
+                        self.overridden.append(name)
+                if self.overridden:
+                    logger.info(f"✅ 수정된 룰 적용: {', '.join(self.overridden)}")
+
+        except Exception as e:
+            logger.error(f"❌ 게임 룰 데이터 로드 실패: {str(e)}")
+            self.games = {}
+
+        self.version = self._compute_version()
+
+    def _compute_version(self):
+        """룰 데이터 버전 (적용된 전체 룰 내용 해시, 답변 캐시 무효화에 사용)"""
+        digest = hashlib.sha256()
+        for name in sorted(self.games):
+            digest.update(json.dumps(self.games[name], ensure_ascii=False, sort_keys=True).encode("utf-8"))
+        return digest.hexdigest()
+
+    def get(self, game_name):
+        """게임 룰 항목 반환 (없으면 None)"""
+        return self.games.get(game_name)
+
+    def get_text(self, game_name):
+        """게임 전체 룰 텍스트 반환 (없으면 빈 문자열)"""
+        game = self.games.get(game_name)
+        return game.get("text", "") if game else ""
+
+    def names(self):
+        return list(self.games.keys())
+
+    def __contains__(self, game_name):
+        return game_name in self.games
+
+    def __len__(self):
+        return len(self.games)
+
+    def get_stats(self):
+        return {
+            "games": len(self.games),
+            "overridden": list(self.overridden),
+            "duplicates_skipped": self.duplicates,
+            "version": self.version[:12],
+        }
+
+
+_rule_corpus = None
+_rule_corpus_lock = threading.Lock()
+
+
+def get_rule_corpus():
+    """프로세스 전역 룰 코퍼스 반환"""
+    global _rule_corpus
+    with _rule_corpus_lock:
+        if _rule_corpus is None:
+            _rule_corpus = RuleCorpus()
+        return _rule_corpus
@@ -0,0 +1,145 @@
+import bisect
+import json
+import logging
+import os
+import threading
+
+import faiss
+import numpy as np
+
+from services.index_registry import game_index_registry
+from services.mmap_store import ChunkTextStore, mmap_enabled, read_faiss_index
+
+logger = logging.getLogger(__name__)
+
+# 통합 룰 청크 인덱스 경로 (build_rule_store.py로 생성)
+RULE_STORE_DIR = "data/rule_store"
+RULE_STORE_INDEX_FILE = "rule_chunks.faiss"
+RULE_STORE_META_FILE = "rule_chunks.json"
+RULE_STORE_CHUNKS_FILE = "rule_chunks.bin"
+RULE_STORE_VERSION = 2
+
+
+class ConsolidatedRuleIndex:
+    """모든 게임의 룰 청크를 하나의 벡터 행렬로 합친 인덱스 (게임별 ID 범위로 검색 제한)"""
+
+    def __init__(self, store_dir=RULE_STORE_DIR):
+        self.store_dir = store_dir
+        index_path = os.path.join(store_dir, RULE_STORE_INDEX_FILE)
+        meta_path = os.path.join(store_dir, RULE_STORE_META_FILE)
+
+        self.index = read_faiss_index(index_path)
+        with open(meta_path, "r", encoding="utf-8") as f:
+            meta = json.load(f)
+
+        if meta.get("version") != RULE_STORE_VERSION:
+            raise ValueError(f"지원하지 않는 통합 인덱스 버전입니다: {meta.get('version')}")
+
+        # 청크 텍스트는 오프셋 인덱스 바이너리에서 mmap으로 읽음 (mmap 비활성화 시 힙에 복사)
+        chunks = ChunkTextStore(os.path.join(store_dir, RULE_STORE_CHUNKS_FILE))
+        self.chunks = chunks if mmap_enabled() else list(chunks)
+        # 게임 이름 -> [시작 ID, 끝 ID)
+        self.game_ranges = {name: tuple(span) for name, span in meta["games"].items()}
+        if self.index.ntotal != len(self.chunks):
+            raise ValueError("통합 인덱스의 벡터 수와 청크 수가 일치하지 않습니다.")
+
+        # ID -> 게임 이름 역조회용 정렬된 시작 ID 목록
+        ordered = sorted(self.game_ranges.items(), key=lambda item: item[1][0])
+        self._range_starts = [span[0] for _, span in ordered]
+        self._range_names = [name for name, _ in ordered]
+
+        # faiss 1.7.3 이상에서만 검색 파라미터로 ID 범위 필터링 가능
+        self._supports_selector = hasattr(faiss, "SearchParameters") and hasattr(faiss, "IDSelectorRange")
+
+        self.searches = 0
+        self.cross_game_searches = 0
+        logger.info(f"✅ 통합 룰 인덱스 로드 완료: {len(self.game_ranges)}개 게임, {self.index.ntotal}개 청크")
+
+    def has_game(self, game_name):
+        return game_name in self.game_ranges
+
+    def game_for_id(self, chunk_id):
+        """청크 ID가 속한 게임 이름 반환"""
+        pos = bisect.bisect_right(self._range_starts, chunk_id) - 1
+        if pos < 0:
+            return None
+        name = self._range_names[pos]
+        start, end = self.game_ranges[name]
+        return name if start <= chunk_id < end else None
+
+    def _search_range(self, query_vec, start, end, top_k):
+        """[start, end) 범위의 벡터 안에서만 내적 검색"""
+        top_k = min(top_k, end - start)
+        if top_k <= 0:
+            return []
+
+        query = np.asarray(query_vec, dtype="float32").reshape(1, -1)
+        if self._supports_selector:
+            params = faiss.SearchParameters(sel=faiss.IDSelectorRange(start, end))
+            D, I = self.index.search(query, top_k, params=params)
+            return [int(i) for i in I[0] if start <= i < end]
+
+        # 구버전 faiss: 게임 범위 벡터만 꺼내서 직접 내적 계산 (게임당 청크 수가 적어 비용이 작음)
+        vectors = self.index.reconstruct_n(start, end - start)
+        scores = vectors @ query[0]
+        order = np.argsort(-scores)[:top_k]
+        return [start + int(i) for i in order]
+
+    def search(self, game_name, query_vec, top_k):
+        """게임 룰 청크 검색, 게임 데이터가 없으면 None"""
+        span = self.game_ranges.get(game_name)
+        if span is None:
+            return None
+        self.searches += 1
+        ids = self._search_range(query_vec, span[0], span[1], top_k)
+        return [self.chunks[i] for i in ids]
+
+    def search_all(self, query_vec, top_k):
+        """전체 게임 대상 검색, (게임 이름, 청크) 목록 반환"""
+        self.cross_game_searches += 1
+        query = np.asarray(query_vec, dtype="float32").reshape(1, -1)
+        D, I = self.index.search(query, top_k)
+        return [(self.game_for_id(int(i)), self.chunks[i]) for i in I[0] if 0 <= i < len(self.chunks)]
+
+    def get_stats(self):
+        return {
+            "mode": "consolidated",
+            "games": len(self.game_ranges),
+            "chunks": int(self.index.ntotal),
+            "searches": self.searches,
+            "cross_game_searches": self.cross_game_searches,
+            "id_selector": self._supports_selector,
+        }
+
+
+_rule_index = None
+_rule_index_lock = threading.Lock()
+
+
+def get_rule_index():
+    """RULE_INDEX_MODE 설정에 따라 통합 인덱스 또는 게임별 레지스트리 반환 (프로세스 전역 공유)
+
+    - consolidated: 통합 인덱스 사용 (없으면 오류)
+    - per_game: 게임별 .faiss 레지스트리 사용
+    - auto (기본값): 통합 인덱스 파일이 있으면 사용, 없으면 게임별 레지스트리
+    """
+    global _rule_index
+    with _rule_index_lock:
+        if _rule_index is not None:
+            return _rule_index
+
+        mode = os.getenv("RULE_INDEX_MODE", "auto")
+        store_dir = os.getenv("RULE_STORE_DIR", RULE_STORE_DIR)
+        store_exists = os.path.exists(os.path.join(store_dir, RULE_STORE_INDEX_FILE))
+
+        if mode == "consolidated" or (mode == "auto" and store_exists):
+            try:
+                _rule_index = ConsolidatedRuleIndex(store_dir)
+            except Exception as e:
+                if mode == "consolidated":
+                    raise
+                logger.warning(f"⚠️ 통합 룰 인덱스 로드 실패, 게임별 인덱스를 사용합니다: {str(e)}")
+                _rule_index = game_index_registry
+        else:
+            _rule_index = game_index_registry
+        return _rule_index
@@ -0,0 +1,201 @@
+import json
+import logging
+import os
+import random
+import threading
+import time
+from collections import deque
+
+import faiss
+import numpy as np
+
+from services.metrics import Histogram
+
+logger = logging.getLogger(__name__)
+
+# 의미 기반 답변 캐시 기본값 (질문 임베딩 코사인 유사도가 임계값 이상이면 저장된 답변 재사용)
+SEMANTIC_CACHE_THRESHOLD = 0.92
+SEMANTIC_CACHE_MAX_PER_GAME = 500
+SEMANTIC_CACHE_SAMPLE_RATE = 0.05
+SEMANTIC_CACHE_SAMPLE_SIZE = 20
+
+# 시작 시 미리 채울 QA 파일 (프론트엔드 `python manage.py export_qa_cache`로 생성)
+SEMANTIC_CACHE_WARM_PATH = "data/qa_warm_cache.json"
+SEMANTIC_CACHE_WARM_VERSION = 1
+SEMANTIC_CACHE_WARM_BATCH_SIZE = 64
+
+
+class _GameEntries:
+    """게임 하나의 질문 벡터 인덱스 (IndexFlatIP, 정규화된 bge-m3 벡터라 내적 = 코사인 유사도)"""
+
+    def __init__(self, dim):
+        self.index = faiss.IndexFlatIP(dim)
+        self.entries = []  # (질문, 답변, 생성 시간 ms) - 인덱스 ID 순서와 동일
+
+
+class SemanticAnswerCache:
+    """게임별 의미 기반 답변 캐시 (프로세스 메모리, 게임당 max_per_game개 초과 시 오래된 항목부터 삭제)
+
+    - 히스토리 없이 생성한 답변만 저장 (이전 대화에 의존하는 답변은 다른 사용자에게 재사용하지 않음)
+    - 적중 중 sample_rate 비율을 (새 질문, 저장된 질문, 유사도) 샘플로 남겨 오적중 여부를 검토
+    - 적중 시 저장된 답변의 원래 생성 시간을 절약한 시간으로 집계
+    """
+
+    def __init__(self, name, threshold=SEMANTIC_CACHE_THRESHOLD, max_per_game=SEMANTIC_CACHE_MAX_PER_GAME,
+                 sample_rate=SEMANTIC_CACHE_SAMPLE_RATE, sample_size=SEMANTIC_CACHE_SAMPLE_SIZE, enabled=True):
+        self.name = name
+        self.threshold = threshold
+        self.max_per_game = max_per_game
+        self.sample_rate = sample_rate
+        self.enabled = enabled
+        self._games = {}
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.warmed = 0
+        self.evictions = 0
+        self.saved_ms = 0.0
+        self.hit_scores = Histogram([0.92, 0.94, 0.96, 0.98, 0.99, 1.0])
+        self.samples = deque(maxlen=sample_size)
+
+    @staticmethod
+    def _as_row(vector):
+        return np.ascontiguousarray(np.asarray(vector, dtype="float32").reshape(1, -1))
+
+    def lookup(self, game_name, question, vector):
+        """유사한 질문의 답변 반환 (없으면 None)"""
+        if not self.enabled:
+            return None
+        with self._lock:
+            game = self._games.get(game_name)
+            if game is None or game.index.ntotal == 0:
+                self.misses += 1
+                return None
+            D, I = game.index.search(self._as_row(vector), 1)
+            score, position = float(D[0][0]), int(I[0][0])
+            if position < 0 or score < self.threshold:
+                self.misses += 1
+                return None
+
+            cached_question, answer, generation_ms = game.entries[position]
+            self.hits += 1
+            self.saved_ms += generation_ms
+            sampled = random.random() < self.sample_rate
+            if sampled:
+                self.samples.append({
+                    "game_name": game_name,
+                    "question": question,
+                    "cached_question": cached_question,
+                    "score": round(score, 4),
+                    "at": time.strftime("%Y-%m-%d %H:%M:%S"),
+                })
+
+        self.hit_scores.observe(score)
+        if sampled:
+            logger.info(f"🧪 의미 캐시 적중 샘플 ({self.name}/{game_name}, {score:.3f}): '{question[:40]}' ≈ '{cached_question[:40]}'")
+        return answer
+
+    def store(self, game_name, question, vector, answer, generation_seconds, warmed=False):
+        """히스토리 없이 생성한 답변 저장 (warmed=True면 시작 시 QA 기록에서 불러온 항목)"""
+        if not self.enabled or not answer:
+            return
+        row = self._as_row(vector)
+        with self._lock:
+            game = self._games.get(game_name)
+            if game is None:
+                game = self._games[game_name] = _GameEntries(row.shape[1])
+            elif game.index.ntotal and game.index.search(row, 1)[0][0][0] >= 0.9999:
+                return  # 같은 질문이 이미 있음 (동시 요청이 합쳐진 경우 등)
+            game.index.add(row)
+            game.entries.append((question, answer, generation_seconds * 1000))
+            if warmed:
+                self.warmed += 1
+            else:
+                self.stores += 1
+
+            overflow = game.index.ntotal - self.max_per_game
+            if overflow > 0:
+                game.index.remove_ids(np.arange(overflow, dtype="int64"))
+                del game.entries[:overflow]
+                self.evictions += overflow
+
+    def get_stats(self):
+        with self._lock:
+            total = self.hits + self.misses
+            stats = {
+                "enabled": self.enabled,
+                "threshold": self.threshold,
+                "games": len(self._games),
+                "entries": sum(game.index.ntotal for game in self._games.values()),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / total, 4) if total else 0.0,
+                "stores": self.stores,
+                "warmed": self.warmed,
+                "evictions": self.evictions,
+                "saved_seconds": round(self.saved_ms / 1000, 1),
+                "avg_saved_ms": round(self.saved_ms / self.hits, 1) if self.hits else 0.0,
+                "samples": list(self.samples),
+            }
+        stats["hit_scores"] = self.hit_scores.snapshot()
+        return stats
+
+
+def create_semantic_cache(name):
+    """환경변수 설정으로 의미 기반 답변 캐시 생성"""
+    return SemanticAnswerCache(
+        name,
+        threshold=float(os.getenv("SEMANTIC_CACHE_THRESHOLD", SEMANTIC_CACHE_THRESHOLD)),
+        max_per_game=int(os.getenv("SEMANTIC_CACHE_MAX_PER_GAME", SEMANTIC_CACHE_MAX_PER_GAME)),
+        sample_rate=float(os.getenv("SEMANTIC_CACHE_SAMPLE_RATE", SEMANTIC_CACHE_SAMPLE_RATE)),
+        enabled=os.getenv("SEMANTIC_CACHE_ENABLED", "1") != "0",
+    )
+
+
+def warm_semantic_caches(caches, embedding_service, path=SEMANTIC_CACHE_WARM_PATH, batch_size=SEMANTIC_CACHE_WARM_BATCH_SIZE):
+    """QA 기록 파일의 질문을 배치로 임베딩해 의미 캐시를 미리 채움 - 채운 항목 수 반환
+
+    파일 구조:
+        {"version": 1, "exported_at": ..., "sources": {"gpt": {게임 이름: [{"q", "a", "n"}, ...]}, "finetuning": {...}}}
+    게임별 목록은 자주 나온 순이며, 캐시 한도 안에서 자주 나온 질문이 가장 늦게 밀려나도록 역순으로 넣습니다.
+    """
+    if not path or not os.path.exists(path):
+        logger.info(f"ℹ️ 의미 캐시 워밍 파일이 없습니다 (생략): {path}")
+        return 0
+
+    start = time.perf_counter()
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != SEMANTIC_CACHE_WARM_VERSION:
+            logger.warning(f"⚠️ 지원하지 않는 의미 캐시 워밍 파일 버전입니다: {data.get('version')}")
+            return 0
+
+        total = 0
+        for source, games in data.get("sources", {}).items():
+            cache = caches.get(source)
+            if cache is None or not cache.enabled:
+                continue
+
+            items = [
+                (game_name, entry)
+                for game_name, entries in games.items()
+                for entry in reversed(entries[:cache.max_per_game])
+            ]
+            for i in range(0, len(items), batch_size):
+                batch = items[i:i + batch_size]
+                questions = [entry["q"] for _, entry in batch]
+                vectors = embedding_service.encode(questions)
+                for (game_name, entry), vector in zip(batch, vectors):
+                    cache.store(game_name, entry["q"], vector, entry["a"], 0.0, warmed=True)
+                    # 같은 질문이 다시 오면 임베딩도 생략
+                    embedding_service.query_cache.put(entry["q"], vector)
+            total += len(items)
+
+        logger.info(f"✅ 의미 캐시 워밍 완료: {total}개 ({time.perf_counter() - start:.1f}초, {data.get('exported_at')} 기준)")
+        return total
+    except Exception as e:
+        logger.error(f"❌ 의미 캐시 워밍 실패 (빈 캐시로 시작): {str(e)}")
+        return 0
@@ -0,0 +1,217 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+
+from langchain_core.chat_history import BaseChatMessageHistory
+from langchain_core.messages import SystemMessage
+
+from services.metrics import Histogram
+
+logger = logging.getLogger(__name__)
+
+
+# 세션 기반 클래스 메모리 정의 (LangChain용)
+class InMemoryHistory(BaseChatMessageHistory):
+    def __init__(self, store=None, session_id=None):
+        self.messages = []
+        self.last_access = time.time()  # 마지막 접근 시간
+        self.session_id = session_id
+        self._store = store  # 메시지 수 집계/한도 적용용 소속 저장소
+        logger.info(f"🧠 새 InMemoryHistory 인스턴스 생성")
+
+    def add_messages(self, messages):
+        logger.info(f"📝 메시지 추가: {len(messages)}개 (기존: {len(self.messages)}개)")
+        if self._store is not None:
+            self._store._add_messages(self, messages)
+        else:
+            self.messages.extend(messages)
+            self.last_access = time.time()  # 접근 시간 업데이트
+        logger.info(f"📝 추가 후 총 메시지: {len(self.messages)}개")
+
+    def clear(self):
+        logger.info(f"🗑️ 메시지 히스토리 클리어 (기존: {len(self.messages)}개)")
+        if self._store is not None:
+            self._store._clear_messages(self)
+        else:
+            self.messages = []
+            self.last_access = time.time()
+
+    def __repr__(self):
+        return f"InMemoryHistory({len(self.messages)} messages)"
+
+
+class SessionStore:
+    """마지막 접근 순서로 정렬된 세션 히스토리 저장소
+
+    - 만료: 가장 오래 접근하지 않은 세션이 맨 앞에 있으므로 앞에서부터 만료된 세션만 꺼냄 (전체 스캔 없음)
+    - 한도: 세션 수(max_sessions), 전체 메시지 수(max_messages)를 넘으면 가장 오래된 세션부터 제거
+    - 세션 하나가 max_messages_per_session(또는 max_messages)을 넘으면 그 세션의 오래된 메시지부터 삭제
+    - 요청 처리 스레드와 정리 스레드가 함께 쓰므로 모든 변경은 잠금 안에서 수행
+    """
+
+    def __init__(self, name, max_sessions=5000, max_messages=100000, ttl_seconds=40 * 60, max_messages_per_session=200):
+        self.name = name
+        self.max_sessions = max_sessions
+        self.max_messages = max_messages
+        self.max_messages_per_session = max_messages_per_session
+        self.ttl_seconds = ttl_seconds
+        self._sessions = OrderedDict()
+        self._lock = threading.RLock()
+        self.total_messages = 0
+
+        # 통계
+        self.created = 0
+        self.closed = 0
+        self.expired = 0
+        self.evicted_sessions = 0  # 세션 수 한도로 제거
+        self.evicted_messages = 0  # 메시지 수 한도로 제거
+        self.trimmed_messages = 0  # 세션 하나가 한도를 넘어 앞에서 잘라낸 메시지 수
+        self.compactions = 0
+        self.compaction_ratio = Histogram([0.05, 0.1, 0.2, 0.3, 0.5, 1.0])  # 요약 토큰 / 원본 토큰
+        self.compaction_ms = Histogram([250, 500, 1000, 2000, 5000, 10000])
+
+    def get_or_create(self, session_id):
+        """세션 히스토리 반환 (없으면 생성, 접근 시간 갱신)"""
+        with self._lock:
+            now = time.time()
+            self._expire(now)
+
+            history = self._sessions.get(session_id)
+            if history is None:
+                history = InMemoryHistory(store=self, session_id=session_id)
+                self._sessions[session_id] = history
+                self.created += 1
+                self._enforce_session_limit()
+            else:
+                self._sessions.move_to_end(session_id)
+            history.last_access = now
+            return history
+
+    def get(self, session_id):
+        """세션 히스토리 조회 (없으면 None, 접근 시간은 갱신하지 않음)"""
+        with self._lock:
+            return self._sessions.get(session_id)
+
+    def close(self, session_id):
+        """세션 삭제"""
+        with self._lock:
+            history = self._sessions.pop(session_id, None)
+            if history is None:
+                return False
+            self._detach(history)
+            self.closed += 1
+            return True
+
+    def expire(self):
+        """만료된 세션 정리 후 삭제 개수 반환"""
+        with self._lock:
+            return self._expire(time.time())
+
+    def _expire(self, now):
+        count = 0
+        while self._sessions:
+            session_id, history = next(iter(self._sessions.items()))
+            if now - history.last_access <= self.ttl_seconds:
+                break
+            self._sessions.popitem(last=False)
+            self._detach(history)
+            count += 1
+            logger.info(f"⏰ {self.name} 세션 타임아웃으로 삭제: {session_id}")
+        self.expired += count
+        return count
+
+    def _evict_oldest(self, keep=None):
+        """가장 오래 접근하지 않은 세션 하나 제거 (keep 세션은 제외)"""
+        for session_id, history in self._sessions.items():
+            if history is not keep:
+                del self._sessions[session_id]
+                self._detach(history)
+                return True
+        return False
+
+    def _enforce_session_limit(self):
+        while len(self._sessions) > self.max_sessions:
+            self._evict_oldest()
+            self.evicted_sessions += 1
+
+    def _detach(self, history):
+        self.total_messages -= len(history.messages)
+        history._store = None
+
+    def _add_messages(self, history, messages):
+        with self._lock:
+            history.messages.extend(messages)
+            history.last_access = time.time()
+            if history._store is not self:
+                return
+            self.total_messages += len(messages)
+            self._sessions.move_to_end(history.session_id)
+
+            # 전체 메시지 한도 초과 시 현재 세션을 제외한 오래된 세션부터 제거
+            while self.total_messages > self.max_messages and self._evict_oldest(keep=history):
+                self.evicted_messages += 1
+
+            # 현재 세션 혼자 한도를 넘으면 오래된 메시지부터 삭제 (질문/답변 쌍이 어긋나지 않도록 짝수 단위)
+            # 맨 앞의 요약 SystemMessage(히스토리 압축 결과)는 남기고 그 뒤의 쌍부터 삭제
+            start = 1 if history.messages and isinstance(history.messages[0], SystemMessage) else 0
+            overflow = len(history.messages) - min(self.max_messages_per_session, self.max_messages)
+            if overflow > 0:
+                overflow = min(overflow + overflow % 2, len(history.messages) - start)
+                del history.messages[start:start + overflow]
+                self.total_messages -= overflow
+                self.trimmed_messages += overflow
+
+    def _clear_messages(self, history):
+        with self._lock:
+            if history._store is self:
+                self.total_messages -= len(history.messages)
+                self._sessions.move_to_end(history.session_id)
+            history.messages = []
+            history.last_access = time.time()
+
+    def replace_prefix(self, history, prefix, summary_message):
+        """히스토리 앞부분(prefix)을 요약 메시지 하나로 교체 (그사이 앞부분이 바뀌었으면 교체하지 않음)"""
+        with self._lock:
+            if history._store is not self or len(history.messages) < len(prefix):
+                return False
+            if any(current is not expected for current, expected in zip(history.messages, prefix)):
+                return False
+            history.messages = [summary_message] + history.messages[len(prefix):]
+            self.total_messages += 1 - len(prefix)
+            return True
+
+    def record_compaction(self, tokens_before, tokens_after, seconds):
+        with self._lock:
+            self.compactions += 1
+        if tokens_before:
+            self.compaction_ratio.observe(tokens_after / tokens_before)
+        self.compaction_ms.observe(seconds * 1000)
+
+    def __contains__(self, session_id):
+        with self._lock:
+            return session_id in self._sessions
+
+    def __len__(self):
+        with self._lock:
+            return len(self._sessions)
+
+    def get_stats(self):
+        with self._lock:
+            return {
+                "sessions": len(self._sessions),
+                "max_sessions": self.max_sessions,
+                "total_messages": self.total_messages,
+                "max_messages": self.max_messages,
+                "max_messages_per_session": self.max_messages_per_session,
+                "ttl_seconds": self.ttl_seconds,
+                "created": self.created,
+                "closed": self.closed,
+                "expired": self.expired,
+                "evicted_sessions": self.evicted_sessions,
+                "evicted_messages": self.evicted_messages,
+                "trimmed_messages": self.trimmed_messages,
+                "compactions": self.compactions,
+                "compaction_ratio": self.compaction_ratio.snapshot(),
+                "compaction_ms": self.compaction_ms.snapshot(),
+            }
@@ -0,0 +1,72 @@
+import asyncio
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+_registry = []
+_registry_lock = threading.Lock()
+
+
+class SingleFlight:
+    """같은 키로 동시에 들어온 비동기 작업을 하나의 태스크로 합침 (결과가 요청자와 무관한 작업에만 사용)
+
+    - 처음 온 요청이 작업을 태스크로 시작하고, 끝나기 전에 온 같은 키 요청은 그 결과를 함께 기다림
+    - 작업은 별도 태스크라 먼저 온 요청의 연결이 끊겨도 기다리는 요청에는 영향 없음
+    - 작업이 끝나면 키를 지우므로 결과를 저장하지는 않음 (캐시는 각 서비스가 담당)
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self._inflight = {}  # 키 -> (태스크, 대기 요청 수)
+
+        self.calls = 0
+        self.executions = 0
+        self.coalesced = 0
+        self.failures = 0
+        self.max_waiters = 0
+
+        with _registry_lock:
+            _registry.append(self)
+
+    async def run(self, key, func, *args, **kwargs):
+        """같은 키 작업이 실행 중이면 그 결과를 기다리고, 아니면 func(*args, **kwargs)를 실행"""
+        self.calls += 1
+        flight = self._inflight.get(key)
+        if flight is None:
+            task = asyncio.ensure_future(func(*args, **kwargs))
+            flight = self._inflight[key] = [task, 0]
+            self.executions += 1
+            task.add_done_callback(lambda done: self._finish(key, done))
+        else:
+            flight[1] += 1
+            self.coalesced += 1
+            self.max_waiters = max(self.max_waiters, flight[1])
+        return await asyncio.shield(flight[0])
+
+    def _finish(self, key, task):
+        flight = self._inflight.pop(key, None)
+        if task.cancelled():
+            return
+        if task.exception() is not None:
+            self.failures += 1
+        elif flight and flight[1]:
+            logger.info(f"🤝 동시 요청 합침 ({self.name}): 1회 실행, {flight[1]}개 요청 대기")
+
+    def get_stats(self):
+        return {
+            "calls": self.calls,
+            "executions": self.executions,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._inflight),
+            "waiting": sum(waiters for _, waiters in self._inflight.values()),
+            "max_waiters": self.max_waiters,
+            "failures": self.failures,
+        }
+
+
+def get_single_flight_stats():
+    """모든 SingleFlight 인스턴스의 합침 통계"""
+    with _registry_lock:
+        flights = list(_registry)
+    return {flight.name: flight.get_stats() for flight in flights}
@@ -0,0 +1,106 @@
+import asyncio
+import json
+import logging
+import threading
+import time
+
+from services.metrics import Histogram
+
+logger = logging.getLogger(__name__)
+
+# SSE 응답 헤더 (프록시 버퍼링 비활성화)
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "X-Accel-Buffering": "no",
+}
+
+
+def sse_event(event, data):
+    """SSE 이벤트 문자열 생성 (data는 JSON)"""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+class StreamMetrics:
+    """스트리밍 엔드포인트별 첫 토큰 시간(TTFT), 전체 시간, 완료/중단/실패 수"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._streams = {}
+
+    def _get(self, name):
+        with self._lock:
+            stats = self._streams.get(name)
+            if stats is None:
+                stats = {
+                    "ttft_ms": Histogram([100, 250, 500, 1000, 2000, 5000, 10000]),
+                    "duration_ms": Histogram([1000, 2500, 5000, 10000, 20000, 40000]),
+                    "started": 0,
+                    "completed": 0,
+                    "aborted": 0,
+                    "failed": 0,
+                }
+                self._streams[name] = stats
+            return stats
+
+    def count(self, name, key):
+        stats = self._get(name)
+        with self._lock:
+            stats[key] += 1
+
+    def observe(self, name, key, seconds):
+        self._get(name)[key].observe(seconds * 1000)
+
+    def get_stats(self):
+        with self._lock:
+            streams = dict(self._streams)
+        return {
+            name: {
+                "started": stats["started"],
+                "completed": stats["completed"],
+                "aborted": stats["aborted"],
+                "failed": stats["failed"],
+                "ttft_ms": stats["ttft_ms"].snapshot(),
+                "duration_ms": stats["duration_ms"].snapshot(),
+            }
+            for name, stats in streams.items()
+        }
+
+
+stream_metrics = StreamMetrics()
+
+
+async def sse_stream(name, session_id, chunks, done_data=None):
+    """텍스트 조각 비동기 제너레이터를 SSE 이벤트로 변환
+
+    이벤트 순서: session -> token (여러 번) -> done, 실패 시 error
+    done_data는 done 이벤트에 함께 보낼 값 (예: 히스토리 없이 답변했는지 여부)
+    """
+    start = time.perf_counter()
+    first_token_at = None
+    stream_metrics.count(name, "started")
+    yield sse_event("session", {"session_id": session_id})
+
+    try:
+        async for text in chunks:
+            if not text:
+                continue
+            if first_token_at is None:
+                first_token_at = time.perf_counter()
+                stream_metrics.observe(name, "ttft_ms", first_token_at - start)
+            yield sse_event("token", {"text": text})
+
+        yield sse_event("done", {"session_id": session_id, **(done_data or {})})
+        stream_metrics.count(name, "completed")
+        stream_metrics.observe(name, "duration_ms", time.perf_counter() - start)
+
+    except (asyncio.CancelledError, GeneratorExit):
+        # 클라이언트 연결 종료 (세션 히스토리는 저장되지 않음)
+        stream_metrics.count(name, "aborted")
+        logger.info(f"🔌 스트리밍 중단 ({name}, 세션: {session_id})")
+        raise
+    except Exception as e:
+        stream_metrics.count(name, "failed")
+        logger.error(f"❌ 스트리밍 오류 ({name}): {str(e)}")
+        yield sse_event("error", {"message": f"응답 생성 중 오류가 발생했습니다: {str(e)}"})
+    finally:
+        await chunks.aclose()
@@ -0,0 +1,86 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+
+logger = logging.getLogger(__name__)
+
+# 미리 생성한 룰 요약 파일 (build_rule_summaries.py로 생성)
+RULE_SUMMARY_PATH = "data/rule_summaries.json"
+RULE_SUMMARY_VERSION = 1
+
+
+def text_hash(text):
+    """룰 원문 변경 감지용 해시"""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class RuleSummaryStore:
+    """게임별 룰 요약을 메모리에서 제공하는 저장소 (원문 해시가 다르면 오래된 요약으로 보고 사용하지 않음)
+
+    파일 구조:
+        {"version": 1, "summaries": {"gpt": {게임 이름: {"source_hash", "summary", "model", "generated_at"}}, "finetuning": {...}}}
+    """
+
+    def __init__(self, path=RULE_SUMMARY_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self.summaries = {}
+
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+
+        self.load()
+
+    def load(self):
+        if not os.path.exists(self.path):
+            logger.warning(f"⚠️ 룰 요약 파일이 없습니다. 'build_rule_summaries.py'로 생성하세요: {self.path}")
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") != RULE_SUMMARY_VERSION:
+                logger.warning(f"⚠️ 지원하지 않는 룰 요약 파일 버전입니다: {data.get('version')}")
+                return
+            self.summaries = data.get("summaries", {})
+            counts = {source: len(entries) for source, entries in self.summaries.items()}
+            logger.info(f"✅ 룰 요약 로드 완료: {counts}")
+        except Exception as e:
+            logger.error(f"❌ 룰 요약 로드 실패: {str(e)}")
+
+    def get(self, source, game_name, rule_text):
+        """요약 반환 (없거나 원문이 바뀐 경우 None)"""
+        entry = self.summaries.get(source, {}).get(game_name)
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+                return None
+            if entry.get("source_hash") != text_hash(rule_text):
+                self.stale += 1
+                return None
+            self.hits += 1
+        return entry.get("summary")
+
+    def get_stats(self):
+        with self._lock:
+            return {
+                "games": {source: len(entries) for source, entries in self.summaries.items()},
+                "hits": self.hits,
+                "misses": self.misses,
+                "stale": self.stale,
+            }
+
+
+_summary_store = None
+_summary_store_lock = threading.Lock()
+
+
+def get_summary_store():
+    """프로세스 전역 룰 요약 저장소 반환"""
+    global _summary_store
+    with _summary_store_lock:
+        if _summary_store is None:
+            _summary_store = RuleSummaryStore(os.getenv("RULE_SUMMARY_PATH", RULE_SUMMARY_PATH))
+        return _summary_store
@@ -64,6 +64,12 @@ python -c "import fastapi, torch, transformers; print('✅ 모든 핵심 패키
     exit 1
 }
 
+# 통합 룰 인덱스 생성 (게임별 인덱스가 있을 때만)
+if [ ! -d "data/rule_store" ] && [ -d "data/game_data/game_data" ]; then
+    echo "🗂️ 통합 룰 인덱스를 생성합니다..."
+    python build_rule_store.py || echo "⚠️ 통합 룰 인덱스 생성 실패 (게임별 인덱스로 계속 진행)"
+fi
+
 echo "=================================================="
 echo "🎉 모든 준비가 완료되었습니다!"
 echo ""
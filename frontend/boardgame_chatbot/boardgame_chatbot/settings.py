@@ -196,6 +196,23 @@ RUNPOD_API_URL = 'https://r8asrxwuomha7r-8000.proxy.runpod.net'
 RUNPOD_API_KEY = None  # 필요시 설정
 RUNPOD_TIMEOUT = 30.0
 RUNPOD_USE_FALLBACK = True
+# Runpod 연결 풀 (프로세스 전역 httpx.Client, keep-alive로 TCP/TLS 핸드셰이크 재사용)
+RUNPOD_MAX_CONNECTIONS = 20
+RUNPOD_MAX_KEEPALIVE_CONNECTIONS = 10
+RUNPOD_KEEPALIVE_EXPIRY = 60.0  # 초
+RUNPOD_HTTP2 = False  # True로 설정 시 h2 패키지 필요 (pip install 'httpx[http2]')
+
+# QA 로그 write-behind 버퍼 (chatbot/services/qa_log_buffer.py)
+QA_LOG_BATCH_SIZE = 50  # 이 개수가 쌓이면 바로 저장
+QA_LOG_FLUSH_INTERVAL = 2.0  # 초, 최대 저장 지연
+QA_LOG_MAX_BACKLOG = 5000  # 저장 대기 한도 (넘으면 버림)
+
+# 홈 화면 게임 순위 캐시 시간 (초)
+GAME_RANKINGS_CACHE_SECONDS = 30
+
+# QA 보관 (python manage.py archive_old_qa)
+QA_ARCHIVE_AFTER_DAYS = 180  # 이보다 오래된 QA를 보관 테이블로 이동
+QA_ARCHIVE_BATCH_SIZE = 1000  # 한 트랜잭션에서 옮기는 행 수
 
 # 보안 설정 (EC2 배포용)
 if IS_EC2:
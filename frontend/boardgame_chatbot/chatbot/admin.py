@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import GPTRuleQA, FinetuningRuleQA
+from .models import GPTRuleQA, FinetuningRuleQA, GameQuestionCounter, ArchivedRuleQA
 
 # Register your models here.
 @admin.register(GPTRuleQA)
@@ -23,3 +23,16 @@ class FinetuningRuleQAAdmin(admin.ModelAdmin):
     def question_preview(self, obj):
         return obj.question[:50] + '...' if len(obj.question) > 50 else obj.question
     question_preview.short_description = '질문'
+
+@admin.register(GameQuestionCounter)
+class GameQuestionCounterAdmin(admin.ModelAdmin):
+    list_display = ['game_name', 'total_count', 'gpt_count', 'ft_count', 'updated_at']
+    search_fields = ['game_name']
+    ordering = ['-total_count']
+
+@admin.register(ArchivedRuleQA)
+class ArchivedRuleQAAdmin(admin.ModelAdmin):
+    list_display = ['id', 'source', 'original_id', 'game_name', 'created_at', 'archived_at']
+    list_filter = ['source', 'game_name']
+    search_fields = ['game_name', 'question', 'answer']
+    ordering = ['-created_at']
@@ -0,0 +1,56 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from chatbot.models import ArchivedRuleQA
+
+
+class Command(BaseCommand):
+    help = '오래된 룰 QA를 보관 테이블로 배치 이동 (원본 테이블을 작게 유지, 통계는 보관 포함)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days',
+            type=int,
+            default=getattr(settings, 'QA_ARCHIVE_AFTER_DAYS', 180),
+            help='이 일수보다 오래된 QA를 이동 (기본값: QA_ARCHIVE_AFTER_DAYS)'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=getattr(settings, 'QA_ARCHIVE_BATCH_SIZE', 1000),
+            help='한 트랜잭션에서 옮길 행 수 (기본값: QA_ARCHIVE_BATCH_SIZE)'
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='옮길 행 수만 출력하고 이동하지 않음'
+        )
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(days=options['days'])
+        batch_size = options['batch_size']
+        self.stdout.write(f"📦 {cutoff:%Y-%m-%d %H:%M} 이전 QA 보관 (배치 {batch_size}개)")
+
+        total = 0
+        for source, label in ArchivedRuleQA.SOURCE_CHOICES:
+            if options['dry_run']:
+                count = ArchivedRuleQA.source_model(source).objects.filter(created_at__lt=cutoff).count()
+                self.stdout.write(f"🔍 {label} QA: {count}개 이동 예정")
+                total += count
+                continue
+
+            moved = 0
+            while True:
+                count = ArchivedRuleQA.archive_batch(source, cutoff, batch_size)
+                if not count:
+                    break
+                moved += count
+                self.stdout.write(f"   {label} QA {moved}개 이동...")
+            self.stdout.write(f"✅ {label} QA: {moved}개 이동")
+            total += moved
+
+        self.stdout.write(
+            self.style.SUCCESS(f"🎉 보관 {'예정' if options['dry_run'] else '완료'}: 총 {total}개")
+        )
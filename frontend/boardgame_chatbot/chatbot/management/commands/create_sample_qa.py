@@ -1,5 +1,5 @@
 from django.core.management.base import BaseCommand
-from chatbot.models import GPTRuleQA, FinetuningRuleQA
+from chatbot.models import GPTRuleQA, FinetuningRuleQA, GameQuestionCounter
 import random
 
 class Command(BaseCommand):
@@ -90,6 +90,9 @@ class Command(BaseCommand):
             )
             created_ft += 1
         
+        # 직접 생성한 QA 행은 카운터에 반영되지 않으므로 게임 순위 카운터 재계산
+        GameQuestionCounter.reconcile()
+        
         self.stdout.write(
             self.style.SUCCESS(
                 f'성공적으로 샘플 데이터를 생성했습니다!\n'
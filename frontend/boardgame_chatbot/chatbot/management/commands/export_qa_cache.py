@@ -0,0 +1,103 @@
+import json
+import os
+from itertools import chain
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from chatbot.models import GPTRuleQA, FinetuningRuleQA, ArchivedRuleQA
+
+# 백엔드 의미 캐시 워밍 파일 버전 (backend services/semantic_cache.py와 맞춤)
+QA_CACHE_EXPORT_VERSION = 1
+
+# 오류/안내 메시지는 캐시하지 않음 (폴백/오류 응답은 저장 시점에 제외하며, 이전에 저장된 행을 위해 함께 거름)
+ERROR_MARKERS = (
+    '오류가 발생했습니다',
+    '모델이 로드되지 않았습니다',
+    '답변을 생성할 수 없습니다',
+    '찾을 수 없습니다',
+    'AI 서버 연결 불가',
+    '일시적인 문제가 발생했습니다',
+    '현재 지원하지 않습니다',
+)
+
+
+class Command(BaseCommand):
+    help = 'QA 기록(보관 포함)을 백엔드 의미 캐시 워밍용 파일로 내보내기 (이전 대화 없이 답변한 QA만, 게임별 자주 나온 질문 순)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--output',
+            default='qa_warm_cache.json',
+            help='내보낼 파일 경로 (백엔드 data/qa_warm_cache.json으로 복사, 기본값: qa_warm_cache.json)'
+        )
+        parser.add_argument(
+            '--per-game',
+            type=int,
+            default=50,
+            help='게임별 최대 질문 수 (기본값: 50)'
+        )
+        parser.add_argument(
+            '--min-count',
+            type=int,
+            default=1,
+            help='이 횟수 이상 나온 질문만 내보내기 (기본값: 1)'
+        )
+
+    def handle(self, *args, **options):
+        sources = {
+            'gpt': (GPTRuleQA, ArchivedRuleQA.SOURCE_GPT),
+            'finetuning': (FinetuningRuleQA, ArchivedRuleQA.SOURCE_FINETUNING),
+        }
+
+        exported = {}
+        for source, (model, archive_source) in sources.items():
+            games = self._collect(model, archive_source, options['per_game'], options['min_count'])
+            exported[source] = games
+            count = sum(len(entries) for entries in games.values())
+            self.stdout.write(f"📦 {source}: {len(games)}개 게임, {count}개 질문")
+
+        output = options['output']
+        directory = os.path.dirname(output)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(output, 'w', encoding='utf-8') as f:
+            json.dump({
+                'version': QA_CACHE_EXPORT_VERSION,
+                'exported_at': timezone.now().isoformat(),
+                'sources': exported,
+            }, f, ensure_ascii=False, separators=(',', ':'))
+
+        self.stdout.write(
+            self.style.SUCCESS(f'🎉 내보내기 완료: {output} ({os.path.getsize(output) // 1024}KB)')
+        )
+
+    def _collect(self, model, archive_source, per_game, min_count):
+        """게임별 (질문 -> 최신 답변, 횟수) 집계 후 자주 나온 순으로 상위 per_game개
+
+        이전 대화에 기대는 답변("그럼 그 다음은?" 등)은 다른 사용자에게 맞지 않으므로
+        의미 캐시와 같은 기준으로 stateless 행만 사용합니다.
+        """
+        fields = ('game_name', 'question', 'answer')
+        # 보관 행이 더 오래됐으므로 먼저 읽고, 같은 질문은 최신 답변으로 덮어씀
+        rows = chain(
+            ArchivedRuleQA.objects.filter(source=archive_source, stateless=True).order_by('created_at').values_list(*fields).iterator(chunk_size=2000),
+            model.objects.filter(stateless=True).order_by('created_at').values_list(*fields).iterator(chunk_size=2000),
+        )
+
+        groups = {}
+        for game_name, question, answer in rows:
+            question = question.strip()
+            answer = answer.strip()
+            if not question or not answer or any(marker in answer for marker in ERROR_MARKERS):
+                continue
+            key = ' '.join(question.lower().split())
+            entry = groups.setdefault(game_name, {}).setdefault(key, {'q': question, 'a': answer, 'n': 0})
+            entry['a'] = answer
+            entry['n'] += 1
+
+        games = {}
+        for game_name, entries in groups.items():
+            frequent = [entry for entry in entries.values() if entry['n'] >= min_count]
+            if frequent:
+                games[game_name] = sorted(frequent, key=lambda entry: entry['n'], reverse=True)[:per_game]
+        return games
@@ -1,5 +1,5 @@
 from django.core.management.base import BaseCommand
-from chatbot.models import GPTRuleQA, FinetuningRuleQA
+from chatbot.models import GPTRuleQA, FinetuningRuleQA, GameQuestionCounter
 
 class Command(BaseCommand):
     help = 'QA 데이터베이스에 샘플 데이터를 추가합니다'
@@ -85,6 +85,9 @@ class Command(BaseCommand):
             if created:
                 self.stdout.write(f'파인튜닝 QA 추가: {ft_qa.game_name} - {ft_qa.question[:30]}...')
         
+        # 직접 생성한 QA 행은 카운터에 반영되지 않으므로 게임 순위 카운터 재계산
+        GameQuestionCounter.reconcile()
+        
         self.stdout.write(
             self.style.SUCCESS('샘플 데이터 추가가 완료되었습니다!')
         )
@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand
+from chatbot.models import GameQuestionCounter
+
+
+class Command(BaseCommand):
+    help = 'QA 테이블 집계로 게임별 질문 수 카운터를 채우거나 다시 맞춤 (최초 배포 시 백필용, 홈 화면 반영은 캐시 만료 후)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--top',
+            type=int,
+            default=10,
+            help='재계산 후 출력할 상위 게임 수 (기본값: 10)'
+        )
+
+    def handle(self, *args, **options):
+        created, updated, deleted = GameQuestionCounter.reconcile()
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'🔄 게임 카운터 재계산 완료 (생성 {created}개, 수정 {updated}개, 삭제 {deleted}개)'
+            )
+        )
+
+        for rank, game in enumerate(GameQuestionCounter.get_rankings(limit=options['top']), start=1):
+            self.stdout.write(
+                f"{rank}. {game['game_name']}: {game['total_count']}개 "
+                f"(GPT {game['gpt_count']}, 파인튜닝 {game['ft_count']})"
+            )
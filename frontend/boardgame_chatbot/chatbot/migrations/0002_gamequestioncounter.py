@@ -0,0 +1,29 @@
+# Generated by Django 4.2.7 on 2026-10-17 20:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('chatbot', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='GameQuestionCounter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('game_name', models.CharField(max_length=100, unique=True, verbose_name='게임 이름')),
+                ('gpt_count', models.PositiveIntegerField(default=0, verbose_name='GPT 질문 수')),
+                ('ft_count', models.PositiveIntegerField(default=0, verbose_name='파인튜닝 질문 수')),
+                ('total_count', models.PositiveIntegerField(db_index=True, default=0, verbose_name='총 질문 수')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='수정 시간')),
+            ],
+            options={
+                'verbose_name': '게임별 질문 수',
+                'verbose_name_plural': '게임별 질문 수',
+                'ordering': ['-total_count'],
+            },
+        ),
+    ]
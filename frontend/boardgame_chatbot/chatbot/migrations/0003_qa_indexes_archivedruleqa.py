@@ -0,0 +1,55 @@
+# Generated by Django 4.2.7 on 2026-10-17 20:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('chatbot', '0002_gamequestioncounter'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedRuleQA',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('source', models.CharField(choices=[('gpt', 'GPT'), ('ft', '파인튜닝')], max_length=10, verbose_name='출처')),
+                ('original_id', models.BigIntegerField(verbose_name='원본 번호')),
+                ('game_name', models.CharField(max_length=100, verbose_name='게임 이름')),
+                ('question', models.TextField(verbose_name='질문 내용')),
+                ('answer', models.TextField(verbose_name='답변 내용')),
+                ('created_at', models.DateTimeField(verbose_name='생성 시간')),
+                ('archived_at', models.DateTimeField(auto_now_add=True, verbose_name='보관 시간')),
+            ],
+            options={
+                'verbose_name': '보관된 룰 QA',
+                'verbose_name_plural': '보관된 룰 QA들',
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='finetuningruleqa',
+            index=models.Index(fields=['-created_at'], name='ftqa_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='finetuningruleqa',
+            index=models.Index(fields=['game_name', 'created_at'], name='ftqa_game_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='gptruleqa',
+            index=models.Index(fields=['-created_at'], name='gptqa_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='gptruleqa',
+            index=models.Index(fields=['game_name', 'created_at'], name='gptqa_game_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='archivedruleqa',
+            index=models.Index(fields=['source', 'game_name'], name='archivedqa_source_game_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='archivedruleqa',
+            constraint=models.UniqueConstraint(fields=('source', 'original_id'), name='archivedqa_source_original_uniq'),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 4.2.7 on 2026-10-17 21:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('chatbot', '0003_qa_indexes_archivedruleqa'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='archivedruleqa',
+            name='stateless',
+            field=models.BooleanField(default=False, verbose_name='이전 대화 없이 답변'),
+        ),
+        migrations.AddField(
+            model_name='finetuningruleqa',
+            name='stateless',
+            field=models.BooleanField(default=False, verbose_name='이전 대화 없이 답변'),
+        ),
+        migrations.AddField(
+            model_name='gptruleqa',
+            name='stateless',
+            field=models.BooleanField(default=False, verbose_name='이전 대화 없이 답변'),
+        ),
+    ]
@@ -1,5 +1,10 @@
-from django.db import models
-from django.db.models import Count
+from collections import Counter
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import IntegrityError, models, transaction
+from django.db.models import Count, F
+from django.utils import timezone
 
 # Create your models here.
 class GPTRuleQA(models.Model):
@@ -8,12 +13,17 @@ class GPTRuleQA(models.Model):
     game_name = models.CharField('게임 이름', max_length=100)
     question = models.TextField('질문 내용')
     answer = models.TextField('답변 내용')
+    stateless = models.BooleanField('이전 대화 없이 답변', default=False)  # 의미 캐시 워밍 대상 (이전 기록은 False)
     created_at = models.DateTimeField('생성 시간', auto_now_add=True)
     
     class Meta:
         verbose_name = 'GPT 룰 QA'
         verbose_name_plural = 'GPT 룰 QA들'
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['-created_at'], name='gptqa_created_idx'),  # 최신순 목록
+            models.Index(fields=['game_name', 'created_at'], name='gptqa_game_created_idx'),  # 게임별 집계/조회
+        ]
     
     def __str__(self):
         return f"{self.id}: {self.game_name} - {self.question[:30]}"
@@ -32,12 +42,17 @@ class FinetuningRuleQA(models.Model):
     game_name = models.CharField('게임 이름', max_length=100)
     question = models.TextField('질문 내용')
     answer = models.TextField('답변 내용')
+    stateless = models.BooleanField('이전 대화 없이 답변', default=False)  # 의미 캐시 워밍 대상 (이전 기록은 False)
     created_at = models.DateTimeField('생성 시간', auto_now_add=True)
     
     class Meta:
         verbose_name = '파인튜닝 룰 QA'
         verbose_name_plural = '파인튜닝 룰 QA들'
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['-created_at'], name='ftqa_created_idx'),  # 최신순 목록
+            models.Index(fields=['game_name', 'created_at'], name='ftqa_game_created_idx'),  # 게임별 집계/조회
+        ]
     
     def __str__(self):
         return f"{self.id}: {self.game_name} - {self.question[:30]}"
@@ -50,45 +65,187 @@ class FinetuningRuleQA(models.Model):
         ).order_by('-question_count')[:limit]
 
 
-# 통합 게임 순위 조회 함수
-def get_combined_game_rankings(limit=10):
-    """GPT와 파인튜닝 QA를 합쳐서 게임별 질문 수 순위를 반환"""
-    from django.db.models import Value
-    from django.db.models.functions import Coalesce
-    
-    # GPT QA에서 게임별 질문 수
-    gpt_rankings = GPTRuleQA.objects.values('game_name').annotate(
-        gpt_count=Count('id')
-    )
-    
-    # 파인튜닝 QA에서 게임별 질문 수  
-    ft_rankings = FinetuningRuleQA.objects.values('game_name').annotate(
-        ft_count=Count('id')
-    )
-    
-    # 모든 게임 이름 수집
-    all_games = set()
-    gpt_data = {item['game_name']: item['gpt_count'] for item in gpt_rankings}
-    ft_data = {item['game_name']: item['ft_count'] for item in ft_rankings}
-    
-    all_games.update(gpt_data.keys())
-    all_games.update(ft_data.keys())
-    
-    # 통합 순위 계산
-    combined_rankings = []
-    for game in all_games:
-        gpt_count = gpt_data.get(game, 0)
-        ft_count = ft_data.get(game, 0)
-        total_count = gpt_count + ft_count
+class ArchivedRuleQA(models.Model):
+    """오래된 룰 QA 보관 테이블 - GPT/파인튜닝 QA를 한 테이블에 모아 원본 테이블을 작게 유지
+    
+    `python manage.py archive_old_qa`로 일정 기간이 지난 행을 배치 단위로 옮깁니다.
+    통계(질문 수, 게임별 집계)는 원본 + 보관 테이블을 합산합니다.
+    """
+    SOURCE_GPT = 'gpt'
+    SOURCE_FINETUNING = 'ft'
+    SOURCE_CHOICES = [
+        (SOURCE_GPT, 'GPT'),
+        (SOURCE_FINETUNING, '파인튜닝'),
+    ]
+    
+    source = models.CharField('출처', max_length=10, choices=SOURCE_CHOICES)
+    original_id = models.BigIntegerField('원본 번호')
+    game_name = models.CharField('게임 이름', max_length=100)
+    question = models.TextField('질문 내용')
+    answer = models.TextField('답변 내용')
+    stateless = models.BooleanField('이전 대화 없이 답변', default=False)
+    created_at = models.DateTimeField('생성 시간')
+    archived_at = models.DateTimeField('보관 시간', auto_now_add=True)
+    
+    class Meta:
+        verbose_name = '보관된 룰 QA'
+        verbose_name_plural = '보관된 룰 QA들'
+        ordering = ['-created_at']
+        constraints = [
+            models.UniqueConstraint(fields=['source', 'original_id'], name='archivedqa_source_original_uniq'),
+        ]
+        indexes = [
+            models.Index(fields=['source', 'game_name'], name='archivedqa_source_game_idx'),
+        ]
+    
+    def __str__(self):
+        return f"[{self.source}] {self.original_id}: {self.game_name} - {self.question[:30]}"
+    
+    @classmethod
+    def source_model(cls, source):
+        """출처 코드에 해당하는 원본 QA 모델"""
+        return {cls.SOURCE_GPT: GPTRuleQA, cls.SOURCE_FINETUNING: FinetuningRuleQA}[source]
+    
+    @classmethod
+    def archive_batch(cls, source, cutoff, batch_size=1000):
+        """cutoff 이전에 생성된 원본 QA를 최대 batch_size개 옮기고 옮긴 개수 반환 (한 트랜잭션)"""
+        model = cls.source_model(source)
+        with transaction.atomic():
+            rows = list(
+                model.objects.filter(created_at__lt=cutoff)
+                .order_by('created_at', 'id')
+                .select_for_update()[:batch_size]
+            )
+            if not rows:
+                return 0
+            
+            cls.objects.bulk_create(
+                [
+                    cls(
+                        source=source,
+                        original_id=row.id,
+                        game_name=row.game_name,
+                        question=row.question,
+                        answer=row.answer,
+                        stateless=row.stateless,
+                        created_at=row.created_at,
+                    )
+                    for row in rows
+                ],
+                ignore_conflicts=True
+            )
+            model.objects.filter(id__in=[row.id for row in rows]).delete()
+        return len(rows)
+    
+    @classmethod
+    def count_by_game(cls, source):
+        """출처별 게임당 보관된 질문 수"""
+        return dict(cls.objects.filter(source=source).values_list('game_name').annotate(count=Count('id')))
+
+
+def count_questions_by_game(source):
+    """원본 + 보관 테이블을 합친 게임별 질문 수 (출처: 'gpt' / 'ft')"""
+    model = ArchivedRuleQA.source_model(source)
+    counts = Counter(dict(model.objects.values_list('game_name').annotate(count=Count('id'))))
+    counts.update(ArchivedRuleQA.count_by_game(source))
+    return counts
+
+
+class GameQuestionCounter(models.Model):
+    """게임별 질문 수 카운터 - QA 저장 시 함께 증가 (홈 화면 순위용)
+    
+    QA 테이블 전체를 집계하지 않고 이 테이블에서 total_count 순으로 상위 N개만 읽습니다.
+    값이 어긋나면 `python manage.py reconcile_game_counters`로 QA 테이블 기준으로 다시 맞춥니다.
+    """
+    game_name = models.CharField('게임 이름', max_length=100, unique=True)
+    gpt_count = models.PositiveIntegerField('GPT 질문 수', default=0)
+    ft_count = models.PositiveIntegerField('파인튜닝 질문 수', default=0)
+    total_count = models.PositiveIntegerField('총 질문 수', default=0, db_index=True)
+    updated_at = models.DateTimeField('수정 시간', auto_now=True)
+    
+    class Meta:
+        verbose_name = '게임별 질문 수'
+        verbose_name_plural = '게임별 질문 수'
+        ordering = ['-total_count']
+    
+    def __str__(self):
+        return f"{self.game_name}: {self.total_count}"
+    
+    @classmethod
+    def increment(cls, game_name, gpt=0, ft=0):
+        """게임 카운터를 원자적으로 증가 (DB에서 F 표현식으로 더함, 없으면 생성)"""
+        updated = cls.objects.filter(game_name=game_name).update(
+            gpt_count=F('gpt_count') + gpt,
+            ft_count=F('ft_count') + ft,
+            total_count=F('total_count') + gpt + ft,
+            updated_at=timezone.now()
+        )
+        if updated:
+            return
         
-        combined_rankings.append({
-            'game_name': game,
-            'total_count': total_count,
-            'gpt_count': gpt_count,
-            'ft_count': ft_count
-        })
+        try:
+            with transaction.atomic():
+                cls.objects.create(game_name=game_name, gpt_count=gpt, ft_count=ft, total_count=gpt + ft)
+        except IntegrityError:
+            # 다른 요청이 먼저 생성한 경우 다시 증가
+            cls.increment(game_name, gpt, ft)
     
-    # 총 질문 수로 정렬
-    combined_rankings.sort(key=lambda x: x['total_count'], reverse=True)
+    @classmethod
+    def record_questions(cls, model, objects):
+        """저장된 QA 행들을 게임별로 묶어 카운터 증가 (QA 로그 버퍼가 같은 트랜잭션에서 호출)"""
+        for game_name, count in Counter(obj.game_name for obj in objects).items():
+            if model is GPTRuleQA:
+                cls.increment(game_name, gpt=count)
+            elif model is FinetuningRuleQA:
+                cls.increment(game_name, ft=count)
+    
+    @classmethod
+    def get_rankings(cls, limit=10):
+        """총 질문 수 상위 N개 게임 (total_count 인덱스 조회)"""
+        return list(
+            cls.objects.filter(total_count__gt=0)
+            .order_by('-total_count')
+            .values('game_name', 'total_count', 'gpt_count', 'ft_count')[:limit]
+        )
     
-    return combined_rankings[:limit]
+    @classmethod
+    def reconcile(cls):
+        """QA 테이블(보관 포함) 집계 결과로 카운터를 다시 맞춤 - (생성, 수정, 삭제) 개수 반환"""
+        gpt_data = count_questions_by_game(ArchivedRuleQA.SOURCE_GPT)
+        ft_data = count_questions_by_game(ArchivedRuleQA.SOURCE_FINETUNING)
+        all_games = set(gpt_data) | set(ft_data)
+        
+        created = updated = 0
+        with transaction.atomic():
+            existing = {counter.game_name: counter for counter in cls.objects.select_for_update()}
+            
+            for game_name in all_games:
+                gpt_count = gpt_data.get(game_name, 0)
+                ft_count = ft_data.get(game_name, 0)
+                counter = existing.get(game_name)
+                
+                if counter is None:
+                    cls.objects.create(game_name=game_name, gpt_count=gpt_count, ft_count=ft_count, total_count=gpt_count + ft_count)
+                    created += 1
+                elif (counter.gpt_count, counter.ft_count, counter.total_count) != (gpt_count, ft_count, gpt_count + ft_count):
+                    counter.gpt_count = gpt_count
+                    counter.ft_count = ft_count
+                    counter.total_count = gpt_count + ft_count
+                    counter.save(update_fields=['gpt_count', 'ft_count', 'total_count', 'updated_at'])
+                    updated += 1
+            
+            stale = [game_name for game_name in existing if game_name not in all_games]
+            deleted, _ = cls.objects.filter(game_name__in=stale).delete()
+        
+        return created, updated, deleted
+
+
+# 통합 게임 순위 조회 함수
+def get_combined_game_rankings(limit=10):
+    """GPT와 파인튜닝 QA를 합친 게임별 질문 수 순위 (카운터 테이블 조회, 짧게 캐시)"""
+    cache_key = f'game_rankings:{limit}'
+    rankings = cache.get(cache_key)
+    if rankings is None:
+        rankings = GameQuestionCounter.get_rankings(limit)
+        cache.set(cache_key, rankings, getattr(settings, 'GAME_RANKINGS_CACHE_SECONDS', 30))
+    return rankings
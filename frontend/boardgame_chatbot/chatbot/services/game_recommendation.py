@@ -1,4 +1,5 @@
 import logging
+import uuid
 from django.conf import settings
 from .runpod_client import RunpodClient
 
@@ -22,41 +23,78 @@ class GameRecommendationService:
             # Runpod 백엔드로 요청
             logger.info(f"🎮 게임 추천 요청: {query} (추천 세션: {session_id})")
             result = self.runpod_client.sync_recommend_games(query, session_id)
-            
-            # 세션 ID 처리: 백엔드에서 받은 session_id 사용
-            actual_session_id = result.get('session_id', session_id)
-            logger.info(f"✅ 게임 추천 완료 (추천 세션: {actual_session_id})")
-            
+            return self._build_recommendation(result, session_id)
+        except Exception as e:
+            return self._recommendation_error(e, query, session_id)
+    
+    async def async_recommend_games(self, query, session_id=""):
+        """게임 추천 메인 함수 - 비동기 버전 (추천 전용 세션)"""
+        try:
+            logger.info(f"🎮 게임 추천 요청: {query} (추천 세션: {session_id})")
+            result = await self.runpod_client.async_recommend_games(query, session_id)
+            return self._build_recommendation(result, session_id)
+        except Exception as e:
+            return self._recommendation_error(e, query, session_id)
+    
+    def _build_recommendation(self, result, session_id):
+        # 세션 ID 처리: 백엔드에서 받은 session_id 사용
+        actual_session_id = result.get('session_id', session_id)
+        logger.info(f"✅ 게임 추천 완료 (추천 세션: {actual_session_id})")
+        
+        return {
+            'response': result.get('response', '추천을 가져올 수 없습니다.'),
+            'session_id': actual_session_id,
+            'session_type': 'recommendation'
+        }
+    
+    def _recommendation_error(self, e, query, session_id):
+        logger.error(f"❌ 게임 추천 실패: {str(e)}")
+        
+        # 폴백 옵션이 활성화된 경우 기본 응답 제공
+        if self.use_fallback:
+            fallback_response = self._get_fallback_recommendation(query)
+            return {
+                'response': fallback_response,
+                'session_id': session_id,
+                'session_type': 'recommendation'
+            }
+        else:
             return {
-                'response': result.get('response', '추천을 가져올 수 없습니다.'),
-                'session_id': actual_session_id,
+                'response': f"게임 추천 서비스에 일시적인 문제가 발생했습니다: {str(e)}",
+                'session_id': session_id,
                 'session_type': 'recommendation'
             }
-            
+    
+    async def async_create_session(self, session_type='recommendation'):
+        """세션 발급 (LLM 호출 없음) - 백엔드 연결 실패 시 로컬에서 UUID 발급
+        
+        백엔드는 처음 보는 세션 ID도 첫 요청 때 등록하므로 로컬 UUID도 그대로 사용할 수 있습니다.
+        """
+        try:
+            result = await self.runpod_client.async_create_session(session_type)
+            logger.info(f"🆕 추천 세션 발급: {result['session_id']}")
+            return result['session_id']
         except Exception as e:
-            logger.error(f"❌ 게임 추천 실패: {str(e)}")
-            
-            # 폴백 옵션이 활성화된 경우 기본 응답 제공
-            if self.use_fallback:
-                fallback_response = self._get_fallback_recommendation(query)
-                return {
-                    'response': fallback_response,
-                    'session_id': session_id,
-                    'session_type': 'recommendation'
-                }
-            else:
-                return {
-                    'response': f"게임 추천 서비스에 일시적인 문제가 발생했습니다: {str(e)}",
-                    'session_id': session_id,
-                    'session_type': 'recommendation'
-                }
+            session_id = str(uuid.uuid4())
+            logger.warning(f"⚠️ 추천 세션 발급 실패, 로컬 세션 ID 사용: {session_id} ({str(e)})")
+            return session_id
     
     def close_session(self, session_id, session_type="recommendation"):
         """세션 종료 요청 (추천 세션 전용)"""
         try:
             logger.info(f"🗑️ 추천 세션 종료 요청: {session_id}")
             result = self.runpod_client.sync_close_session(session_id)
-            return result.get('success', False) if isinstance(result, dict) else True
+            return result.get('status') == 'success' if isinstance(result, dict) else True
+        except Exception as e:
+            logger.error(f"❌ 추천 세션 종료 실패: {str(e)}")
+            return False
+    
+    async def async_close_session(self, session_id, session_type="recommendation"):
+        """세션 종료 요청 - 비동기 버전 (추천 세션 전용)"""
+        try:
+            logger.info(f"🗑️ 추천 세션 종료 요청: {session_id}")
+            result = await self.runpod_client.async_close_session(session_id)
+            return result.get('status') == 'success' if isinstance(result, dict) else True
         except Exception as e:
             logger.error(f"❌ 추천 세션 종료 실패: {str(e)}")
             return False
@@ -87,7 +125,8 @@ class GameRecommendationService:
             return {
                 "status": "healthy" if health.get("status") == "healthy" else "degraded",
                 "backend": "runpod",
-                "details": health
+                "details": health,
+                "connection_pool": self.runpod_client.get_connection_stats()
             }
         except Exception as e:
             return {
@@ -0,0 +1,154 @@
+import atexit
+import logging
+import threading
+import time
+from collections import deque
+from django.conf import settings
+from django.db import close_old_connections, transaction
+from ..models import GameQuestionCounter
+
+logger = logging.getLogger(__name__)
+
+
+class QALogBuffer:
+    """QA 로그 write-behind 버퍼 - 요청 경로에서는 메모리에만 쌓고 백그라운드 스레드가 bulk_create로 저장
+
+    - 버퍼가 batch_size개가 되거나 flush_interval초가 지나면 저장
+    - 대기 행이 max_backlog개를 넘으면 새 행은 버림 (dropped로 집계)
+    - 프로세스 종료 시 남은 행을 저장 (atexit)
+    - on_write(model, objects)가 있으면 bulk_create와 같은 트랜잭션에서 호출 (카운터 갱신 등)
+    """
+
+    def __init__(self, batch_size=50, flush_interval=2.0, max_backlog=5000, on_write=None):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_backlog = max_backlog
+        self.on_write = on_write
+
+        self._rows = deque()  # (모델 클래스, 필드 dict)
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()  # 저장은 한 번에 하나씩
+        self._wakeup = threading.Event()
+        self._stopped = False
+        self._thread = None
+
+        # 통계
+        self.queued = 0
+        self.written = 0
+        self.dropped = 0
+        self.failed = 0
+        self.flushes = 0
+        self.max_backlog_seen = 0
+        self.last_flush_ms = 0.0
+
+    def add(self, model, **fields):
+        """QA 행 추가 (DB 작업 없음, 버퍼가 가득 차면 False)"""
+        with self._lock:
+            if len(self._rows) >= self.max_backlog:
+                self.dropped += 1
+                dropped = True
+            else:
+                self._rows.append((model, fields))
+                self.queued += 1
+                self.max_backlog_seen = max(self.max_backlog_seen, len(self._rows))
+                dropped = False
+            backlog = len(self._rows)
+
+        if dropped:
+            logger.warning(f"⚠️ QA 로그 버퍼 가득 참, 행 버림 (대기 {backlog}개)")
+            return False
+
+        self._ensure_worker()
+        if backlog >= self.batch_size:
+            self._wakeup.set()
+        return True
+
+    def _ensure_worker(self):
+        if self._thread is not None or self._stopped:
+            return
+        with self._lock:
+            if self._thread is None and not self._stopped:
+                self._thread = threading.Thread(target=self._worker, name="qa-log-writer", daemon=True)
+                self._thread.start()
+                atexit.register(self.shutdown)
+                logger.info(f"📝 QA 로그 저장 스레드 시작 (배치 {self.batch_size}개, {self.flush_interval}초 주기)")
+
+    def _worker(self):
+        while not self._stopped:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            self.flush()
+
+    def flush(self):
+        """대기 중인 행을 모델별 bulk_create로 저장하고 저장한 행 수 반환"""
+        with self._flush_lock:
+            with self._lock:
+                if not self._rows:
+                    return 0
+                rows = list(self._rows)
+                self._rows.clear()
+
+            by_model = {}
+            for model, fields in rows:
+                by_model.setdefault(model, []).append(model(**fields))
+
+            start = time.perf_counter()
+            written = 0
+            close_old_connections()
+            try:
+                for model, objects in by_model.items():
+                    try:
+                        with transaction.atomic():
+                            model.objects.bulk_create(objects, batch_size=self.batch_size)
+                            if self.on_write is not None:
+                                self.on_write(model, objects)
+                        written += len(objects)
+                    except Exception as e:
+                        with self._lock:
+                            self.failed += len(objects)
+                        logger.error(f"❌ QA 로그 저장 실패 ({model.__name__} {len(objects)}개): {str(e)}")
+            finally:
+                close_old_connections()
+
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            with self._lock:
+                self.written += written
+                self.flushes += 1
+                self.last_flush_ms = elapsed_ms
+            if written:
+                logger.info(f"✅ QA 로그 {written}개 저장 ({elapsed_ms:.1f}ms)")
+            return written
+
+    def shutdown(self):
+        """저장 스레드 중지 후 남은 행 저장"""
+        self._stopped = True
+        self._wakeup.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=5)
+        written = self.flush()
+        if written:
+            logger.info(f"🛑 종료 전 QA 로그 {written}개 저장")
+
+    def get_stats(self):
+        with self._lock:
+            return {
+                'backlog': len(self._rows),
+                'max_backlog': self.max_backlog,
+                'max_backlog_seen': self.max_backlog_seen,
+                'batch_size': self.batch_size,
+                'flush_interval': self.flush_interval,
+                'queued': self.queued,
+                'written': self.written,
+                'dropped': self.dropped,
+                'failed': self.failed,
+                'flushes': self.flushes,
+                'last_flush_ms': round(self.last_flush_ms, 1),
+            }
+
+
+qa_log_buffer = QALogBuffer(
+    batch_size=getattr(settings, 'QA_LOG_BATCH_SIZE', 50),
+    flush_interval=getattr(settings, 'QA_LOG_FLUSH_INTERVAL', 2.0),
+    max_backlog=getattr(settings, 'QA_LOG_MAX_BACKLOG', 5000),
+    on_write=GameQuestionCounter.record_questions,
+)
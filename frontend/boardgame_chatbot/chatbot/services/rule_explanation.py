@@ -1,4 +1,5 @@
 import logging
+import uuid
 from django.conf import settings
 from .runpod_client import RunpodClient
 
@@ -27,111 +28,242 @@ class RuleExplanationService:
                 logger.info(f"✅ 게임 목록 로드: {len(self._available_games)}개")
             except Exception as e:
                 logger.error(f"❌ 게임 목록 로드 실패: {str(e)}")
-                # 기본 게임 목록
-                self._available_games = [
-                    "카탄", "스플렌더", "아줄", "윙스팬", "뱅", 
-                    "킹 오브 도쿄", "7 원더스", "도미니언", "스몰 월드", "티켓 투 라이드"
-                ]
+                self._available_games = self._default_games()
         
         return self._available_games
     
+    async def async_get_available_games(self):
+        """사용 가능한 게임 목록 반환 - 비동기 버전 (캐싱)"""
+        if self._available_games is None:
+            try:
+                self._available_games = await self.runpod_client.async_get_available_games()
+                logger.info(f"✅ 게임 목록 로드: {len(self._available_games)}개")
+            except Exception as e:
+                logger.error(f"❌ 게임 목록 로드 실패: {str(e)}")
+                self._available_games = self._default_games()
+        
+        return self._available_games
+    
+    @staticmethod
+    def _default_games():
+        # 기본 게임 목록
+        return [
+            "카탄", "스플렌더", "아줄", "윙스팬", "뱅", 
+            "킹 오브 도쿄", "7 원더스", "도미니언", "스몰 월드", "티켓 투 라이드"
+        ]
+    
+    @staticmethod
+    def _unsupported_game(game_name, session_id, session_type):
+        return {
+            'response': f"'{game_name}' 게임은 현재 지원하지 않습니다.",
+            'session_id': session_id,
+            'session_type': session_type,
+            'is_fallback': True
+        }
+    
     def explain_game_rules(self, game_name, chat_type='gpt_rules', session_id=""):
         """게임 룰 전체 설명 (GPT 또는 파인튜닝 세션 관리 포함)"""
         session_type = 'gpt' if chat_type == 'gpt_rules' else 'finetuning'
         
         if game_name not in self.get_available_games():
-            return {
-                'response': f"'{game_name}' 게임은 현재 지원하지 않습니다.",
-                'session_id': session_id,
-                'session_type': session_type
-            }
+            return self._unsupported_game(game_name, session_id, session_type)
         
         try:
             logger.info(f"📚 룰 요약 요청: {game_name} ({session_type} 세션: {session_id})")
             result = self.runpod_client.sync_rule_summary(game_name, chat_type, session_id)
-            
-            # 세션 ID 처리: 백엔드에서 받은 session_id 사용
-            actual_session_id = result.get('session_id', session_id)
-            actual_session_type = result.get('session_type', session_type)
-            
-            logger.info(f"✅ 룰 요약 완료 ({actual_session_type} 세션: {actual_session_id})")
-            
-            return {
-                'response': result.get('response', '요약을 가져올 수 없습니다.'),
-                'session_id': actual_session_id,
-                'session_type': actual_session_type
-            }
-            
+            return self._build_rule_summary(result, session_id, session_type)
         except Exception as e:
-            logger.error(f"❌ 룰 설명 실패 ({session_type}): {str(e)}")
-            
-            if self.use_fallback:
-                fallback_response = self._get_fallback_rule_explanation(game_name, chat_type)
-                return {
-                    'response': fallback_response,
-                    'session_id': session_id,
-                    'session_type': session_type
-                }
-            else:
-                return {
-                    'response': f"룰 설명 서비스에 일시적인 문제가 발생했습니다: {str(e)}",
-                    'session_id': session_id,
-                    'session_type': session_type
-                }
+            return self._rule_summary_error(e, game_name, chat_type, session_id, session_type)
     
-    def answer_rule_question(self, game_name, question, chat_type='gpt_rules', session_id=""):
-        """특정 룰 질문에 답변 (GPT 또는 파인튜닝 세션 관리 포함)"""
+    async def async_explain_game_rules(self, game_name, chat_type='gpt_rules', session_id=""):
+        """게임 룰 전체 설명 - 비동기 버전 (GPT 또는 파인튜닝 세션 관리 포함)"""
         session_type = 'gpt' if chat_type == 'gpt_rules' else 'finetuning'
         
-        if game_name not in self.get_available_games():
+        if game_name not in await self.async_get_available_games():
+            return self._unsupported_game(game_name, session_id, session_type)
+        
+        try:
+            logger.info(f"📚 룰 요약 요청: {game_name} ({session_type} 세션: {session_id})")
+            result = await self.runpod_client.async_rule_summary(game_name, chat_type, session_id)
+            return self._build_rule_summary(result, session_id, session_type)
+        except Exception as e:
+            return self._rule_summary_error(e, game_name, chat_type, session_id, session_type)
+    
+    def _build_rule_summary(self, result, session_id, session_type):
+        # 세션 ID 처리: 백엔드에서 받은 session_id 사용
+        actual_session_id = result.get('session_id', session_id)
+        actual_session_type = result.get('session_type', session_type)
+        
+        logger.info(f"✅ 룰 요약 완료 ({actual_session_type} 세션: {actual_session_id})")
+        
+        return {
+            'response': result.get('response', '요약을 가져올 수 없습니다.'),
+            'session_id': actual_session_id,
+            'session_type': actual_session_type
+        }
+    
+    def _rule_summary_error(self, e, game_name, chat_type, session_id, session_type):
+        logger.error(f"❌ 룰 설명 실패 ({session_type}): {str(e)}")
+        
+        if self.use_fallback:
+            fallback_response = self._get_fallback_rule_explanation(game_name, chat_type)
+            return {
+                'response': fallback_response,
+                'session_id': session_id,
+                'session_type': session_type
+            }
+        else:
             return {
-                'response': f"'{game_name}' 게임은 현재 지원하지 않습니다.",
+                'response': f"룰 설명 서비스에 일시적인 문제가 발생했습니다: {str(e)}",
                 'session_id': session_id,
                 'session_type': session_type
             }
+    
+    def answer_rule_question(self, game_name, question, chat_type='gpt_rules', session_id=""):
+        """특정 룰 질문에 답변 (GPT 또는 파인튜닝 세션 관리 포함)"""
+        session_type = 'gpt' if chat_type == 'gpt_rules' else 'finetuning'
+        
+        if game_name not in self.get_available_games():
+            return self._unsupported_game(game_name, session_id, session_type)
         
         try:
             logger.info(f"💬 룰 질문: {game_name} - {question} ({session_type} 세션: {session_id})")
             result = self.runpod_client.sync_explain_rules(game_name, question, chat_type, session_id)
-            
-            # 세션 ID 처리: 백엔드에서 받은 session_id 사용
-            actual_session_id = result.get('session_id', session_id)
-            actual_session_type = result.get('session_type', session_type)
-            
-            logger.info(f"✅ 룰 질문 답변 완료 ({actual_session_type} 세션: {actual_session_id})")
-            
+            return self._build_rule_answer(result, session_id, session_type)
+        except Exception as e:
+            return self._rule_answer_error(e, game_name, question, chat_type, session_id, session_type)
+    
+    async def async_answer_rule_question(self, game_name, question, chat_type='gpt_rules', session_id=""):
+        """특정 룰 질문에 답변 - 비동기 버전 (GPT 또는 파인튜닝 세션 관리 포함)"""
+        session_type = 'gpt' if chat_type == 'gpt_rules' else 'finetuning'
+        
+        if game_name not in await self.async_get_available_games():
+            return self._unsupported_game(game_name, session_id, session_type)
+        
+        try:
+            logger.info(f"💬 룰 질문: {game_name} - {question} ({session_type} 세션: {session_id})")
+            result = await self.runpod_client.async_explain_rules(game_name, question, chat_type, session_id)
+            return self._build_rule_answer(result, session_id, session_type)
+        except Exception as e:
+            return self._rule_answer_error(e, game_name, question, chat_type, session_id, session_type)
+    
+    def _build_rule_answer(self, result, session_id, session_type):
+        # 세션 ID 처리: 백엔드에서 받은 session_id 사용
+        actual_session_id = result.get('session_id', session_id)
+        actual_session_type = result.get('session_type', session_type)
+        
+        logger.info(f"✅ 룰 질문 답변 완료 ({actual_session_type} 세션: {actual_session_id})")
+        
+        return {
+            'response': result.get('response', '답변을 가져올 수 없습니다.'),
+            'session_id': actual_session_id,
+            'session_type': actual_session_type,
+            'stateless': result.get('stateless', False)
+        }
+    
+    def _rule_answer_error(self, e, game_name, question, chat_type, session_id, session_type):
+        logger.error(f"❌ 룰 질문 답변 실패 ({session_type}): {str(e)}")
+        
+        # 폴백/오류 응답은 실제 답변이 아니므로 is_fallback으로 표시 (QA 기록에서 제외)
+        if self.use_fallback:
+            fallback_response = self._get_fallback_rule_answer(game_name, question, chat_type)
             return {
-                'response': result.get('response', '답변을 가져올 수 없습니다.'),
-                'session_id': actual_session_id,
-                'session_type': actual_session_type
+                'response': fallback_response,
+                'session_id': session_id,
+                'session_type': session_type,
+                'is_fallback': True
             }
+        else:
+            return {
+                'response': f"룰 질문 답변 서비스에 일시적인 문제가 발생했습니다: {str(e)}",
+                'session_id': session_id,
+                'session_type': session_type,
+                'is_fallback': True
+            }
+    
+    async def async_stream_rule_question(self, game_name, question, chat_type='gpt', session_id=""):
+        """룰 질문 스트리밍 답변 - (event, data) 튜플 반환 (session -> token... -> done/error)
+        
+        백엔드 연결 자체가 실패하면 폴백 답변을 한 번에 token 이벤트로 보냅니다.
+        """
+        session_type = 'finetuning' if chat_type == 'finetuning' else 'gpt'
+        
+        if game_name not in await self.async_get_available_games():
+            for event in self._single_message_events(f"'{game_name}' 게임은 현재 지원하지 않습니다.", session_id):
+                yield event
+            return
+        
+        logger.info(f"💬 룰 질문 스트리밍: {game_name} - {question} ({session_type} 세션: {session_id})")
+        started = False
+        events = self.runpod_client.async_stream_explain_rules(game_name, question, chat_type, session_id)
+        try:
+            async for event, data in events:
+                started = True
+                yield event, data
+            logger.info(f"✅ 룰 질문 스트리밍 완료 ({session_type} 세션: {session_id})")
             
         except Exception as e:
-            logger.error(f"❌ 룰 질문 답변 실패 ({session_type}): {str(e)}")
-            
-            if self.use_fallback:
-                fallback_response = self._get_fallback_rule_answer(game_name, question, chat_type)
-                return {
-                    'response': fallback_response,
-                    'session_id': session_id,
-                    'session_type': session_type
-                }
-            else:
-                return {
-                    'response': f"룰 질문 답변 서비스에 일시적인 문제가 발생했습니다: {str(e)}",
-                    'session_id': session_id,
-                    'session_type': session_type
-                }
+            for event in self._stream_error_events(e, started, game_name, question, session_id, session_type):
+                yield event
+        finally:
+            await events.aclose()
+    
+    @staticmethod
+    def _single_message_events(message, session_id):
+        """백엔드 답변이 아닌 안내/폴백 메시지를 스트림 이벤트로 변환 (done에 is_fallback 표시, QA 기록에서 제외)"""
+        return [
+            ('session', {'session_id': session_id}),
+            ('token', {'text': message}),
+            ('done', {'session_id': session_id, 'is_fallback': True}),
+        ]
+    
+    def _stream_error_events(self, e, started, game_name, question, session_id, session_type):
+        logger.error(f"❌ 룰 질문 스트리밍 실패 ({session_type}): {str(e)}")
+        
+        # 이미 토큰을 보내기 시작했다면 폴백으로 덮어쓰지 않고 오류만 알림
+        if started:
+            return [('error', {'message': f"룰 질문 답변 서비스에 일시적인 문제가 발생했습니다: {str(e)}"})]
+        
+        if self.use_fallback:
+            fallback_chat_type = 'finetuning_rules' if session_type == 'finetuning' else 'gpt_rules'
+            message = self._get_fallback_rule_answer(game_name, question, fallback_chat_type)
+        else:
+            message = f"룰 질문 답변 서비스에 일시적인 문제가 발생했습니다: {str(e)}"
+        return self._single_message_events(message, session_id)
+    
+    async def async_create_session(self, session_type='gpt'):
+        """세션 발급 (LLM 호출 없음) - 백엔드 연결 실패 시 로컬에서 UUID 발급
+        
+        백엔드는 처음 보는 세션 ID도 첫 요청 때 등록하므로 로컬 UUID도 그대로 사용할 수 있습니다.
+        """
+        try:
+            result = await self.runpod_client.async_create_session(session_type)
+            logger.info(f"🆕 룰 설명 세션 발급: {result['session_id']}")
+            return result['session_id']
+        except Exception as e:
+            session_id = str(uuid.uuid4())
+            logger.warning(f"⚠️ 룰 설명 세션 발급 실패, 로컬 세션 ID 사용: {session_id} ({str(e)})")
+            return session_id
     
     def close_session(self, session_id, session_type=None):
         """세션 종료 요청 (GPT 또는 파인튜닝 세션)"""
+        session_info = f" ({session_type})" if session_type else ""
         try:
-            session_info = f" ({session_type})" if session_type else ""
             logger.info(f"🗑️ 룰 설명 세션 종료 요청{session_info}: {session_id}")
             result = self.runpod_client.sync_close_session(session_id)
-            return result.get('success', False) if isinstance(result, dict) else True
+            return result.get('status') == 'success' if isinstance(result, dict) else True
+        except Exception as e:
+            logger.error(f"❌ 룰 설명 세션 종료 실패{session_info}: {str(e)}")
+            return False
+    
+    async def async_close_session(self, session_id, session_type=None):
+        """세션 종료 요청 - 비동기 버전 (GPT 또는 파인튜닝 세션)"""
+        session_info = f" ({session_type})" if session_type else ""
+        try:
+            logger.info(f"🗑️ 룰 설명 세션 종료 요청{session_info}: {session_id}")
+            result = await self.runpod_client.async_close_session(session_id)
+            return result.get('status') == 'success' if isinstance(result, dict) else True
         except Exception as e:
-            session_info = f" ({session_type})" if session_type else ""
             logger.error(f"❌ 룰 설명 세션 종료 실패{session_info}: {str(e)}")
             return False
     
@@ -176,6 +308,7 @@ class RuleExplanationService:
                 "status": "healthy" if health.get("status") == "healthy" else "degraded",
                 "backend": "runpod",
                 "details": health,
+                "connection_pool": self.runpod_client.get_connection_stats(),
                 "langchain_enabled": True,
                 "session_management": "separated"  # GPT와 파인튜닝 세션 분리됨
             }
@@ -1,13 +1,162 @@
 import httpx
 import asyncio
+import json
 import logging
+import threading
+import time
+import weakref
 from django.conf import settings
-from typing import Dict, Any, Optional
+from typing import Dict, Any, AsyncIterator, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+
+class ConnectionStats:
+    """Runpod 요청의 연결 재사용 통계 (httpcore trace 이벤트 기반)
+    
+    새 TCP 연결/TLS 핸드셰이크가 없었던 요청을 재사용 요청으로 집계합니다.
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.new_connections = 0
+        self.tls_handshakes = 0
+        self.reused_connections = 0
+        self.errors = 0
+        self.total_ms = 0.0
+        self.connect_ms = 0.0  # TCP 연결 + TLS 핸드셰이크에 쓴 시간
+    
+    @staticmethod
+    def new_request_state():
+        return {'new_connection': False, 'tls_handshake': False, 'connect_ms': 0.0, 'connect_started': 0.0}
+    
+    @staticmethod
+    def _on_event(request_state, event_name):
+        if event_name in ('connection.connect_tcp.started', 'connection.start_tls.started'):
+            request_state['connect_started'] = time.perf_counter()
+        elif event_name == 'connection.connect_tcp.complete':
+            request_state['new_connection'] = True
+            request_state['connect_ms'] += (time.perf_counter() - request_state['connect_started']) * 1000
+        elif event_name == 'connection.start_tls.complete':
+            request_state['tls_handshake'] = True
+            request_state['connect_ms'] += (time.perf_counter() - request_state['connect_started']) * 1000
+    
+    def trace(self, request_state):
+        """요청 하나에 대한 trace 콜백 생성 (동기 클라이언트용)"""
+        def callback(event_name, info):
+            self._on_event(request_state, event_name)
+        return callback
+    
+    def atrace(self, request_state):
+        """요청 하나에 대한 trace 콜백 생성 (비동기 클라이언트용)"""
+        async def callback(event_name, info):
+            self._on_event(request_state, event_name)
+        return callback
+    
+    def record(self, request_state, elapsed, failed=False):
+        with self._lock:
+            self.requests += 1
+            if failed:
+                self.errors += 1
+            if request_state['new_connection']:
+                self.new_connections += 1
+            elif not failed:
+                self.reused_connections += 1
+            if request_state['tls_handshake']:
+                self.tls_handshakes += 1
+            self.total_ms += elapsed * 1000
+            self.connect_ms += request_state['connect_ms']
+    
+    def get_stats(self):
+        with self._lock:
+            return {
+                'requests': self.requests,
+                'new_connections': self.new_connections,
+                'tls_handshakes': self.tls_handshakes,
+                'reused_connections': self.reused_connections,
+                'reuse_ratio': round(self.reused_connections / self.requests, 3) if self.requests else 0.0,
+                'errors': self.errors,
+                'avg_request_ms': round(self.total_ms / self.requests, 1) if self.requests else 0.0,
+                'avg_connect_ms': round(self.connect_ms / self.new_connections, 1) if self.new_connections else 0.0,
+            }
+
+
+connection_stats = ConnectionStats()
+
+_http_client = None
+_http_client_lock = threading.Lock()
+# 이벤트 루프별 비동기 클라이언트 (AsyncClient의 연결은 만든 루프에서만 사용 가능)
+_async_http_clients = weakref.WeakKeyDictionary()
+
+
+def _http2_available():
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+def _client_options():
+    """동기/비동기 클라이언트 공통 연결 풀 설정"""
+    http2 = getattr(settings, 'RUNPOD_HTTP2', False)
+    if http2 and not _http2_available():
+        logger.warning("⚠️ h2 패키지가 없어 HTTP/1.1로 연결합니다. (pip install 'httpx[http2]')")
+        http2 = False
+    
+    return {
+        'timeout': getattr(settings, 'RUNPOD_TIMEOUT', 30.0),
+        'limits': httpx.Limits(
+            max_connections=getattr(settings, 'RUNPOD_MAX_CONNECTIONS', 20),
+            max_keepalive_connections=getattr(settings, 'RUNPOD_MAX_KEEPALIVE_CONNECTIONS', 10),
+            keepalive_expiry=getattr(settings, 'RUNPOD_KEEPALIVE_EXPIRY', 60.0),
+        ),
+        'http2': http2,
+    }
+
+
+def get_http_client() -> httpx.Client:
+    """프로세스 전역 Runpod HTTP 클라이언트 (keep-alive 연결 풀, 워커 스레드 간 공유)"""
+    global _http_client
+    with _http_client_lock:
+        if _http_client is None:
+            options = _client_options()
+            _http_client = httpx.Client(**options)
+            limits = options['limits']
+            logger.info(f"🔌 Runpod HTTP 연결 풀 생성 (최대 {limits.max_connections}개, keep-alive {limits.max_keepalive_connections}개, HTTP/2: {options['http2']})")
+        return _http_client
+
+
+def get_async_http_client() -> httpx.AsyncClient:
+    """현재 이벤트 루프의 Runpod 비동기 HTTP 클라이언트 (ASGI 워커당 하나, 요청 간 연결 공유)"""
+    loop = asyncio.get_running_loop()
+    client = _async_http_clients.get(loop)
+    if client is None:
+        options = _client_options()
+        client = httpx.AsyncClient(**options)
+        _async_http_clients[loop] = client
+        limits = options['limits']
+        logger.info(f"🔌 Runpod 비동기 HTTP 연결 풀 생성 (최대 {limits.max_connections}개, keep-alive {limits.max_keepalive_connections}개, HTTP/2: {options['http2']})")
+    return client
+
+
+def _parse_sse_line(line, event):
+    """SSE 한 줄 처리 - (다음 이벤트 이름, data 또는 None) 반환"""
+    if line.startswith('event:'):
+        return line[len('event:'):].strip(), None
+    if line.startswith('data:'):
+        return event, json.loads(line[len('data:'):].strip())
+    if not line:
+        return 'message', None
+    return event, None
+
+
 class RunpodClient:
-    """Runpod AI 백엔드와 통신하는 클라이언트"""
+    """Runpod AI 백엔드와 통신하는 클라이언트
+    
+    sync_* 메서드는 동기 뷰용, async_* 메서드는 비동기(ASGI) 뷰용이며 응답 형식은 같습니다.
+    """
     
     def __init__(self):
         self.base_url = getattr(settings, 'RUNPOD_API_URL', 'http://localhost:8000')
@@ -18,35 +167,62 @@ class RunpodClient:
             'Content-Type': 'application/json',
             'User-Agent': 'Django-BoardgameBot/1.0'
         }
-        
+    
+    def _raise_request_error(self, e: Exception, url: str, label: str = "API"):
+        """httpx 예외를 사용자 메시지 예외로 변환"""
+        if isinstance(e, httpx.TimeoutException):
+            logger.error(f"❌ Runpod {label} 타임아웃: {url}")
+            raise Exception("AI 서버 응답 시간이 초과되었습니다.")
+        if isinstance(e, httpx.HTTPStatusError):
+            logger.error(f"❌ Runpod {label} HTTP 오류: {e.response.status_code} - {url}")
+            raise Exception(f"AI 서버 오류가 발생했습니다: {e.response.status_code}")
+        if isinstance(e, httpx.RequestError):
+            logger.error(f"❌ Runpod {label} 연결 오류: {str(e)} - {url}")
+            raise Exception("AI 서버에 연결할 수 없습니다.")
+        logger.error(f"❌ Runpod {label} 알 수 없는 오류: {str(e)} - {url}")
+        raise Exception(f"AI 서버 통신 중 오류가 발생했습니다: {str(e)}")
+    
     async def _make_request(self, method: str, endpoint: str, data: Optional[Dict] = None) -> Dict[str, Any]:
-        """HTTP 요청 공통 메서드"""
+        """HTTP 요청 공통 메서드 (비동기, 이벤트 루프별 공유 연결 풀 사용)"""
         url = f"{self.base_url}{endpoint}"
+        request_state = ConnectionStats.new_request_state()
+        start = time.perf_counter()
+        failed = True
         
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                if method.upper() == 'GET':
-                    response = await client.get(url, headers=self.headers)
-                elif method.upper() == 'POST':
-                    response = await client.post(url, json=data, headers=self.headers)
-                else:
-                    raise ValueError(f"지원하지 않는 HTTP 메서드: {method}")
-                
-                response.raise_for_status()
-                return response.json()
-                
-        except httpx.TimeoutException:
-            logger.error(f"❌ Runpod API 타임아웃: {url}")
-            raise Exception("AI 서버 응답 시간이 초과되었습니다.")
-        except httpx.HTTPStatusError as e:
-            logger.error(f"❌ Runpod API HTTP 오류: {e.response.status_code} - {url}")
-            raise Exception(f"AI 서버 오류가 발생했습니다: {e.response.status_code}")
-        except httpx.RequestError as e:
-            logger.error(f"❌ Runpod API 연결 오류: {str(e)} - {url}")
-            raise Exception("AI 서버에 연결할 수 없습니다.")
+            response = await get_async_http_client().request(
+                method.upper(), url, json=data, headers=self.headers,
+                extensions={'trace': connection_stats.atrace(request_state)}
+            )
+            response.raise_for_status()
+            failed = False
+            return response.json()
+        
         except Exception as e:
-            logger.error(f"❌ Runpod API 알 수 없는 오류: {str(e)} - {url}")
-            raise Exception(f"AI 서버 통신 중 오류가 발생했습니다: {str(e)}")
+            self._raise_request_error(e, url)
+        finally:
+            connection_stats.record(request_state, time.perf_counter() - start, failed)
+    
+    def _request(self, method: str, endpoint: str, data: Optional[Dict] = None) -> Dict[str, Any]:
+        """HTTP 요청 공통 메서드 (동기, 공유 연결 풀 사용)"""
+        url = f"{self.base_url}{endpoint}"
+        request_state = ConnectionStats.new_request_state()
+        start = time.perf_counter()
+        failed = True
+        
+        try:
+            response = get_http_client().request(
+                method.upper(), url, json=data, headers=self.headers,
+                extensions={'trace': connection_stats.trace(request_state)}
+            )
+            response.raise_for_status()
+            failed = False
+            return response.json()
+        
+        except Exception as e:
+            self._raise_request_error(e, url)
+        finally:
+            connection_stats.record(request_state, time.perf_counter() - start, failed)
     
     async def health_check(self) -> Dict[str, Any]:
         """AI 서버 상태 확인"""
@@ -80,6 +256,11 @@ class RunpodClient:
         }
         return await self._make_request('POST', '/rule-summary', data)
     
+    async def create_session(self, session_type: str = "all") -> Dict[str, Any]:
+        """세션 발급 요청 (LLM 호출 없음)"""
+        data = {"session_type": session_type}
+        return await self._make_request('POST', '/session/create', data)
+    
     async def close_session(self, session_id: str) -> Dict[str, Any]:
         """세션 종료 요청"""
         data = {"session_id": session_id}
@@ -89,149 +270,249 @@ class RunpodClient:
         """사용 가능한 게임 목록 요청"""
         return await self._make_request('GET', '/games')
     
-    def sync_recommend_games(self, query: str, session_id: str = "", top_k: int = 3) -> Dict[str, Any]:
-        """동기 버전 - 게임 추천 (추천 전용 세션)"""
+    async def _astream_events(self, endpoint: str, data: Dict) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+        """SSE 스트리밍 요청 공통 메서드 (비동기) - (event, data) 튜플을 받는 대로 반환"""
+        url = f"{self.base_url}{endpoint}"
+        request_state = ConnectionStats.new_request_state()
+        start = time.perf_counter()
+        failed = True
+        
         try:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            result = loop.run_until_complete(self.recommend_games(query, session_id, top_k))
-            loop.close()
-            
-            logger.info(f"🔍 RunPod 추천 서버 응답: {result}")
-            
-            if result.get('status') == 'success':
-                data = result.get('data', {})
-                response_dict = {
-                    'response': data.get('recommendation', '추천을 가져올 수 없습니다.'),
-                    'session_id': data.get('session_id', session_id),
-                    'session_type': 'recommendation'  # 세션 타입 명시
-                }
-                logger.info(f"🔍 추천 리턴 데이터: {response_dict}")
-                return response_dict
-            else:
-                return {
-                    'response': result.get('message', '추천 요청이 실패했습니다.'),
-                    'session_id': session_id,
-                    'session_type': 'recommendation'
-                }
+            async with get_async_http_client().stream(
+                'POST', url, json=data, headers=self.headers,
+                extensions={'trace': connection_stats.atrace(request_state)}
+            ) as response:
+                response.raise_for_status()
                 
+                event = 'message'
+                async for line in response.aiter_lines():
+                    event, payload = _parse_sse_line(line, event)
+                    if payload is not None:
+                        yield event, payload
+                failed = False
+        
+        except (GeneratorExit, asyncio.CancelledError):
+            # 브라우저 연결 종료로 중단된 경우 (연결 오류 아님)
+            failed = False
+            raise
         except Exception as e:
-            logger.error(f"❌ 동기 게임 추천 실패: {str(e)}")
+            self._raise_request_error(e, url, "스트리밍")
+        finally:
+            connection_stats.record(request_state, time.perf_counter() - start, failed)
+    
+    def async_stream_explain_rules(self, game_name: str, question: str, chat_type: str = "gpt", session_id: str = "") -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+        """비동기 스트리밍 버전 - 룰 설명 (session -> token... -> done/error 이벤트)"""
+        data = {
+            "game_name": game_name,
+            "question": question,
+            "chat_type": chat_type,
+            "session_id": session_id
+        }
+        return self._astream_events('/explain-rules/stream', data)
+    
+    @staticmethod
+    def _session_type(chat_type: str) -> str:
+        return 'gpt' if chat_type == 'gpt' else 'finetuning'
+    
+    def _parse_recommendation(self, result: Dict[str, Any], session_id: str) -> Dict[str, Any]:
+        logger.info(f"🔍 RunPod 추천 서버 응답: {result}")
+        
+        if result.get('status') == 'success':
+            data = result.get('data', {})
+            response_dict = {
+                'response': data.get('recommendation', '추천을 가져올 수 없습니다.'),
+                'session_id': data.get('session_id', session_id),
+                'session_type': 'recommendation'  # 세션 타입 명시
+            }
+            logger.info(f"🔍 추천 리턴 데이터: {response_dict}")
+            return response_dict
+        else:
             return {
-                'response': f"게임 추천 서비스에 연결할 수 없습니다: {str(e)}",
+                'response': result.get('message', '추천 요청이 실패했습니다.'),
                 'session_id': session_id,
                 'session_type': 'recommendation'
             }
     
-    def sync_explain_rules(self, game_name: str, question: str, chat_type: str = "gpt", session_id: str = "") -> Dict[str, Any]:
-        """동기 버전 - 룰 설명 (GPT 또는 파인튜닝 세션)"""
-        try:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            result = loop.run_until_complete(self.explain_rules(game_name, question, chat_type, session_id))
-            loop.close()
-            
-            session_type = 'gpt' if chat_type == 'gpt' else 'finetuning'
-            logger.info(f"🔍 RunPod 룰 설명 응답 ({session_type}): {result}")
-            
-            if result.get('status') == 'success':
-                data = result.get('data', {})
-                response_dict = {
-                    'response': data.get('answer', '답변을 가져올 수 없습니다.'),
-                    'session_id': data.get('session_id', session_id),
-                    'session_type': session_type  # 세션 타입 명시
-                }
-                logger.info(f"🔍 룰 설명 리턴 데이터 ({session_type}): {response_dict}")
-                return response_dict
-            else:
-                return {
-                    'response': result.get('message', '룰 설명 요청이 실패했습니다.'),
-                    'session_id': session_id,
-                    'session_type': session_type
-                }
-                
-        except Exception as e:
-            session_type = 'gpt' if chat_type == 'gpt' else 'finetuning'
-            logger.error(f"❌ 동기 룰 설명 실패 ({session_type}): {str(e)}")
+    def _recommendation_error(self, e: Exception, session_id: str) -> Dict[str, Any]:
+        logger.error(f"❌ 게임 추천 요청 실패: {str(e)}")
+        return {
+            'response': f"게임 추천 서비스에 연결할 수 없습니다: {str(e)}",
+            'session_id': session_id,
+            'session_type': 'recommendation'
+        }
+    
+    def _parse_rule_answer(self, result: Dict[str, Any], chat_type: str, session_id: str) -> Dict[str, Any]:
+        session_type = self._session_type(chat_type)
+        logger.info(f"🔍 RunPod 룰 설명 응답 ({session_type}): {result}")
+        
+        if result.get('status') == 'success':
+            data = result.get('data', {})
+            response_dict = {
+                'response': data.get('answer', '답변을 가져올 수 없습니다.'),
+                'session_id': data.get('session_id', session_id),
+                'session_type': session_type,  # 세션 타입 명시
+                'stateless': data.get('stateless', False)  # 이전 대화 없이 답변했는지 (QA 기록용)
+            }
+            logger.info(f"🔍 룰 설명 리턴 데이터 ({session_type}): {response_dict}")
+            return response_dict
+        else:
             return {
-                'response': f"룰 설명 서비스에 연결할 수 없습니다: {str(e)}",
+                'response': result.get('message', '룰 설명 요청이 실패했습니다.'),
                 'session_id': session_id,
                 'session_type': session_type
             }
     
-    def sync_rule_summary(self, game_name: str, chat_type: str = "gpt", session_id: str = "") -> Dict[str, Any]:
-        """동기 버전 - 룰 요약 (GPT 또는 파인튜닝 세션)"""
-        try:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            result = loop.run_until_complete(self.get_rule_summary(game_name, chat_type, session_id))
-            loop.close()
-            
-            session_type = 'gpt' if chat_type == 'gpt' else 'finetuning'
-            logger.info(f"🔍 RunPod 룰 요약 응답 ({session_type}): {result}")
-            
-            if result.get('status') == 'success':
-                data = result.get('data', {})
-                response_dict = {
-                    'response': data.get('summary', '요약을 가져올 수 없습니다.'),
-                    'session_id': data.get('session_id', session_id),
-                    'session_type': session_type  # 세션 타입 명시
-                }
-                logger.info(f"🔍 룰 요약 리턴 데이터 ({session_type}): {response_dict}")
-                return response_dict
-            else:
-                return {
-                    'response': result.get('message', '룰 요약 요청이 실패했습니다.'),
-                    'session_id': session_id,
-                    'session_type': session_type
-                }
-                
-        except Exception as e:
-            session_type = 'gpt' if chat_type == 'gpt' else 'finetuning'
-            logger.error(f"❌ 동기 룰 요약 실패 ({session_type}): {str(e)}")
+    def _rule_answer_error(self, e: Exception, chat_type: str, session_id: str) -> Dict[str, Any]:
+        session_type = self._session_type(chat_type)
+        logger.error(f"❌ 룰 설명 요청 실패 ({session_type}): {str(e)}")
+        return {
+            'response': f"룰 설명 서비스에 연결할 수 없습니다: {str(e)}",
+            'session_id': session_id,
+            'session_type': session_type
+        }
+    
+    def _parse_rule_summary(self, result: Dict[str, Any], chat_type: str, session_id: str) -> Dict[str, Any]:
+        session_type = self._session_type(chat_type)
+        logger.info(f"🔍 RunPod 룰 요약 응답 ({session_type}): {result}")
+        
+        if result.get('status') == 'success':
+            data = result.get('data', {})
+            response_dict = {
+                'response': data.get('summary', '요약을 가져올 수 없습니다.'),
+                'session_id': data.get('session_id', session_id),
+                'session_type': session_type  # 세션 타입 명시
+            }
+            logger.info(f"🔍 룰 요약 리턴 데이터 ({session_type}): {response_dict}")
+            return response_dict
+        else:
             return {
-                'response': f"룰 요약 서비스에 연결할 수 없습니다: {str(e)}",
+                'response': result.get('message', '룰 요약 요청이 실패했습니다.'),
                 'session_id': session_id,
                 'session_type': session_type
             }
     
+    def _rule_summary_error(self, e: Exception, chat_type: str, session_id: str) -> Dict[str, Any]:
+        session_type = self._session_type(chat_type)
+        logger.error(f"❌ 룰 요약 요청 실패 ({session_type}): {str(e)}")
+        return {
+            'response': f"룰 요약 서비스에 연결할 수 없습니다: {str(e)}",
+            'session_id': session_id,
+            'session_type': session_type
+        }
+    
+    def _parse_games(self, result: Dict[str, Any]) -> list:
+        if result.get('status') == 'success':
+            games = result.get('data', {}).get('games', [])
+            logger.info(f"✅ 게임 목록 수신: {len(games)}개")
+            return games
+        else:
+            logger.warning(f"⚠️ Runpod 서버 응답 오류: {result.get('message', 'Unknown error')}")
+            return self._get_fallback_games()
+    
+    def sync_recommend_games(self, query: str, session_id: str = "", top_k: int = 3) -> Dict[str, Any]:
+        """동기 버전 - 게임 추천 (추천 전용 세션)"""
+        try:
+            result = self._request('POST', '/recommend', {"query": query, "session_id": session_id, "top_k": top_k})
+            return self._parse_recommendation(result, session_id)
+        except Exception as e:
+            return self._recommendation_error(e, session_id)
+    
+    async def async_recommend_games(self, query: str, session_id: str = "", top_k: int = 3) -> Dict[str, Any]:
+        """비동기 버전 - 게임 추천 (추천 전용 세션)"""
+        try:
+            result = await self.recommend_games(query, session_id, top_k)
+            return self._parse_recommendation(result, session_id)
+        except Exception as e:
+            return self._recommendation_error(e, session_id)
+    
+    def sync_explain_rules(self, game_name: str, question: str, chat_type: str = "gpt", session_id: str = "") -> Dict[str, Any]:
+        """동기 버전 - 룰 설명 (GPT 또는 파인튜닝 세션)"""
+        try:
+            result = self._request('POST', '/explain-rules', {"game_name": game_name, "question": question, "chat_type": chat_type, "session_id": session_id})
+            return self._parse_rule_answer(result, chat_type, session_id)
+        except Exception as e:
+            return self._rule_answer_error(e, chat_type, session_id)
+    
+    async def async_explain_rules(self, game_name: str, question: str, chat_type: str = "gpt", session_id: str = "") -> Dict[str, Any]:
+        """비동기 버전 - 룰 설명 (GPT 또는 파인튜닝 세션)"""
+        try:
+            result = await self.explain_rules(game_name, question, chat_type, session_id)
+            return self._parse_rule_answer(result, chat_type, session_id)
+        except Exception as e:
+            return self._rule_answer_error(e, chat_type, session_id)
+    
+    def sync_rule_summary(self, game_name: str, chat_type: str = "gpt", session_id: str = "") -> Dict[str, Any]:
+        """동기 버전 - 룰 요약 (GPT 또는 파인튜닝 세션)"""
+        try:
+            result = self._request('POST', '/rule-summary', {"game_name": game_name, "chat_type": chat_type, "session_id": session_id})
+            return self._parse_rule_summary(result, chat_type, session_id)
+        except Exception as e:
+            return self._rule_summary_error(e, chat_type, session_id)
+    
+    async def async_rule_summary(self, game_name: str, chat_type: str = "gpt", session_id: str = "") -> Dict[str, Any]:
+        """비동기 버전 - 룰 요약 (GPT 또는 파인튜닝 세션)"""
+        try:
+            result = await self.get_rule_summary(game_name, chat_type, session_id)
+            return self._parse_rule_summary(result, chat_type, session_id)
+        except Exception as e:
+            return self._rule_summary_error(e, chat_type, session_id)
+    
+    def _parse_session(self, result: Dict[str, Any], session_type: str) -> Dict[str, Any]:
+        data = result.get('data') or {}
+        if result.get('status') == 'success' and data.get('session_id'):
+            return {'session_id': data['session_id'], 'session_type': session_type}
+        raise Exception(result.get('message', '세션 발급 요청이 실패했습니다.'))
+    
+    def sync_create_session(self, session_type: str = "all") -> Dict[str, Any]:
+        """동기 버전 - 세션 발급 (실패 시 예외)"""
+        return self._parse_session(self._request('POST', '/session/create', {"session_type": session_type}), session_type)
+    
+    async def async_create_session(self, session_type: str = "all") -> Dict[str, Any]:
+        """비동기 버전 - 세션 발급 (실패 시 예외)"""
+        return self._parse_session(await self.create_session(session_type), session_type)
+    
     def sync_close_session(self, session_id: str) -> Dict[str, Any]:
         """동기 버전 - 세션 종료"""
         try:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            result = loop.run_until_complete(self.close_session(session_id))
-            loop.close()
-            return result
+            return self._request('POST', '/session/close', {"session_id": session_id})
         except Exception as e:
             logger.error(f"❌ 동기 세션 종료 실패: {str(e)}")
             return {"success": False, "message": str(e)}
     
+    async def async_close_session(self, session_id: str) -> Dict[str, Any]:
+        """비동기 버전 - 세션 종료"""
+        try:
+            return await self.close_session(session_id)
+        except Exception as e:
+            logger.error(f"❌ 비동기 세션 종료 실패: {str(e)}")
+            return {"success": False, "message": str(e)}
+    
     def sync_get_available_games(self) -> list:
         """동기 버전 - 게임 목록"""
         try:
             logger.info(f"🎮 Runpod 게임 목록 요청: {self.base_url}/games")
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            result = loop.run_until_complete(self.get_available_games())
-            loop.close()
-            
-            if result.get('status') == 'success':
-                games = result.get('data', {}).get('games', [])
-                logger.info(f"✅ 게임 목록 수신: {len(games)}개")
-                return games
-            else:
-                logger.warning(f"⚠️ Runpod 서버 응답 오류: {result.get('message', 'Unknown error')}")
-                return self._get_fallback_games()
-                
+            return self._parse_games(self._request('GET', '/games'))
         except Exception as e:
             logger.error(f"❌ 동기 게임 목록 조회 실패: {str(e)}")
             return self._get_fallback_games()
     
+    async def async_get_available_games(self) -> list:
+        """비동기 버전 - 게임 목록"""
+        try:
+            logger.info(f"🎮 Runpod 게임 목록 요청: {self.base_url}/games")
+            return self._parse_games(await self.get_available_games())
+        except Exception as e:
+            logger.error(f"❌ 비동기 게임 목록 조회 실패: {str(e)}")
+            return self._get_fallback_games()
+    
+    def get_connection_stats(self) -> Dict[str, Any]:
+        """공유 연결 풀의 연결 재사용 통계"""
+        return connection_stats.get_stats()
+    
     def _get_fallback_games(self) -> list:
         """폴백 게임 목록"""
         fallback_games = [
-            "카탄", "스플렌더", "아줄", "윙스팬", "뱅", 
+            "카탄", "스플렌더", "아줄", "윙스팬", "뱅",
             "킹 오브 도쿄", "7 원더스", "도미니언", "스몰 월드", "티켓 투 라이드"
         ]
         logger.info(f"📋 폴백 게임 목록 사용: {len(fallback_games)}개")
@@ -240,11 +521,15 @@ class RunpodClient:
     def sync_health_check(self) -> Dict[str, Any]:
         """동기 버전 - 헬스체크"""
         try:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            result = loop.run_until_complete(self.health_check())
-            loop.close()
-            return result
+            return self._request('GET', '/health')
+        except Exception as e:
+            logger.error(f"❌ 헬스체크 실패: {str(e)}")
+            return {"status": "error", "message": str(e)}
+    
+    async def async_health_check(self) -> Dict[str, Any]:
+        """비동기 버전 - 헬스체크"""
+        try:
+            return await self.health_check()
         except Exception as e:
             logger.error(f"❌ 헬스체크 실패: {str(e)}")
             return {"status": "error", "message": str(e)}
@@ -1,3 +1,313 @@
-from django.test import TestCase
+import json
+from datetime import timedelta
+from unittest import mock
 
-# Create your tests here.
+from django.core.cache import cache
+from django.db.models.query import QuerySet
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from . import views
+from .management.commands.export_qa_cache import Command as ExportQACacheCommand
+from .models import (
+    ArchivedRuleQA,
+    FinetuningRuleQA,
+    GameQuestionCounter,
+    GPTRuleQA,
+    get_combined_game_rankings,
+)
+from .services.qa_log_buffer import QALogBuffer
+
+
+class GameQuestionCounterTests(TestCase):
+    """게임별 질문 수 카운터 증가/재계산"""
+
+    def counts(self, game_name):
+        counter = GameQuestionCounter.objects.get(game_name=game_name)
+        return counter.gpt_count, counter.ft_count, counter.total_count
+
+    def test_increment_creates_counter(self):
+        GameQuestionCounter.increment('카탄', gpt=2)
+        self.assertEqual(self.counts('카탄'), (2, 0, 2))
+
+    def test_increment_updates_existing_counter(self):
+        GameQuestionCounter.increment('카탄', gpt=1)
+        GameQuestionCounter.increment('카탄', ft=3)
+        GameQuestionCounter.increment('카탄', gpt=1, ft=1)
+        self.assertEqual(self.counts('카탄'), (2, 4, 6))
+        self.assertEqual(GameQuestionCounter.objects.count(), 1)
+
+    def test_increment_retries_when_counter_created_concurrently(self):
+        # 다른 요청이 먼저 행을 만든 경우: 첫 update는 0건, create는 IntegrityError, 재시도 update로 더함
+        GameQuestionCounter.objects.create(game_name='카탄', gpt_count=1, total_count=1)
+        original_update = QuerySet.update
+        calls = []
+
+        def stale_update(queryset, **kwargs):
+            calls.append(kwargs)
+            if len(calls) == 1:
+                return 0
+            return original_update(queryset, **kwargs)
+
+        with mock.patch.object(QuerySet, 'update', stale_update):
+            GameQuestionCounter.increment('카탄', gpt=2)
+
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(self.counts('카탄'), (3, 0, 3))
+
+    def test_record_questions_groups_by_game_and_model(self):
+        GameQuestionCounter.record_questions(GPTRuleQA, [
+            GPTRuleQA(game_name='카탄', question='q', answer='a'),
+            GPTRuleQA(game_name='카탄', question='q', answer='a'),
+            GPTRuleQA(game_name='스플렌더', question='q', answer='a'),
+        ])
+        GameQuestionCounter.record_questions(FinetuningRuleQA, [
+            FinetuningRuleQA(game_name='카탄', question='q', answer='a'),
+        ])
+        self.assertEqual(self.counts('카탄'), (2, 1, 3))
+        self.assertEqual(self.counts('스플렌더'), (1, 0, 1))
+
+    def test_reconcile_creates_updates_and_deletes(self):
+        GPTRuleQA.objects.create(game_name='카탄', question='q', answer='a')
+        GPTRuleQA.objects.create(game_name='카탄', question='q', answer='a')
+        FinetuningRuleQA.objects.create(game_name='스플렌더', question='q', answer='a')
+        ArchivedRuleQA.objects.create(
+            source=ArchivedRuleQA.SOURCE_GPT, original_id=1, game_name='카탄',
+            question='q', answer='a', created_at=timezone.now()
+        )
+        GameQuestionCounter.objects.create(game_name='카탄', gpt_count=1, total_count=1)  # 어긋난 값
+        GameQuestionCounter.objects.create(game_name='윙스팬', gpt_count=5, total_count=5)  # QA 없음
+
+        self.assertEqual(GameQuestionCounter.reconcile(), (1, 1, 1))
+        self.assertEqual(self.counts('카탄'), (3, 0, 3))
+        self.assertEqual(self.counts('스플렌더'), (0, 1, 1))
+        self.assertFalse(GameQuestionCounter.objects.filter(game_name='윙스팬').exists())
+
+        # 이미 맞으면 변경 없음
+        self.assertEqual(GameQuestionCounter.reconcile(), (0, 0, 0))
+
+
+@override_settings(
+    CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'rankings-test'}},
+    GAME_RANKINGS_CACHE_SECONDS=30,
+)
+class GameRankingsCacheTests(TestCase):
+    """홈 화면 게임 순위 캐시"""
+
+    def setUp(self):
+        cache.clear()
+
+    def tearDown(self):
+        cache.clear()
+
+    def test_rankings_are_cached_until_cleared(self):
+        GameQuestionCounter.increment('카탄', gpt=2)
+        GameQuestionCounter.increment('스플렌더', ft=1)
+        GameQuestionCounter.objects.create(game_name='윙스팬')  # 질문 0개는 제외
+
+        rankings = get_combined_game_rankings(5)
+        self.assertEqual([row['game_name'] for row in rankings], ['카탄', '스플렌더'])
+
+        GameQuestionCounter.increment('스플렌더', ft=5)
+        with self.assertNumQueries(0):
+            self.assertEqual(get_combined_game_rankings(5), rankings)
+
+        cache.clear()
+        self.assertEqual([row['game_name'] for row in get_combined_game_rankings(5)], ['스플렌더', '카탄'])
+
+    def test_rankings_cached_per_limit(self):
+        GameQuestionCounter.increment('카탄', gpt=2)
+        GameQuestionCounter.increment('스플렌더', ft=1)
+        self.assertEqual(len(get_combined_game_rankings(1)), 1)
+        self.assertEqual(len(get_combined_game_rankings(5)), 2)
+
+
+# 테스트 트랜잭션 안에서는 연결을 닫지 않도록 함 (저장 스레드는 시작하지 않고 flush를 직접 호출)
+@mock.patch('chatbot.services.qa_log_buffer.close_old_connections')
+@mock.patch.object(QALogBuffer, '_ensure_worker')
+class QALogBufferTests(TestCase):
+    """QA 로그 write-behind 버퍼"""
+
+    def test_flush_writes_rows_and_counters(self, ensure_worker, close_old_connections):
+        buffer = QALogBuffer(batch_size=2, max_backlog=10, on_write=GameQuestionCounter.record_questions)
+        self.assertTrue(buffer.add(GPTRuleQA, game_name='카탄', question='q1', answer='a1'))
+        self.assertTrue(buffer.add(GPTRuleQA, game_name='카탄', question='q2', answer='a2'))
+        self.assertTrue(buffer.add(FinetuningRuleQA, game_name='카탄', question='q3', answer='a3'))
+        self.assertEqual(GPTRuleQA.objects.count(), 0)
+
+        self.assertEqual(buffer.flush(), 3)
+        self.assertEqual(GPTRuleQA.objects.count(), 2)
+        self.assertEqual(FinetuningRuleQA.objects.count(), 1)
+        counter = GameQuestionCounter.objects.get(game_name='카탄')
+        self.assertEqual((counter.gpt_count, counter.ft_count, counter.total_count), (2, 1, 3))
+
+        self.assertEqual(buffer.flush(), 0)
+        stats = buffer.get_stats()
+        self.assertEqual((stats['queued'], stats['written'], stats['backlog']), (3, 3, 0))
+
+    def test_add_drops_rows_when_backlog_full(self, ensure_worker, close_old_connections):
+        buffer = QALogBuffer(batch_size=10, max_backlog=2)
+        self.assertTrue(buffer.add(GPTRuleQA, game_name='카탄', question='q1', answer='a1'))
+        self.assertTrue(buffer.add(GPTRuleQA, game_name='카탄', question='q2', answer='a2'))
+        self.assertFalse(buffer.add(GPTRuleQA, game_name='카탄', question='q3', answer='a3'))
+        self.assertEqual(buffer.get_stats()['dropped'], 1)
+
+        self.assertEqual(buffer.flush(), 2)
+        self.assertEqual(list(GPTRuleQA.objects.order_by('id').values_list('question', flat=True)), ['q1', 'q2'])
+
+        # 저장 후에는 다시 받음
+        self.assertTrue(buffer.add(GPTRuleQA, game_name='카탄', question='q4', answer='a4'))
+
+    def test_failed_on_write_rolls_back_rows(self, ensure_worker, close_old_connections):
+        buffer = QALogBuffer(on_write=mock.Mock(side_effect=RuntimeError('counter error')))
+        buffer.add(GPTRuleQA, game_name='카탄', question='q', answer='a')
+
+        self.assertEqual(buffer.flush(), 0)
+        self.assertEqual(GPTRuleQA.objects.count(), 0)
+        self.assertEqual(buffer.get_stats()['failed'], 1)
+
+
+class ArchivedRuleQATests(TestCase):
+    """오래된 QA 보관 배치"""
+
+    def test_archive_batch_moves_oldest_rows_in_batches(self):
+        now = timezone.now()
+        old_ids = []
+        for days in (40, 39, 38, 37, 36):
+            row = GPTRuleQA.objects.create(game_name='카탄', question=f'q{days}', answer='a')
+            GPTRuleQA.objects.filter(id=row.id).update(created_at=now - timedelta(days=days))
+            old_ids.append(row.id)
+        recent = GPTRuleQA.objects.create(game_name='카탄', question='recent', answer='a')
+        FinetuningRuleQA.objects.create(game_name='카탄', question='ft', answer='a')
+        FinetuningRuleQA.objects.update(created_at=now - timedelta(days=40))
+
+        cutoff = now - timedelta(days=30)
+        moved = [ArchivedRuleQA.archive_batch(ArchivedRuleQA.SOURCE_GPT, cutoff, batch_size=2) for _ in range(4)]
+        self.assertEqual(moved, [2, 2, 1, 0])
+
+        # 오래된 순서대로 옮겨지고 최근 행과 다른 출처는 그대로
+        archived = ArchivedRuleQA.objects.filter(source=ArchivedRuleQA.SOURCE_GPT).order_by('archived_at', 'id')
+        self.assertEqual(list(archived.values_list('original_id', flat=True)), old_ids)
+        self.assertEqual(list(GPTRuleQA.objects.values_list('id', flat=True)), [recent.id])
+        self.assertEqual(FinetuningRuleQA.objects.count(), 1)
+        self.assertEqual(ArchivedRuleQA.count_by_game(ArchivedRuleQA.SOURCE_GPT), {'카탄': 5})
+
+
+@mock.patch.object(views, 'qa_log_buffer')
+class FallbackAnswerLoggingTests(TestCase):
+    """백엔드 연결 실패 시의 폴백/오류 응답은 QA 기록에 남기지 않음"""
+
+    def setUp(self):
+        service = views.rule_explanation_service
+        patcher = mock.patch.multiple(service, _available_games=['카탄'], use_fallback=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.client_patch = mock.patch.multiple(
+            service.runpod_client,
+            async_explain_rules=mock.AsyncMock(side_effect=ConnectionError('backend down')),
+            async_stream_explain_rules=self.unreachable_stream,
+        )
+        self.client_patch.start()
+        self.addCleanup(self.client_patch.stop)
+
+    @staticmethod
+    async def unreachable_stream(*args, **kwargs):
+        raise ConnectionError('backend down')
+        yield
+
+    def post(self, name, **data):
+        return self.client.post(reverse(f'chatbot:{name}'), json.dumps(data), content_type='application/json')
+
+    def test_chat_api_does_not_log_fallback_answer(self, qa_log_buffer):
+        response = self.post('chat_api', message='몇 명이 해요?', chat_type='gpt_rules', game_name='카탄', session_id='s')
+        self.assertIn('AI 서버 연결 불가', response.json()['response'])
+        qa_log_buffer.add.assert_not_called()
+
+    def test_chat_api_does_not_log_error_answer(self, qa_log_buffer):
+        with mock.patch.object(views.rule_explanation_service, 'use_fallback', False):
+            response = self.post('chat_api', message='q', chat_type='finetuning_rules', game_name='카탄', session_id='s')
+        self.assertIn('일시적인 문제가 발생했습니다', response.json()['response'])
+        qa_log_buffer.add.assert_not_called()
+
+    def test_chat_api_does_not_log_unsupported_game(self, qa_log_buffer):
+        self.post('chat_api', message='q', chat_type='gpt_rules', game_name='없는 게임', session_id='s')
+        qa_log_buffer.add.assert_not_called()
+
+    def test_chat_api_logs_backend_answer(self, qa_log_buffer):
+        self.client_patch.stop()
+        with mock.patch.object(
+            views.rule_explanation_service.runpod_client, 'async_explain_rules',
+            mock.AsyncMock(return_value={'response': '3~4명입니다.', 'session_id': 's', 'session_type': 'gpt', 'stateless': True})
+        ):
+            self.post('chat_api', message='몇 명이 해요?', chat_type='gpt_rules', game_name='카탄', session_id='s')
+        self.client_patch.start()
+        qa_log_buffer.add.assert_called_once_with(
+            GPTRuleQA, game_name='카탄', question='몇 명이 해요?', answer='3~4명입니다.', stateless=True
+        )
+
+    async def test_chat_stream_logs_backend_answer_with_stateless_flag(self, qa_log_buffer):
+        async def backend_stream(*args, **kwargs):
+            yield 'session', {'session_id': 's'}
+            yield 'token', {'text': '그 다음은 '}
+            yield 'token', {'text': '건설 단계입니다.'}
+            yield 'done', {'session_id': 's', 'stateless': False}
+
+        with mock.patch.object(views.rule_explanation_service.runpod_client, 'async_stream_explain_rules', backend_stream):
+            response = await self.async_client.post(
+                reverse('chatbot:chat_stream_api'),
+                json.dumps({'message': '그럼 그 다음은?', 'chat_type': 'finetuning_rules', 'game_name': '카탄', 'session_id': 's'}),
+                content_type='application/json'
+            )
+            [chunk async for chunk in response]
+        qa_log_buffer.add.assert_called_once_with(
+            FinetuningRuleQA, game_name='카탄', question='그럼 그 다음은?', answer='그 다음은 건설 단계입니다.', stateless=False
+        )
+
+    async def test_chat_stream_does_not_log_fallback_answer(self, qa_log_buffer):
+        response = await self.async_client.post(
+            reverse('chatbot:chat_stream_api'),
+            json.dumps({'message': 'q', 'chat_type': 'gpt_rules', 'game_name': '카탄', 'session_id': 's'}),
+            content_type='application/json'
+        )
+        body = ''.join([chunk.decode() if isinstance(chunk, bytes) else chunk async for chunk in response])
+        self.assertIn('AI 서버 연결 불가', body)
+        self.assertIn('event: done', body)
+        qa_log_buffer.add.assert_not_called()
+
+
+class ExportQACacheTests(TestCase):
+    """의미 캐시 워밍 파일 내보내기"""
+
+    def collect(self, model=GPTRuleQA, source=ArchivedRuleQA.SOURCE_GPT):
+        return ExportQACacheCommand()._collect(model, source, per_game=50, min_count=1)
+
+    def test_collect_skips_fallback_and_error_answers(self):
+        GPTRuleQA.objects.create(game_name='카탄', question='몇 명?', answer='🤖 기본 답변 (AI 서버 연결 불가):\n\n2-4명', stateless=True)
+        GPTRuleQA.objects.create(game_name='카탄', question='시간?', answer='룰 질문 답변 서비스에 일시적인 문제가 발생했습니다: timeout', stateless=True)
+        GPTRuleQA.objects.create(game_name='카탄', question='승리 조건?', answer='10점을 먼저 얻으면 승리합니다.', stateless=True)
+
+        self.assertEqual([entry['q'] for entry in self.collect()['카탄']], ['승리 조건?'])
+
+    def test_collect_only_exports_answers_without_history(self):
+        GPTRuleQA.objects.create(game_name='카탄', question='승리 조건?', answer='10점', stateless=True)
+        GPTRuleQA.objects.create(game_name='카탄', question='그럼 그 다음은?', answer='건설 단계', stateless=False)
+        GPTRuleQA.objects.create(game_name='카탄', question='그럼 그 다음은?', answer='건설 단계', stateless=False)
+        ArchivedRuleQA.objects.create(
+            source=ArchivedRuleQA.SOURCE_GPT, original_id=1, game_name='뱅', question='보안관은?',
+            answer='보안관 설명', stateless=True, created_at=timezone.now()
+        )
+        ArchivedRuleQA.objects.create(
+            source=ArchivedRuleQA.SOURCE_GPT, original_id=2, game_name='뱅', question='그건 왜요?',
+            answer='이전 답변 설명', created_at=timezone.now()
+        )
+
+        games = self.collect()
+        self.assertEqual({game: [entry['q'] for entry in entries] for game, entries in games.items()},
+                         {'카탄': ['승리 조건?'], '뱅': ['보안관은?']})
+
+    def test_archive_batch_keeps_stateless_flag(self):
+        row = FinetuningRuleQA.objects.create(game_name='카탄', question='q', answer='a', stateless=True)
+        ArchivedRuleQA.archive_batch(ArchivedRuleQA.SOURCE_FINETUNING, timezone.now() + timedelta(seconds=1))
+        self.assertTrue(ArchivedRuleQA.objects.get(original_id=row.id).stateless)
+        self.assertEqual(list(self.collect(FinetuningRuleQA, ArchivedRuleQA.SOURCE_FINETUNING)), ['카탄'])
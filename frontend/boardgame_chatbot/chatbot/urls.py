@@ -10,8 +10,11 @@ urlpatterns = [
     path('finetuning-rules/', views.finetuning_rules, name='finetuning_rules'),
     path('mobile/<str:chat_type>/', views.mobile_chat, name='mobile_chat'),
     path('api/chat/', views.chat_api, name='chat_api'),
+    path('api/chat/stream/', views.chat_stream_api, name='chat_stream_api'),  # 룰 질문 스트리밍 API
     path('api/rule-summary/', views.rule_summary_api, name='rule_summary_api'),
+    path('api/create-session/', views.create_session_api, name='create_session'),  # 세션 발급 API
     path('api/close-session/', views.close_session_api, name='close_session'),  # 세션 종료 API
     path('api/qr/<str:chat_type>/', views.generate_qr, name='generate_qr'),
     path('qa-stats/', views.qa_stats, name='qa_stats'),  # QA 통계 페이지
+    path('api/runpod-stats/', views.runpod_stats_api, name='runpod_stats'),  # Runpod 연결 풀 통계 API
 ]
@@ -1,15 +1,16 @@
 from django.shortcuts import render
-from django.http import JsonResponse, HttpResponse
-from django.views.decorators.csrf import csrf_exempt
+from django.http import JsonResponse, HttpResponse, StreamingHttpResponse
 from django.urls import reverse
+from django.db.models import Count
 import json
 import qrcode
 import io
 import logging
 import requests
-from .models import GPTRuleQA, FinetuningRuleQA, get_combined_game_rankings
+from .models import GPTRuleQA, FinetuningRuleQA, ArchivedRuleQA, get_combined_game_rankings
 from .services.game_recommendation import GameRecommendationService
 from .services.rule_explanation import RuleExplanationService
+from .services.qa_log_buffer import qa_log_buffer
 
 logger = logging.getLogger(__name__)
 
@@ -18,6 +19,12 @@ game_recommendation_service = GameRecommendationService()
 rule_explanation_service = RuleExplanationService()
 
 
+def async_csrf_exempt(view_func):
+    """비동기 뷰용 csrf_exempt (Django 4.2의 csrf_exempt는 비동기 뷰를 동기 함수로 감쌈)"""
+    view_func.csrf_exempt = True
+    return view_func
+
+
 
 def home(request):
     """홈페이지"""
@@ -76,9 +83,9 @@ def mobile_chat(request, chat_type):
     }
     return render(request, 'chatbot/mobile_chat.html', context)
 
-@csrf_exempt
-def chat_api(request):
-    """🔥 핵심: 채팅 API - Runpod 백엔드 연동"""
+@async_csrf_exempt
+async def chat_api(request):
+    """🔥 핵심: 채팅 API - Runpod 백엔드 연동 (비동기 뷰, 백엔드 응답 대기 중 워커를 점유하지 않음)"""
     if request.method == 'POST':
         try:
             data = json.loads(request.body)
@@ -89,29 +96,12 @@ def chat_api(request):
             
             logger.info(f"💬 채팅 요청: {chat_type} - {message} (세션: {session_id})")
             
-            # 세션 초기화 더미 요청 처리
+            # 구버전 페이지의 세션 초기화 요청 (세션 발급 API로 처리, LLM 호출 없음)
             if message == '__INIT_SESSION__':
-                logger.info(f"🚀 세션 초기화 요청")
-                # 빈 session_id로 더미 요청을 보내서 세션 ID만 받아오기
-                result = game_recommendation_service.recommend_games("initialize", session_id)
-                
-                if isinstance(result, dict):
-                    response_data = {
-                        'response': "세션이 초기화되었습니다.",  # 더미 메시지
-                        'session_id': result.get('session_id', session_id)
-                    }
-                else:
-                    response_data = {
-                        'response': "세션이 초기화되었습니다.",
-                        'session_id': session_id
-                    }
-                    
-                logger.info(f"✅ 세션 초기화 완료: {response_data.get('session_id')}")
-                
-                # 세션 초기화 응답 바로 리턴
+                session_id = await _create_session(chat_type)
                 return JsonResponse({
-                    'response': response_data.get('response'),
-                    'session_id': response_data.get('session_id'),
+                    'response': "세션이 초기화되었습니다.",
+                    'session_id': session_id,
                     'status': 'success'
                 })
             
@@ -120,7 +110,7 @@ def chat_api(request):
             
             if chat_type == 'game_recommendation':
                 # 게임 추천 서비스 호출
-                result = game_recommendation_service.recommend_games(message, session_id)
+                result = await game_recommendation_service.async_recommend_games(message, session_id)
                 logger.info(f"🔍 게임 추천 서비스 반환 데이터: {result}")
                 
                 # RunPod 클라이언트에서 딕셔너리 형태로 반환하는 경우
@@ -147,18 +137,21 @@ def chat_api(request):
                 else:
                     # 파인튜닝 타입 매핑
                     api_chat_type = "finetuning" if chat_type == 'finetuning_rules' else "gpt"
-                    result = rule_explanation_service.answer_rule_question(
+                    result = await rule_explanation_service.async_answer_rule_question(
                         game_name, message, api_chat_type, session_id
                     )
                     logger.info(f"🔍 룰 설명 서비스 반환 데이터: {result}")
                     
                     # 서비스에서 딕셔너리 형태로 반환하는 경우
+                    is_fallback = stateless = False
                     if isinstance(result, dict):
                         response_data = {
                             'response': result.get('response', ''),
                             'session_id': result.get('session_id', session_id)
                         }
                         response_text = result.get('response', '')
+                        is_fallback = result.get('is_fallback', False)
+                        stateless = result.get('stateless', False)
                     else:
                         # 문자열로 반환하는 경우 (하위 호환성)
                         response_data = {
@@ -168,25 +161,9 @@ def chat_api(request):
                         response_text = result
                         logger.warning(f"⚠️ 룰 설명 서비스가 문자열로 반환함: {type(result)}")
                     
-                    # 🔥 핵심: 질문과 답변을 QA DB에 자동 저장!
-                    try:
-                        if chat_type == 'gpt_rules':
-                            GPTRuleQA.objects.create(
-                                game_name=game_name,
-                                question=message,
-                                answer=response_text
-                            )
-                            logger.info(f"✅ GPT QA 저장: {game_name} - {message[:30]}...")
-                            
-                        elif chat_type == 'finetuning_rules':
-                            FinetuningRuleQA.objects.create(
-                                game_name=game_name,
-                                question=message,
-                                answer=response_text
-                            )
-                            logger.info(f"✅ 파인튜닝 QA 저장: {game_name} - {message[:30]}...")
-                    except Exception as e:
-                        logger.error(f"❌ QA 저장 실패: {str(e)}")
+                    # 🔥 핵심: 질문과 답변을 QA DB에 자동 저장! (폴백/오류 응답은 제외)
+                    if not is_fallback:
+                        _save_rule_qa(chat_type, game_name, message, response_text, stateless)
             else:
                 response_data = {'response': "알 수 없는 채팅 타입입니다."}
             
@@ -217,9 +194,113 @@ def chat_api(request):
     
     return JsonResponse({'error': 'POST method required'}, status=405)
 
-@csrf_exempt
-def close_session_api(request):
-    """세션 종료 API"""
+async def _create_session(chat_type):
+    """채팅 타입에 맞는 백엔드 세션 발급"""
+    if chat_type == 'game_recommendation':
+        return await game_recommendation_service.async_create_session('recommendation')
+    session_type = 'finetuning' if chat_type == 'finetuning_rules' else 'gpt'
+    return await rule_explanation_service.async_create_session(session_type)
+
+@async_csrf_exempt
+async def create_session_api(request):
+    """세션 발급 API - 페이지 로드 시 세션 ID만 받아옴 (LLM 호출 없음)"""
+    if request.method != 'POST':
+        return JsonResponse({'error': 'POST method required'}, status=405)
+    
+    try:
+        data = json.loads(request.body) if request.body else {}
+        chat_type = data.get('chat_type', '')
+        session_id = await _create_session(chat_type)
+        logger.info(f"🆕 세션 발급 완료: {session_id} ({chat_type})")
+        
+        return JsonResponse({
+            'session_id': session_id,
+            'status': 'success'
+        })
+        
+    except Exception as e:
+        logger.error(f"❌ 세션 발급 API 오류: {str(e)}")
+        return JsonResponse({
+            'error': str(e),
+            'status': 'error'
+        }, status=400)
+
+def _sse_event(event, data):
+    """SSE 이벤트 문자열 생성 (data는 JSON)"""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+def _save_rule_qa(chat_type, game_name, question, answer, stateless=False):
+    """룰 질문과 답변을 QA 로그 버퍼에 추가 (DB 저장은 백그라운드에서 일괄 처리)
+
+    stateless: 백엔드가 이전 대화 없이 답변했다고 알려준 경우 True (의미 캐시 워밍 대상)
+    """
+    if chat_type == 'gpt_rules':
+        model = GPTRuleQA
+    elif chat_type == 'finetuning_rules':
+        model = FinetuningRuleQA
+    else:
+        return
+    
+    if qa_log_buffer.add(model, game_name=game_name, question=question, answer=answer, stateless=stateless):
+        logger.info(f"📝 QA 저장 대기열 추가 ({model.__name__}): {game_name} - {question[:30]}...")
+
+@async_csrf_exempt
+async def chat_stream_api(request):
+    """룰 질문 스트리밍 API - Runpod 백엔드의 SSE 토큰을 그대로 브라우저로 전달
+
+    이벤트: session -> token (여러 번) -> done, 실패 시 error
+    답변이 끝까지 전달된(done) 경우에만 QA DB에 저장합니다 (폴백/오류 메시지는 제외).
+    """
+    if request.method != 'POST':
+        return JsonResponse({'error': 'POST method required'}, status=405)
+    
+    try:
+        data = json.loads(request.body)
+    except Exception as e:
+        return JsonResponse({'error': str(e), 'status': 'error'}, status=400)
+    
+    message = data.get('message', '')
+    chat_type = data.get('chat_type', '')
+    game_name = data.get('game_name', '')
+    session_id = data.get('session_id', '')
+    
+    if chat_type not in ['gpt_rules', 'finetuning_rules']:
+        return JsonResponse({'error': '스트리밍을 지원하지 않는 채팅 타입입니다.', 'status': 'error'}, status=400)
+    if not game_name:
+        return JsonResponse({'error': '게임을 먼저 선택해주세요.', 'status': 'error'}, status=400)
+    
+    logger.info(f"💬 스트리밍 채팅 요청: {chat_type} - {message} (세션: {session_id})")
+    api_chat_type = "finetuning" if chat_type == 'finetuning_rules' else "gpt"
+    
+    async def event_stream():
+        answer_parts = []
+        events = rule_explanation_service.async_stream_rule_question(game_name, message, api_chat_type, session_id)
+        try:
+            async for event, payload in events:
+                if event == 'token':
+                    answer_parts.append(payload.get('text', ''))
+                elif event == 'done' and not payload.get('is_fallback'):
+                    # done 전송 전에 저장 대기열에 추가 (전송 직후 연결이 끊겨도 저장되도록)
+                    _save_rule_qa(chat_type, game_name, message, ''.join(answer_parts), payload.get('stateless', False))
+                yield _sse_event(event, payload)
+                
+                if event == 'error':
+                    break
+        except Exception as e:
+            logger.error(f"❌ 스트리밍 채팅 API 오류: {str(e)}")
+            yield _sse_event('error', {'message': str(e)})
+        finally:
+            # 브라우저 연결이 끊기면 백엔드 스트림도 닫아 생성을 중단
+            await events.aclose()
+    
+    response = StreamingHttpResponse(event_stream(), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'
+    return response
+
+@async_csrf_exempt
+async def close_session_api(request):
+    """세션 종료 API (비동기 뷰)"""
     if request.method == 'POST':
         try:
             data = json.loads(request.body)
@@ -230,22 +311,15 @@ def close_session_api(request):
             
             logger.info(f"🗑️ 세션 종료 요청: {session_id}")
             
-            # 게임 추천 서비스에 세션 종료 요청
-            rec_success = game_recommendation_service.close_session(session_id)
-            
-            # 룰 설명 서비스에 세션 종료 요청
-            rule_success = rule_explanation_service.close_session(session_id)
-            
-            # 두 서비스 중 하나라도 성공하면 성공으로 처리
-            success = rec_success or rule_success
+            # 백엔드 /session/close가 추천/GPT/파인튜닝 세션을 한 번에 종료하므로 요청은 한 번만 보내고
+            # 백엔드가 돌려준 저장소별 종료 결과를 그대로 전달
+            result = await rule_explanation_service.runpod_client.async_close_session(session_id)
+            success = result.get('status') == 'success'
             
             return JsonResponse({
                 'status': 'success' if success else 'warning',
-                'message': f'세션 {session_id} 종료 완료' if success else f'세션 {session_id}를 찾을 수 없습니다.',
-                'details': {
-                    'recommendation_service': rec_success,
-                    'rule_service': rule_success
-                }
+                'message': result.get('message') or (f'세션 {session_id} 종료 완료' if success else f'세션 {session_id}를 찾을 수 없습니다.'),
+                'details': result.get('data') or {}
             })
             
         except Exception as e:
@@ -257,9 +331,9 @@ def close_session_api(request):
     
     return JsonResponse({'error': 'POST method required'}, status=405)
 
-@csrf_exempt
-def rule_summary_api(request):
-    """게임 룰 요약 API - Runpod 백엔드 연동"""
+@async_csrf_exempt
+async def rule_summary_api(request):
+    """게임 룰 요약 API - Runpod 백엔드 연동 (비동기 뷰)"""
     if request.method == 'POST':
         try:
             data = json.loads(request.body)
@@ -274,7 +348,7 @@ def rule_summary_api(request):
             
             # 파인튜닝 타입 매핑
             api_chat_type = "finetuning" if chat_type == 'finetuning_rules' else "gpt"
-            result = rule_explanation_service.explain_game_rules(game_name, api_chat_type, session_id)
+            result = await rule_explanation_service.async_explain_game_rules(game_name, api_chat_type, session_id)
             
             logger.info(f"🔍 룰 요약 서비스 반환 데이터: {result}")
             
@@ -368,9 +442,10 @@ def generate_qr(request, chat_type):
     return HttpResponse(buffer.getvalue(), content_type='image/png')
 
 def qa_stats(request):
-    """QA 데이터 통계"""
-    gpt_count = GPTRuleQA.objects.count()
-    ft_count = FinetuningRuleQA.objects.count()
+    """QA 데이터 통계 (보관된 QA 포함)"""
+    archived = dict(ArchivedRuleQA.objects.values_list('source').annotate(count=Count('id')))
+    gpt_count = GPTRuleQA.objects.count() + archived.get(ArchivedRuleQA.SOURCE_GPT, 0)
+    ft_count = FinetuningRuleQA.objects.count() + archived.get(ArchivedRuleQA.SOURCE_FINETUNING, 0)
     recent_gpt = GPTRuleQA.objects.all()[:10]
     recent_ft = FinetuningRuleQA.objects.all()[:10]
     
@@ -383,3 +458,11 @@ def qa_stats(request):
     }
     
     return render(request, 'chatbot/qa_stats.html', context)
+
+def runpod_stats_api(request):
+    """운영 통계 API (Runpod 연결 풀 재사용률, QA 로그 버퍼 대기/버림 수)"""
+    return JsonResponse({
+        'status': 'success',
+        'connection_pool': rule_explanation_service.runpod_client.get_connection_stats(),
+        'qa_log': qa_log_buffer.get_stats()
+    })
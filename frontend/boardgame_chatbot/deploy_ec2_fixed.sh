@@ -150,9 +150,10 @@ ExecStart=$PROJECT_DIR/venv/bin/gunicorn \\
     --access-logfile - \\
     --error-logfile - \\
     --workers 3 \\
+    --worker-class uvicorn.workers.UvicornWorker \\
     --bind unix:/run/gunicorn/boardgame_chatbot.sock \\
     --timeout 120 \\
-    boardgame_chatbot.wsgi:application
+    boardgame_chatbot.asgi:application
 ExecReload=/bin/kill -s HUP \$MAINPID
 Restart=on-failure
 KillMode=mixed